@@ -1,32 +1,139 @@
+import logging
+import signal
+import threading
+from functools import partial
+
 import typer
-from sqlmodel import Session
 
 from app.auth.init_admin import create_admin_user
-from app.commercialization.ingestor import CommercializationIngestor
-from app.core.database import engine
-from app.exportation.ingestor import ExportationIngestor
-from app.importation.ingestor import ImportationIngestor
-from app.processing.ingestor import ProcessingIngestor
-from app.production.ingestor import ProductionIngestor
+from app.core.config import settings
+from app.core.database import create_db_engine
+from app.ingestion.runner import (
+    IngestionReport,
+    load_manifest,
+    parse_sources,
+    run_ingestor,
+    run_ingestors,
+)
+from app.ingestion.scheduler import (
+    Schedule,
+    Scheduler,
+    SchedulerLocked,
+    instance_lock,
+    parse_intervals,
+    refresh_source,
+)
 
 app = typer.Typer()
 
 
 @app.command()
-def run(source: str):
-    with Session(engine) as session:
-        if source == "production":
-            ProductionIngestor().ingest(session)
-        elif source == "commercialization":
-            CommercializationIngestor().ingest(session)
-        elif source == "processing":
-            ProcessingIngestor().ingest(session)
-        elif source == "importation":
-            ImportationIngestor().ingest(session)
-        elif source == "exportation":
-            ExportationIngestor().ingest(session)
-        else:
-            print("Unsupported source: {source}")
+def run(
+    source: str = typer.Argument(
+        ..., help="Domain to ingest, a comma-separated list of domains or 'all'"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Reload every file, even if unchanged upstream"
+    ),
+    replace: bool = typer.Option(
+        False,
+        "--replace",
+        help="Rebuild each table from scratch and swap it in atomically",
+    ),
+):
+    """Ingest one or more domains, in parallel worker processes"""
+    try:
+        sources = parse_sources(source)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="SOURCE")
+
+    reports = run_ingestors(sources, force=force, replace=replace)
+    _print_reports(reports)
+
+
+@app.command()
+def replay(
+    manifest_id: str = typer.Argument(
+        ..., help="Manifest of the run to replay, from the source archive"
+    ),
+):
+    """Rebuild a domain from the archived source files of a past run, offline"""
+    try:
+        source, _ = load_manifest(manifest_id)
+    except (OSError, ValueError) as e:
+        raise typer.BadParameter(str(e), param_hint="MANIFEST_ID")
+
+    _print_reports([run_ingestor(source, manifest_id=manifest_id)])
+
+
+@app.command()
+def daemon(
+    source: str = typer.Argument(
+        "all", help="Domain to refresh, a comma-separated list of domains or 'all'"
+    ),
+    once: bool = typer.Option(
+        False, "--once", help="Refresh every domain once, then exit"
+    ),
+):
+    """Refresh domains periodically, one at a time, until stopped"""
+    try:
+        sources = parse_sources(source)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="SOURCE")
+    try:
+        intervals = parse_intervals(settings.SCHEDULE_INTERVALS)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="SCHEDULE_INTERVALS")
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    engine = create_db_engine()
+    scheduler = Scheduler(
+        [
+            Schedule(name, intervals.get(name, settings.SCHEDULE_INTERVAL))
+            for name in sources
+        ],
+        refresh=partial(refresh_source, engine),
+    )
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    try:
+        with instance_lock(engine):
+            if once:
+                scheduler.run_pending()
+            else:
+                scheduler.run(stop)
+    except SchedulerLocked as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=1)
+    finally:
+        engine.dispose()
+
+
+def _print_reports(reports: list[IngestionReport]) -> None:
+    typer.echo(
+        f"{'domain':<20}{'status':<8}{'rows':>10}{'seconds':>10}{'rows/sec':>12}"
+    )
+    for report in reports:
+        status = "failed" if report.error else "ok"
+        typer.echo(
+            f"{report.source:<20}{status:<8}{report.rows:>10}"
+            f"{report.seconds:>10.2f}{report.rows_per_second:>12,.0f}"
+        )
+
+    for report in reports:
+        if report.manifest:
+            typer.echo(f"{report.source}: manifest {report.manifest}")
+
+    failed = [report for report in reports if report.error]
+    for report in failed:
+        typer.echo(f"{report.source}: {report.error}", err=True)
+    if failed:
+        raise typer.Exit(code=1)
 
 
 @app.command()
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from sqlmodel import Session, delete, func, select
+from sqlmodel import Session, func, select
 
+from app.core.pagination import fetch_page, fetch_page_with_total
 from app.commercialization.models import Commercialization, CommercializationCreate
 
+# Listing order, ending with the primary key so cursors are unique
+ORDER_BY = (
+    Commercialization.year.desc(),
+    Commercialization.product,
+    Commercialization.id,
+)
+
 
 def create_commercialization(
     session: Session, data: CommercializationCreate
@@ -30,22 +38,25 @@ def count_commercializations(session: Session) -> int:
 
 
 def list_commercializations(
-    session: Session, limit: int = None, offset: int = None
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
 ) -> Sequence[Commercialization]:
     """
     Retrieve all commercialization records from the database.
     """
-    statement = select(Commercialization).order_by(
-        Commercialization.year.desc(), Commercialization.product
-    )
+    statement = select(Commercialization)
+
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
 
-    result = session.execute(statement)
-    return result.scalars().all()
+def list_commercializations_with_total(
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
+) -> tuple[Sequence[Commercialization], int]:
+    """
+    Retrieve a page of commercialization records and their total, in one query.
+    """
+    statement = select(Commercialization)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def get_by_year_and_product(
@@ -58,11 +69,3 @@ def get_by_year_and_product(
         (Commercialization.year == year) & (Commercialization.product == product)
     )
     return session.exec(statement).first()
-
-
-def clear_commercialization(session: Session) -> None:
-    """
-    Remove todos os registros da tabela commercialization.
-    """
-    session.exec(delete(Commercialization))
-    session.commit()
@@ -1,14 +1,28 @@
+import logging
+
 import pandas as pd
 from sqlmodel import Session
 
-from app.commercialization.crud import create_commercialization, get_by_year_and_product
-from app.commercialization.models import CommercializationCreate
-from app.core.base_ingestor import EmbrapaBaseIngestor
+from app.commercialization.models import Commercialization, CommercializationCreate
+from app.core.base_ingestor import EmbrapaBaseIngestor, LoadResult
+from app.core.parsing import to_number
+
+logger = logging.getLogger(__name__)
 
 
 class CommercializationIngestor(EmbrapaBaseIngestor):
     CSV_PATH = "download/Comercio.csv"
 
+    MODEL = Commercialization
+    CREATE_MODEL = CommercializationCreate
+    NATURAL_KEY = ("year", "product")
+    COLUMNS = {
+        "ano": "year",
+        "Produto": "product",
+        "quantidade_litros": "quantity_liters",
+    }
+    RANGES = {**EmbrapaBaseIngestor.RANGES, "quantity_liters": (0, None)}
+
     def reshape(self, df: pd.DataFrame) -> pd.DataFrame:
         id_vars = ["Produto"]
         value_vars = [col for col in df.columns if col.isdigit()]
@@ -18,37 +32,40 @@ class CommercializationIngestor(EmbrapaBaseIngestor):
             var_name="ano",
             value_name="quantidade_litros",
         )
-        print(f"Transformed shape: {melted.shape}")
+        logger.info(f"Transformed shape: {melted.shape}")
         return melted
 
-    def ingest(self, session: Session):
-        df = self.fetch_csv()
-        melted = self.reshape(df)
-
-        n_inserts = 0
-        n_skipped = 0
-
-        for idx, row in melted.iterrows():
-            try:
-                year = int(row["ano"])
-                product = row["Produto"]
-
-                if get_by_year_and_product(session, year, product):
-                    print(f"Skipping duplicate: {year} - {product}")
-                    n_skipped += 1
-                    continue
-
-                data = CommercializationCreate(
-                    year=year,
-                    product=product,
-                    quantity_liters=float(
-                        str(row["quantidade_litros"]).replace(",", ".")
-                    ),
-                )
-                create_commercialization(session, data)
-                n_inserts += 1
-
-            except (ValueError, KeyError, TypeError) as e:
-                print(f"Error on row {idx} — data: {row.to_dict()} — {e}")
-
-        print(f"Ingestion completed: {n_inserts} inserted, {n_skipped} skipped.")
+    def ingest(self, session: Session) -> LoadResult:
+        result = LoadResult()
+
+        try:
+            for path, df in self.fetch_frames(session, [self.CSV_PATH]):
+                # Unparseable quantities are kept as NaN by transform() and
+                # quarantined by bulk_load, also for frames from the cache
+                result += self.bulk_load(session, df, update=True, source=path)
+
+            self.commit(session)
+        except Exception:
+            self.rollback(session)
+            raise
+
+        logger.info(f"Commercialization ingestion complete: {self.summary(result)}.")
+        return result
+
+    def transform(self, df: pd.DataFrame, path: str) -> pd.DataFrame:
+        return self._clean(self.reshape(df))
+
+    def _clean(self, melted: pd.DataFrame) -> pd.DataFrame:
+        raw = melted["quantidade_litros"]
+        melted["ano"] = melted["ano"].astype(int)
+        melted["quantidade_litros"] = to_number(raw, errors="coerce")
+
+        # Unparseable values are logged and left as NaN, missing ones are dropped
+        invalid = melted["quantidade_litros"].isna() & raw.notna()
+        for idx in melted.index[invalid]:
+            logger.warning(
+                f"Error on row {idx} — product: {melted.at[idx, 'Produto']}, "
+                f"value: {raw[idx]!r}"
+            )
+
+        return melted[raw.notna()]
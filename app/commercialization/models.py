@@ -1,5 +1,6 @@
 from typing import Optional
 
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field, SQLModel
 
 
@@ -14,6 +15,12 @@ class CommercializationBase(SQLModel):
 class Commercialization(CommercializationBase, table=True):
     """Database model representing the commercialization table."""
 
+    __table_args__ = (
+        UniqueConstraint("year", "product", name="uq_commercialization_natural_key"),
+        # Match the listing order (crud.ORDER_BY) for cursor pagination
+        Index("ix_commercialization_listing", text("year DESC"), "product", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
 
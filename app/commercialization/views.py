@@ -4,49 +4,75 @@ from sqlmodel import Session
 from app.auth.dependencies import get_current_active_user, get_current_superuser
 from app.auth.models import User
 from app.commercialization.crud import (
-    clear_commercialization,
+    ORDER_BY,
     count_commercializations,
     list_commercializations,
+    list_commercializations_with_total,
 )
-from app.commercialization.ingestor import CommercializationIngestor
-from app.commercialization.models import CommercializationRead
+from app.commercialization.models import Commercialization, CommercializationRead
 from app.core.config import settings
 from app.core.database import get_session
+from app.core.counts import counts
 from app.core.pagination import PaginatedResponse
+from app.core.response_cache import cached_response
+from app.jobs.models import IngestionJobRead
+from app.jobs.worker import enqueue_reingest
 
 router = APIRouter()
 
 
 @router.get("/", response_model=PaginatedResponse[CommercializationRead])
+@cached_response(Commercialization)
 async def read_all(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, read instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching rows, false to skip total"
+    ),
 ):
     """
     Endpoint to list all commercialization records with pagination.
     """
-    offset = (page - 1) * per_page
+    offset = None if cursor else (page - 1) * per_page
 
-    # Get total count
-    total = count_commercializations(session)
+    # Get total count, cached per dataset version
+    total = (
+        counts.get(session, Commercialization, count_commercializations)
+        if include_total
+        else None
+    )
 
-    # Get paginated data
-    data = list_commercializations(session, per_page, offset)
+    # Get paginated data, counted in the same query if not cached
+    if include_total and total is None:
+        data, total = list_commercializations_with_total(
+            session, per_page + 1, offset, cursor
+        )
+        counts.put(session, Commercialization, count_commercializations, total=total)
+    else:
+        data = list_commercializations(session, per_page + 1, offset, cursor)
 
-    return PaginatedResponse.create(
-        data=data, total=total, page=page, per_page=per_page
+    return PaginatedResponse.from_rows(
+        data, total, page, per_page, order_by=ORDER_BY, cursor=cursor
     )
 
 
-@router.post("/reingest")
-async def reingest(
+@router.post(
+    "/reingest",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=IngestionJobRead,
+)
+def reingest(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_superuser),
 ):
     """
-    Endpoint to force re-ingestion of commercialization data from source files.
+    Endpoint to queue a re-ingestion of commercialization data from source files.
+    Returns the job at once, poll /api/v1/jobs/{id} for its progress.
     Requires superuser authentication and ALLOW_REINGEST=true in environment.
     """
     if not settings.ALLOW_REINGEST:
@@ -54,6 +80,5 @@ async def reingest(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Reingestion is not allowed in this environment.",
         )
-    clear_commercialization(session)
-    CommercializationIngestor().ingest(session=session)
-    return {"detail": "Reingestion completed successfully"}
+    job = enqueue_reingest(session, "commercialization")
+    return IngestionJobRead.from_job(job)
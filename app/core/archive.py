@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import shutil
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    """
+    A source file as an ingest run saw it.
+    """
+
+    path: str
+    sha256: str
+    size: int
+    url: str | None = None  # None when read from local disk or the archive
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class Manifest:
+    """
+    The exact source files of one ingest run, by content hash.
+    """
+
+    id: str
+    ingestor: str  # class name of the ingestor that ran
+    created_at: str
+    files: list[ManifestEntry] = field(default_factory=list)
+
+    @classmethod
+    def new(cls, ingestor: str, files: list[ManifestEntry]) -> "Manifest":
+        now = datetime.now(timezone.utc)
+        return cls(
+            id=f"{ingestor}-{now:%Y%m%dT%H%M%S%fZ}",
+            ingestor=ingestor,
+            created_at=now.isoformat(),
+            files=files,
+        )
+
+    def entry(self, path: str) -> ManifestEntry | None:
+        return next((entry for entry in self.files if entry.path == path), None)
+
+
+class SourceArchive:
+    """
+    Content-addressed archive of every source file ever ingested, with a
+    manifest per ingest run.
+
+    Bodies are stored once per content hash under objects/, so unchanged
+    files cost nothing to archive again, and manifests/ maps each run to the
+    hashes it loaded. Copying the folder is enough to replay any run on
+    another machine without contacting Embrapa.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = root or settings.ARCHIVE_DIR
+
+    def file(self, sha256: str) -> str:
+        """
+        Location of the archived body with the given hash.
+        """
+        return os.path.join(self.root, "objects", sha256[:2], sha256)
+
+    def store(self, source: str, sha256: str) -> str:
+        """
+        Archive a local file under its content hash, unless already there.
+        """
+        target = self.file(sha256)
+        if os.path.exists(target):
+            return target
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(source, f"{target}.tmp")
+        os.replace(f"{target}.tmp", target)
+        return target
+
+    def save_manifest(self, manifest: Manifest) -> None:
+        folder = os.path.join(self.root, "manifests")
+        os.makedirs(folder, exist_ok=True)
+        target = os.path.join(folder, f"{manifest.id}.json")
+        with open(f"{target}.tmp", "w", encoding="utf-8") as f:
+            json.dump(asdict(manifest), f, indent=2)
+        os.replace(f"{target}.tmp", target)
+        logger.info(f"Saved manifest {manifest.id} ({len(manifest.files)} files)")
+
+    def load_manifest(self, manifest_id: str) -> Manifest:
+        """
+        Read a manifest by id. Raises FileNotFoundError if it does not exist.
+        """
+        path = os.path.join(self.root, "manifests", f"{manifest_id}.json")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        files = [ManifestEntry(**entry) for entry in data.pop("files")]
+        return Manifest(**data, files=files)
@@ -1,14 +1,91 @@
 import abc
 import logging
 import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from io import StringIO
+from typing import Callable, Iterator
 
-import httpx
 import pandas as pd
+from sqlalchemy import Column, MetaData, Table, delete, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, SQLModel
+
+from app.core.archive import Manifest, ManifestEntry, SourceArchive
+from app.core.config import settings
+from app.core.datasets import dataset_versions
+from app.core.download_cache import DownloadCache
+from app.core.fetcher import AsyncFetcher, FetchedFile, fetch_files
+from app.core.frame_cache import FrameCache
+from app.core.memory import peak_rss_mb
+from app.core.parsing import READ_CSV_OPTIONS, read_csv
+from app.core.pipeline import Pipeline
+from app.core.validation import FrameValidator, Range
+from app.ingestion.crud import (
+    bump_dataset_version,
+    get_ingestion_state,
+    quarantine_rows,
+    save_ingestion_state,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class LoadResult:
+    """
+    Counters reported by a bulk load.
+    """
+
+    inserted: int = 0
+    skipped: int = 0
+    errors: int = 0
+    peak_rss_mb: float = 0.0  # process peak memory when the load finished
+
+    def __add__(self, other: "LoadResult") -> "LoadResult":
+        return LoadResult(
+            inserted=self.inserted + other.inserted,
+            skipped=self.skipped + other.skipped,
+            errors=self.errors + other.errors,
+            peak_rss_mb=max(self.peak_rss_mb, other.peak_rss_mb),
+        )
+
+
+STAGES = ("fetch", "parse", "transform", "load", "commit")
+
+
+@dataclass
+class IngestionMetrics:
+    """
+    Seconds spent in each ingest stage and volume counters, accumulated
+    over the lifetime of an ingestor.
+
+    Downloads run in a background thread, so the fetch stage counts the
+    time spent waiting for files (and hashing them), not the transfer time.
+    With the pipeline on, fetching, parsing and transforming overlap with
+    loading, so the stage seconds can add up to more than the run took;
+    utilization tells which pipeline stage was the bottleneck.
+    """
+
+    seconds: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(STAGES, 0.0)
+    )
+    bytes_downloaded: int = 0
+    files_loaded: int = 0
+    files_skipped: int = 0  # not modified upstream or unchanged content
+    utilization: dict[str, float] = field(default_factory=dict)  # busy share
+
+    def summary(self) -> str:
+        summary = ", ".join(f"{stage} {self.seconds[stage]:.2f}s" for stage in STAGES)
+        if self.utilization:
+            busy = ", ".join(
+                f"{stage} {share:.0%}" for stage, share in self.utilization.items()
+            )
+            summary += f"; utilization {busy}"
+        return summary
+
+
 class EmbrapaBaseIngestor(abc.ABC):
     """
     Base class for ingesting Embrapa CSV data.
@@ -16,37 +93,617 @@ class EmbrapaBaseIngestor(abc.ABC):
 
     BASE_URL = os.getenv("EMBRAPA_BASE_URL", "http://vitibrasil.cnpuv.embrapa.br")
     CSV_PATH: str  # should be defined in subclasses
+    SEPARATOR = ";"
+
+    # Bulk load configuration, should be defined in subclasses
+    MODEL: type[SQLModel]  # table model the ingestor writes to
+    CREATE_MODEL: type[SQLModel]  # model used to validate each record
+    NATURAL_KEY: tuple[str, ...]  # columns identifying a unique record
+    COLUMNS: dict[str, str] = {}  # transformed column -> model field
+    RANGES: dict[str, Range] = {"year": (1900, 2100)}  # valid model field values
+
+    BATCH_SIZE = settings.INGEST_BATCH_SIZE
+    CHUNK_SIZE = settings.INGEST_CHUNK_SIZE  # source cells parsed per chunk
+    USE_COPY = settings.INGEST_USE_COPY  # COPY fast path on PostgreSQL
+    CSV_ENGINE = settings.INGEST_CSV_ENGINE  # pandas read_csv engine: c or pyarrow
+    USE_FRAME_CACHE = settings.INGEST_FRAME_CACHE  # reuse transformed frames
+    ARCHIVE = settings.INGEST_ARCHIVE  # archive source files with a run manifest
+    TRANSFORM_VERSION = 1  # bump when transform() changes, to skip stale frames
+    PIPELINE = settings.INGEST_PIPELINE  # overlap fetch, transform and load
+
+    def __init__(
+        self,
+        force: bool = False,
+        progress: Callable[[str, int], None] = None,
+        replace: bool = False,
+        manifest: Manifest = None,
+    ):
+        # A replay rebuilds the table from the archived files of a past run
+        replace = replace or manifest is not None
+        # Replacing rebuilds the whole table, so every file must be loaded
+        self.force = force or replace  # reload every file, even if unchanged
+        self.progress = progress  # called with (stage, rows processed so far)
+        self.replace = replace  # swap the loaded data in for the existing rows
+        self.manifest = manifest  # replay these archived files, offline
+        self.manifest_id: str | None = None  # manifest saved by the last commit
+        self.download_cache = DownloadCache()
+        self.frame_cache = FrameCache()
+        self.archive = SourceArchive()
+        self._sources: list[FetchedFile] = []  # every file seen, for the manifest
+        self._pending: list[FetchedFile] = []
+        self._row_counts: dict[str, int] = {}
+        self._rows_processed = 0
+        self._rows_written = 0  # since the last commit
+        self._shadow: Table | None = None
+        self.validator = FrameValidator(self.CREATE_MODEL, self.RANGES)
+        self.metrics = IngestionMetrics()
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """
+        Add the time spent in the block to the given stage.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.metrics.seconds[stage] += time.perf_counter() - started
+
+    def summary(self, result: LoadResult) -> str:
+        """
+        One-line description of a finished ingest, with its stage timings.
+        """
+        return (
+            f"{result.inserted} inserted, {result.skipped} skipped, "
+            f"{result.errors} errors, {self.metrics.bytes_downloaded} bytes "
+            f"downloaded, peak RSS {result.peak_rss_mb:.0f} MB "
+            f"({self.metrics.summary()})"
+        )
+
+    def report(self, stage: str) -> None:
+        """
+        Notify the progress callback, if any, of the current stage.
+        """
+        if self.progress:
+            self.progress(stage, self._rows_processed)
 
     def fetch_csv(self, url: str = None, separator: str = ";") -> pd.DataFrame:
         """
         Download CSV from EMBRAPA or load from local 'downloads' folder.
         Priority:
-        1. Load from self.CSV_PATH if it exists.
+        1. Load from the given path if it exists.
         2. Try to download from remote URL.
         """
-        if os.path.exists(self.CSV_PATH):
-            return self._load_csv(self.CSV_PATH, separator)
-
         path = url or self.CSV_PATH
-        full_url = f"{self.BASE_URL}/{path}"
+        fetched = next(fetch_files([path], self.fetcher(conditional=False)))
+        try:
+            return self._parse_csv(fetched, separator)
+        finally:
+            fetched.discard()
 
+    def fetch_csvs(
+        self, session: Session, paths: list[str]
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Download all paths concurrently and yield (path, DataFrame) pairs in
+        arrival order, so each file is parsed and loaded as soon as it lands.
+        Every file is read in chunks of about CHUNK_SIZE cells and yielded
+        once per chunk, so memory stays bounded however many year columns
+        the file has.
+        Files the server reports as not modified, or whose content hash
+        matches the last loaded version, are skipped unless forced.
+        """
+        files = self._fetch_changed(self._loaded_hashes(session, paths), paths)
+        self.report("fetching")
+        for fetched in files:
+            for chunk in self._parse(fetched):
+                yield fetched.path, chunk
+
+    def fetch_frames(
+        self, session: Session, paths: list[str]
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Like fetch_csvs, but yield transformed frames. Frames of a file
+        version transformed before are read from the frame cache, skipping
+        CSV parsing and reshaping; otherwise they are cached as they are
+        transformed, for the next reingest.
+
+        With PIPELINE, files are fetched and transformed in background
+        threads, at most INGEST_PIPELINE_QUEUE_SIZE items ahead of the
+        caller, so the next file downloads and parses while the caller
+        loads the frames of the current one.
+        """
+        files = self._fetch_changed(self._loaded_hashes(session, paths), paths)
+        self.report("fetching")
+        if not self.PIPELINE:
+            for fetched in files:
+                yield from self._frames(fetched)
+            return
+
+        pipeline = Pipeline("fetch", files).stage("transform", self._frames)
+        try:
+            yield from pipeline.run("load")
+        finally:
+            self.metrics.utilization = pipeline.utilization()
+
+    def _frames(self, fetched: FetchedFile) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Transformed frames of a fetched file, from the frame cache if there.
+        """
+        key = self._frame_key(fetched)
+        if self.USE_FRAME_CACHE and self.frame_cache.has(key):
+            logger.info(f"Reading {fetched.path} from the frame cache ({key})")
+            for frame in self._timed(self.frame_cache.read(key), "parse"):
+                yield fetched.path, frame
+            return
+
+        writer = self.frame_cache.writer(key) if self.USE_FRAME_CACHE else None
         try:
-            response = httpx.get(full_url, timeout=10.0, trust_env=False)
-            response.raise_for_status()
-            df = pd.read_csv(StringIO(response.text), sep=separator, encoding="utf-8")
-            logger.info(f"Downloaded CSV from {full_url} (shape={df.shape})")
-            return df
-        except Exception as e:
-            logger.warning(f"Failed to fetch {full_url}: {e}")
-            raise RuntimeError(f"Unable to download CSV from {full_url}")
-
-    def _load_csv(self, filepath: str, separator: str) -> pd.DataFrame:
-        df = pd.read_csv(filepath, sep=separator, encoding="utf-8")
-        logger.info(f"Loaded CSV from {filepath} (shape={df.shape})")
+            for chunk in self._parse(fetched):
+                with self.timed("transform"):
+                    frame = self.transform(chunk, fetched.path)
+                    if writer:
+                        writer.write(frame)
+                yield fetched.path, frame
+        except BaseException:
+            if writer:
+                writer.abort()
+            raise
+        if writer:
+            writer.commit()
+
+    @abc.abstractmethod
+    def transform(self, df: pd.DataFrame, path: str) -> pd.DataFrame:
+        """
+        Turn a parsed chunk of a source file into the long format bulk_load
+        expects. Must only depend on the chunk and its path, since its
+        output is cached by content hash (see TRANSFORM_VERSION).
+        """
+        raise NotImplementedError("Subclasses must implement the transform method.")
+
+    def _frame_key(self, fetched: FetchedFile) -> str:
+        name = os.path.splitext(os.path.basename(fetched.path))[0]
+        return (
+            f"{type(self).__name__}-v{self.TRANSFORM_VERSION}-{name}-"
+            f"{fetched.sha256}"
+        )
+
+    def _loaded_hashes(self, session: Session, paths: list[str]) -> dict[str, str]:
+        """
+        Content hash of the last loaded version of each path, if any.
+        """
+        states = (get_ingestion_state(session, path) for path in paths)
+        return {state.source: state.sha256 for state in states if state}
+
+    def _fetch_changed(
+        self, loaded: dict[str, str], paths: list[str]
+    ) -> Iterator[FetchedFile]:
+        """
+        Yield the fetched files that need loading, in arrival order, given
+        the hashes of the versions already loaded. Does not touch the
+        session, so it can run in a pipeline thread.
+        """
+        if self.manifest is not None:
+            files = self._archived_files(paths)
+        else:
+            files = fetch_files(paths, self.fetcher(loaded=loaded))
+        while True:
+            with self.timed("fetch"):
+                fetched = next(files, None)
+                if fetched is None:
+                    break
+                self._sources.append(fetched)
+                if fetched.temporary:
+                    self.metrics.bytes_downloaded += os.path.getsize(fetched.file)
+                if fetched.not_modified:
+                    logger.info(f"Skipping {fetched.path}: not modified upstream")
+                    self.metrics.files_skipped += 1
+                    continue
+
+                self._pending.append(fetched)
+
+                if not self.force and loaded.get(fetched.path) == fetched.sha256:
+                    logger.info(f"Skipping {fetched.path}: content hash unchanged")
+                    self.metrics.files_skipped += 1
+                    continue
+
+            self._row_counts[fetched.path] = 0
+            self.metrics.files_loaded += 1
+            yield fetched
+
+    def _archived_files(self, paths: list[str]) -> Iterator[FetchedFile]:
+        """
+        Archived copies of the replayed manifest's files, checked against
+        their recorded hashes.
+        """
+        for path in paths:
+            entry = self.manifest.entry(path)
+            if entry is None:
+                raise RuntimeError(f"Manifest {self.manifest.id} has no {path}")
+
+            fetched = FetchedFile(path=path, file=self.archive.file(entry.sha256))
+            if not os.path.exists(fetched.file):
+                raise RuntimeError(
+                    f"Archived copy of {path} is missing: {fetched.file}"
+                )
+            if fetched.sha256 != entry.sha256:
+                raise RuntimeError(
+                    f"Archived copy of {path} is corrupt: {fetched.file}"
+                )
+            yield fetched
+
+    def _parse(self, fetched: FetchedFile) -> Iterator[pd.DataFrame]:
+        chunks = self._parse_chunks(fetched, self.separator(fetched.path))
+        return self._timed(chunks, "parse")
+
+    def _timed(self, items: Iterator, stage: str) -> Iterator:
+        """
+        Yield from an iterator, adding the time spent producing each item
+        to the given stage.
+        """
+        while True:
+            with self.timed(stage):
+                item = next(items, None)
+            if item is None:
+                return
+            yield item
+
+    def fetcher(
+        self, conditional: bool = True, loaded: dict[str, str] = None
+    ) -> AsyncFetcher:
+        cache = self.download_cache if conditional and not self.force else None
+        return AsyncFetcher(self.BASE_URL, cache=cache, loaded=loaded)
+
+    def commit(self, session: Session) -> None:
+        """
+        Commit the ingest transaction together with the hash and row count
+        of every loaded file and, if rows changed, a new version of the
+        table, which invalidates the caches of the read endpoints. Then
+        remember their HTTP validators so the next run can send conditional
+        requests, and archive every source file with a manifest of the run.
+        """
+        self.report("committing")
+        with self.timed("commit"):
+            if self._shadow is not None:
+                self._swap_shadow(session)
+
+            for fetched in self._pending:
+                if fetched.path in self._row_counts:
+                    save_ingestion_state(
+                        session,
+                        fetched.path,
+                        sha256=fetched.sha256,
+                        row_count=self._row_counts[fetched.path],
+                    )
+
+            changed = self._rows_written > 0 or self._shadow is not None
+            if changed:
+                bump_dataset_version(session, self.MODEL.__tablename__)
+
+            session.commit()
+
+        if changed:
+            dataset_versions.invalidate()
+        for fetched in self._pending:
+            if fetched.url:
+                self.download_cache.store(
+                    fetched.path,
+                    fetched.file,
+                    etag=fetched.etag,
+                    last_modified=fetched.last_modified,
+                    sha256=fetched.sha256,
+                )
+        if self.ARCHIVE:
+            self._save_manifest()
+        self._discard_pending()
+
+    def rollback(self, session: Session) -> None:
+        """
+        Roll back the ingest transaction and forget the files it fetched.
+        """
+        session.rollback()
+        self._discard_pending()
+
+    def _save_manifest(self) -> None:
+        entries = []
+        for fetched in self._sources:
+            self.archive.store(fetched.file, fetched.sha256)
+            entries.append(
+                ManifestEntry(
+                    path=fetched.path,
+                    sha256=fetched.sha256,
+                    size=os.path.getsize(fetched.file),
+                    url=fetched.url,
+                    etag=fetched.etag,
+                    last_modified=fetched.last_modified,
+                )
+            )
+
+        manifest = Manifest.new(type(self).__name__, entries)
+        self.archive.save_manifest(manifest)
+        self.manifest_id = manifest.id
+
+    def _discard_pending(self) -> None:
+        for fetched in self._pending:
+            fetched.discard()
+        self._pending.clear()
+        self._sources.clear()
+        self._row_counts.clear()
+        self._rows_written = 0
+        self._shadow = None
+
+    def _target_table(self, session: Session) -> Table:
+        """
+        Table bulk loads write to: the model table, or in replace mode a
+        temporary shadow table created on first use.
+        """
+        if not self.replace:
+            return self.MODEL.__table__
+        if self._shadow is None:
+            self._shadow = self._create_shadow(session)
+        return self._shadow
+
+    def _create_shadow(self, session: Session) -> Table:
+        """
+        Create an empty temporary copy of the model table, keyed on
+        NATURAL_KEY. It only lives in the ingest transaction's connection
+        and takes its column types from the live table.
+        """
+        table = self.MODEL.__table__
+        columns = [column for column in table.columns if not column.primary_key]
+        shadow = Table(
+            f"{table.name}_shadow",
+            MetaData(),
+            *(Column(column.name, column.type) for column in columns),
+        )
+
+        names = ", ".join(column.name for column in columns)
+        connection = session.connection()
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {shadow.name}")
+        connection.exec_driver_sql(
+            f"CREATE TEMPORARY TABLE {shadow.name} AS "
+            f"SELECT {names} FROM {table.name} LIMIT 0"
+        )
+        connection.exec_driver_sql(
+            f"CREATE UNIQUE INDEX {shadow.name}_natural_key "
+            f"ON {shadow.name} ({', '.join(self.NATURAL_KEY)})"
+        )
+        return shadow
+
+    def _swap_shadow(self, session: Session) -> None:
+        """
+        Replace the model table rows with the shadow table contents in the
+        ingest transaction. Readers keep seeing the previous rows until the
+        commit and a failed ingest leaves them untouched. DELETE is used
+        rather than TRUNCATE, which would lock out readers and is not
+        MVCC-safe.
+        """
+        table = self.MODEL.__table__
+        columns = [column.name for column in self._shadow.columns]
+
+        self.report("swapping")
+        session.exec(delete(table))
+        session.exec(
+            table.insert().from_select(
+                columns, select(*(self._shadow.c[name] for name in columns))
+            )
+        )
+        session.connection().exec_driver_sql(f"DROP TABLE {self._shadow.name}")
+        logger.info(f"Swapped the reloaded rows into {table.name}")
+
+    def separator(self, path: str) -> str:
+        """
+        Field separator used by the given source file.
+        """
+        return self.SEPARATOR
+
+    def _parse_csv(self, fetched: FetchedFile, separator: str) -> pd.DataFrame:
+        df = read_csv(fetched.file, separator, self.CSV_ENGINE)
+        logger.info(f"Loaded CSV from {fetched.url or fetched.path} (shape={df.shape})")
         return df
 
+    def _parse_chunks(
+        self, fetched: FetchedFile, separator: str
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a file in chunks of about CHUNK_SIZE cells. The C engine
+        streams the file; the pyarrow reader has no chunked mode, so the
+        whole file is parsed at once and then split into chunks.
+        """
+        if self.CSV_ENGINE == "pyarrow":
+            df = self._parse_csv(fetched, separator)
+            rows = max(1, self.CHUNK_SIZE // max(1, len(df.columns)))
+            for start in range(0, len(df), rows):
+                yield df.iloc[start : start + rows].copy()
+            return
+
+        header = read_csv(fetched.file, separator, nrows=0)
+        rows = max(1, self.CHUNK_SIZE // max(1, len(header.columns)))
+
+        with pd.read_csv(
+            fetched.file,
+            sep=separator,
+            chunksize=rows,
+            memory_map=True,
+            **READ_CSV_OPTIONS,
+        ) as reader:
+            for chunk in reader:
+                logger.info(
+                    f"Loaded chunk from {fetched.url or fetched.path} "
+                    f"(shape={chunk.shape})"
+                )
+                yield chunk
+
+    def bulk_load(
+        self,
+        session: Session,
+        df: pd.DataFrame,
+        update: bool = False,
+        source: str = None,
+    ) -> LoadResult:
+        """
+        Write a transformed DataFrame keyed on NATURAL_KEY.
+
+        Rows are validated column by column against CREATE_MODEL and
+        RANGES; invalid rows are counted as errors and stored in the
+        ingestion_quarantine table with the reason they were rejected.
+        On PostgreSQL the rows are streamed with COPY into a temporary
+        staging table and merged with a single INSERT ... SELECT, otherwise
+        they are written with batched multi-row INSERT ... ON CONFLICT.
+        Existing records are skipped or, when update=True, overwritten if
+        any of their fields changed; only written rows count as inserted.
+        Rows are counted against the source file they came from, if given.
+        The caller owns the transaction: nothing is committed here.
+        """
+        with self.timed("load"):
+            return self._bulk_load(session, df, update, source)
+
+    def _bulk_load(
+        self, session: Session, df: pd.DataFrame, update: bool, source: str
+    ) -> LoadResult:
+        result = LoadResult(peak_rss_mb=peak_rss_mb())
+        if df.empty:
+            return result
+
+        df = df.rename(columns=self.COLUMNS)
+        fields = [name for name in self.CREATE_MODEL.model_fields if name in df]
+
+        before = len(df)
+        df = df.drop_duplicates(subset=list(self.NATURAL_KEY))
+        result.skipped += before - len(df)
+
+        valid, invalid = self.validator.validate(df[fields])
+        if not invalid.empty:
+            result.errors += quarantine_rows(
+                session, self.MODEL.__tablename__, source, invalid
+            )
+            logger.warning(
+                f"Quarantined {len(invalid)} invalid rows from "
+                f"{source or self.MODEL.__tablename__}, "
+                f"e.g. {invalid['reason'].iloc[0]}"
+            )
+
+        if valid.empty:
+            return result
+
+        if self._use_copy(session):
+            written = self._copy_merge(session, valid, update)
+        else:
+            written = self._insert_batches(session, valid, update)
+
+        result.inserted += written
+        self._rows_written += written
+        result.skipped += len(valid) - written
+        result.peak_rss_mb = peak_rss_mb()
+        if source in self._row_counts:
+            self._row_counts[source] += len(valid)
+        self._rows_processed += len(valid)
+        self.report("loading")
+        return result
+
+    def _use_copy(self, session: Session) -> bool:
+        return self.USE_COPY and session.get_bind().dialect.name == "postgresql"
+
+    def _insert_batches(self, session: Session, df: pd.DataFrame, update: bool) -> int:
+        table = self._target_table(session)
+        insert = self._dialect_insert(session)
+        update_fields = [name for name in df if name not in self.NATURAL_KEY]
+
+        written = 0
+        for start in range(0, len(df), self.BATCH_SIZE):
+            batch = df.iloc[start : start + self.BATCH_SIZE].to_dict("records")
+            statement = insert(table).values(batch)
+            if update and update_fields:
+                statement = statement.on_conflict_do_update(
+                    index_elements=list(self.NATURAL_KEY),
+                    set_={name: statement.excluded[name] for name in update_fields},
+                    where=or_(
+                        *(
+                            table.c[name].is_distinct_from(statement.excluded[name])
+                            for name in update_fields
+                        )
+                    ),
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(
+                    index_elements=list(self.NATURAL_KEY)
+                )
+            written += session.exec(statement).rowcount
+
+        return written
+
+    def _dialect_insert(self, session: Session):
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert
+        if dialect == "sqlite":
+            return sqlite.insert
+        raise NotImplementedError(f"Bulk load is not supported on {dialect}")
+
+    def _copy_merge(self, session: Session, df: pd.DataFrame, update: bool) -> int:
+        """
+        Stream rows into a temporary staging table with COPY FROM STDIN
+        and merge them into the target table with one set-based statement.
+        """
+        table = self._target_table(session)
+        staging = f"{table.name}_staging"
+        fields = list(df.columns)
+        columns = ", ".join(fields)
+        key = ", ".join(self.NATURAL_KEY)
+
+        update_fields = [name for name in fields if name not in self.NATURAL_KEY]
+        if update and update_fields:
+            assignments = ", ".join(
+                f"{name} = EXCLUDED.{name}" for name in update_fields
+            )
+            current = ", ".join(f"{table.name}.{name}" for name in update_fields)
+            excluded = ", ".join(f"EXCLUDED.{name}" for name in update_fields)
+            conflict = (
+                f"DO UPDATE SET {assignments} "
+                f"WHERE ROW({current}) IS DISTINCT FROM ROW({excluded})"
+            )
+        else:
+            conflict = "DO NOTHING"
+
+        frame = df.copy()
+        for name in fields:
+            enum_class = getattr(table.columns[name].type, "enum_class", None)
+            if enum_class is not None:
+                # PostgreSQL enum labels are the member names
+                frame[name] = frame[name].map({m: m.name for m in enum_class})
+
+        buffer = StringIO()
+        frame.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+
+        connection = session.connection()
+        connection.exec_driver_sql(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {table.name} WITH NO DATA"
+        )
+
+        copy_sql = f"COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        cursor = connection.connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(copy_sql, buffer)
+            else:  # psycopg 3
+                with cursor.copy(copy_sql) as copy:
+                    while chunk := buffer.read(1 << 20):
+                        copy.write(chunk)
+        finally:
+            cursor.close()
+
+        merged = connection.exec_driver_sql(
+            f"INSERT INTO {table.name} ({columns}) "
+            f"SELECT {columns} FROM {staging} "
+            f"ON CONFLICT ({key}) {conflict}"
+        )
+        connection.exec_driver_sql(f"DROP TABLE {staging}")
+        return merged.rowcount
+
     @abc.abstractmethod
-    def ingest(self, session):
+    def ingest(self, session) -> LoadResult:
         """
         Ingest transformed data into the database.
         """
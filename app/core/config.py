@@ -12,10 +12,44 @@ class Settings(BaseSettings):
     """
 
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    SQLITE_TIMEOUT: float = float(os.getenv("SQLITE_TIMEOUT", "30.0"))  # lock wait
     ALLOW_REINGEST: bool = os.getenv("ALLOW_REINGEST", "false").lower() == "true"
     EMBRAPA_BASE_URL: str = os.getenv(
         "EMBRAPA_BASE_URL", "http://vitibrasil.cnpuv.embrapa.br"
     )
+    DOWNLOAD_CACHE_DIR: str = os.getenv("DOWNLOAD_CACHE_DIR", "download_cache")
+    FETCH_CONCURRENCY: int = int(os.getenv("FETCH_CONCURRENCY", "4"))
+    FETCH_TIMEOUT: float = float(os.getenv("FETCH_TIMEOUT", "60.0"))  # per attempt
+    FETCH_CONNECT_TIMEOUT: float = float(os.getenv("FETCH_CONNECT_TIMEOUT", "5.0"))
+    FETCH_READ_TIMEOUT: float = float(os.getenv("FETCH_READ_TIMEOUT", "10.0"))
+    FETCH_MAX_CONNECTIONS: int = int(os.getenv("FETCH_MAX_CONNECTIONS", "4"))
+    FETCH_KEEPALIVE_EXPIRY: float = float(os.getenv("FETCH_KEEPALIVE_EXPIRY", "30.0"))
+    FETCH_HTTP2: bool = os.getenv("FETCH_HTTP2", "true").lower() == "true"
+    FETCH_RETRIES: int = int(os.getenv("FETCH_RETRIES", "3"))
+    FETCH_BACKOFF: float = float(os.getenv("FETCH_BACKOFF", "1.0"))
+    INGEST_BATCH_SIZE: int = int(os.getenv("INGEST_BATCH_SIZE", "1000"))
+    INGEST_CHUNK_SIZE: int = int(os.getenv("INGEST_CHUNK_SIZE", "100000"))
+    INGEST_USE_COPY: bool = os.getenv("INGEST_USE_COPY", "true").lower() == "true"
+    INGEST_FRAME_CACHE: bool = os.getenv("INGEST_FRAME_CACHE", "true").lower() == "true"
+    INGEST_CSV_ENGINE: str = os.getenv("INGEST_CSV_ENGINE", "c")
+    FRAME_CACHE_DIR: str = os.getenv("FRAME_CACHE_DIR", "frame_cache")
+    INGEST_ARCHIVE: bool = os.getenv("INGEST_ARCHIVE", "true").lower() == "true"
+    ARCHIVE_DIR: str = os.getenv("ARCHIVE_DIR", "source_archive")
+    INGEST_PIPELINE: bool = os.getenv("INGEST_PIPELINE", "true").lower() == "true"
+    INGEST_PIPELINE_QUEUE_SIZE: int = int(os.getenv("INGEST_PIPELINE_QUEUE_SIZE", "2"))
+    DATASET_VERSION_TTL: float = float(os.getenv("DATASET_VERSION_TTL", "5.0"))
+    RESPONSE_CACHE_MAX_MB: int = int(os.getenv("RESPONSE_CACHE_MAX_MB", "64"))
+    CACHE_CONTROL: str = os.getenv("CACHE_CONTROL", "private, no-cache")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_STALE_AFTER: int = int(os.getenv("JOB_STALE_AFTER", "900"))  # seconds
+
+    # Ingest daemon, intervals and backoff in seconds
+    SCHEDULE_INTERVAL: float = float(os.getenv("SCHEDULE_INTERVAL", "86400"))
+    SCHEDULE_INTERVALS: str = os.getenv("SCHEDULE_INTERVALS", "")  # source=seconds,...
+    SCHEDULE_JITTER: float = float(os.getenv("SCHEDULE_JITTER", "0.1"))
+    SCHEDULE_BACKOFF: float = float(os.getenv("SCHEDULE_BACKOFF", "60"))
+    SCHEDULE_BACKOFF_MAX: float = float(os.getenv("SCHEDULE_BACKOFF_MAX", "3600"))
+    SCHEDULER_LOCK_FILE: str = os.getenv("SCHEDULER_LOCK_FILE", "ingest-daemon.lock")
 
     # JWT Settings
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
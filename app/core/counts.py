@@ -0,0 +1,72 @@
+import threading
+from typing import Callable
+
+from sqlmodel import Session, SQLModel
+
+from app.core.datasets import DatasetVersions, dataset_versions
+
+
+class CountsCache:
+    """
+    Row counts of the list endpoints, kept in memory per dataset version.
+
+    The data only changes on ingest, and every ingest that changes a table
+    bumps its version (see DatasetVersions). A count is computed on the
+    first request for it and served from memory until the version of its
+    table changes.
+    """
+
+    def __init__(self, versions: DatasetVersions = None):
+        self.versions = versions or dataset_versions
+        self._lock = threading.Lock()
+        self._counts: dict[tuple, tuple[int, int]] = {}  # key -> (version, count)
+
+    def get(
+        self, session: Session, model: type[SQLModel], count: Callable[..., int], *args
+    ) -> int | None:
+        """
+        count(session, *args) for the rows of model's table, if it is cached
+        for the current version of the table.
+        """
+        table = model.__tablename__
+        version = self.versions.version(session, table)
+        with self._lock:
+            cached = self._counts.get((table, count.__name__, *args))
+        return cached[1] if cached and cached[0] == version else None
+
+    def put(
+        self,
+        session: Session,
+        model: type[SQLModel],
+        count: Callable[..., int],
+        *args,
+        total: int,
+    ) -> None:
+        """
+        Cache the result of count(session, *args), computed some other way,
+        for the current version of model's table.
+        """
+        table = model.__tablename__
+        version = self.versions.version(session, table)
+        with self._lock:
+            self._counts[(table, count.__name__, *args)] = (version, total)
+
+    def count(
+        self, session: Session, model: type[SQLModel], count: Callable[..., int], *args
+    ) -> int:
+        """
+        count(session, *args) for the rows of model's table, from memory if
+        it was computed for the current version of the table.
+        """
+        total = self.get(session, model, count, *args)
+        if total is None:
+            total = count(session, *args)
+            self.put(session, model, count, *args, total=total)
+        return total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+counts = CountsCache()
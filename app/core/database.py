@@ -1,9 +1,27 @@
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, make_url
 from sqlmodel import Session
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+def is_sqlite(database_url: str) -> bool:
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+def create_db_engine(database_url: str = None) -> Engine:
+    """
+    Engine for database_url, DATABASE_URL by default. SQLite connections
+    wait up to SQLITE_TIMEOUT seconds for another writer's lock instead of
+    failing with "database is locked".
+    """
+    database_url = database_url or settings.DATABASE_URL
+    connect_args = {}
+    if is_sqlite(database_url):
+        connect_args["timeout"] = settings.SQLITE_TIMEOUT
+    return create_engine(database_url, pool_pre_ping=True, connect_args=connect_args)
+
+
+engine = create_db_engine()
 
 
 def get_session():
@@ -0,0 +1,58 @@
+import threading
+import time
+from typing import Callable
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.ingestion.crud import get_dataset_versions
+
+
+class DatasetVersions:
+    """
+    Versions of the data tables, as last read from the dataset_version
+    table, for the caches of the read endpoints.
+
+    Every ingest that changes a table bumps its version. Ingests usually
+    run in other processes, so the versions are read again at most every
+    DATASET_VERSION_TTL seconds; an ingest in this process calls
+    invalidate() so its changes are seen at once.
+    """
+
+    def __init__(self, ttl: float = None, clock: Callable[[], float] = time.monotonic):
+        self.ttl = settings.DATASET_VERSION_TTL if ttl is None else ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] = {}
+        self._checked_at: float | None = None
+
+    def version(self, session: Session, table: str) -> int:
+        """
+        Current version of a table, 0 if it was never ingested.
+        """
+        now = self.clock()
+        with self._lock:
+            fresh = self._checked_at is not None and now - self._checked_at < self.ttl
+            if fresh:
+                return self._versions.get(table, 0)
+
+        versions = get_dataset_versions(session)
+        with self._lock:
+            self._versions = versions
+            self._checked_at = now
+        return versions.get(table, 0)
+
+    def invalidate(self) -> None:
+        """
+        Read the table versions again on the next request.
+        """
+        with self._lock:
+            self._checked_at = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions.clear()
+            self._checked_at = None
+
+
+dataset_versions = DatasetVersions()
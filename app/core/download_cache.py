@@ -0,0 +1,100 @@
+import json
+import logging
+import os
+import shutil
+from dataclasses import asdict, dataclass
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """
+    HTTP validators and content hash of the last ingested copy of a file.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    sha256: str
+    size: int
+
+
+class DownloadCache:
+    """
+    Persistent cache of downloaded source files and their HTTP validators.
+
+    Every source path gets its body and a small JSON metadata file, so
+    concurrent ingestors of different domains never write the same file.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = root or settings.DOWNLOAD_CACHE_DIR
+
+    def file(self, path: str) -> str:
+        """
+        Location of the cached body of a path.
+        """
+        return os.path.join(self.root, os.path.basename(path))
+
+    def get(self, path: str) -> CacheEntry | None:
+        """
+        Return the cache entry for a path, if both metadata and body exist.
+        """
+        meta = f"{self.file(path)}.json"
+        if not (os.path.exists(meta) and os.path.exists(self.file(path))):
+            return None
+
+        try:
+            with open(meta, encoding="utf-8") as f:
+                return CacheEntry(**json.load(f))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring corrupt cache entry {meta}: {e}")
+            return None
+
+    def headers(self, path: str, loaded: str | None) -> dict[str, str]:
+        """
+        Conditional request headers for the cached copy of a path, given the
+        hash of the version last loaded into the database. A 304 answer
+        skips the file, so no headers are sent unless the cached copy is
+        that version; otherwise a wiped database would never be reloaded.
+        """
+        entry = self.get(path)
+        if entry is None or loaded is None or entry.sha256 != loaded:
+            return {}
+
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(
+        self,
+        path: str,
+        source: str,
+        etag: str | None,
+        last_modified: str | None,
+        sha256: str,
+    ) -> None:
+        """
+        Atomically replace the cached body and metadata of a path, copying
+        the body from the local source file.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        target = self.file(path)
+        entry = CacheEntry(
+            etag=etag,
+            last_modified=last_modified,
+            sha256=sha256,
+            size=os.path.getsize(source),
+        )
+
+        shutil.copyfile(source, f"{target}.tmp")
+        os.replace(f"{target}.tmp", target)
+
+        with open(f"{target}.json.tmp", "w", encoding="utf-8") as f:
+            json.dump(asdict(entry), f)
+        os.replace(f"{target}.json.tmp", f"{target}.json")
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import logging
+import os
+import queue
+import tempfile
+from dataclasses import dataclass
+from functools import cached_property
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+from app.core.config import settings
+from app.core.download_cache import DownloadCache
+from app.core.http_client import SharedClient, build_client, shared_client
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+CHUNK_BYTES = 1 << 20
+
+_DONE = object()
+
+
+@dataclass
+class FetchedFile:
+    """
+    A source file on local disk: read from the 'download' folder, served
+    from the download cache or spooled to a temporary file while downloading.
+    """
+
+    path: str
+    file: str  # local copy of the body
+    url: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False  # server answered 304, content comes from cache
+    temporary: bool = False  # file is a spooled download, removed by discard()
+
+    @property
+    def content(self) -> bytes:
+        with open(self.file, "rb") as f:
+            return f.read()
+
+    @cached_property
+    def sha256(self) -> str:
+        digest = hashlib.sha256()
+        with open(self.file, "rb") as f:
+            while block := f.read(CHUNK_BYTES):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def discard(self) -> None:
+        """
+        Remove the spooled download, if any.
+        """
+        if self.temporary and os.path.exists(self.file):
+            os.remove(self.file)
+
+
+class AsyncFetcher:
+    """
+    Download Embrapa source files concurrently over the AsyncClient shared
+    by every ingestor of the process, or a dedicated one over the given
+    transport.
+
+    Response bodies are streamed to temporary files, so memory use does not
+    grow with the size of the files. Files present in the local 'download'
+    folder are read from disk instead. When a download cache is given, a
+    file whose cached copy is the version loaded into the database (see
+    loaded) is requested with If-None-Match / If-Modified-Since, and a 304
+    answer is served from the cached copy.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        concurrency: int = settings.FETCH_CONCURRENCY,
+        timeout: float = settings.FETCH_TIMEOUT,
+        retries: int = settings.FETCH_RETRIES,
+        backoff: float = settings.FETCH_BACKOFF,
+        transport: httpx.AsyncBaseTransport = None,
+        cache: DownloadCache = None,
+        client: SharedClient = None,
+        loaded: dict[str, str] = None,
+    ):
+        self.base_url = base_url
+        self.cache = cache
+        self.loaded = loaded or {}  # path -> hash of the version in the database
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.transport = transport
+        self.client = client or shared_client
+
+    async def fetch_all(self, paths: list[str]) -> AsyncIterator[FetchedFile]:
+        """
+        Fetch all paths at once, yielding each file as soon as it arrives.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        if self.transport is None:
+            client = self.client.client
+        else:
+            client = build_client(self.transport)
+
+        async def fetch_bounded(path: str) -> FetchedFile:
+            async with semaphore:
+                return await self.fetch(client, path)
+
+        tasks = [asyncio.create_task(fetch_bounded(path)) for path in paths]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.transport is not None:
+                await client.aclose()
+
+    async def fetch(self, client: httpx.AsyncClient, path: str) -> FetchedFile:
+        """
+        Fetch a single file, retrying transient failures with exponential backoff.
+        """
+        if os.path.exists(path):
+            logger.warning(f"Reading {path} from local disk instead of {self.base_url}")
+            return FetchedFile(path=path, file=path)
+
+        url = f"{self.base_url}/{path}"
+        headers = self.cache.headers(path, self.loaded.get(path)) if self.cache else {}
+
+        for attempt in range(self.retries + 1):
+            try:
+                return await asyncio.wait_for(
+                    self._download(client, path, url, headers), self.timeout
+                )
+            except (httpx.TransportError, asyncio.TimeoutError) as e:
+                error = e
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRY_STATUS_CODES:
+                    logger.warning(f"Failed to fetch {url}: {e}")
+                    raise RuntimeError(f"Unable to download CSV from {url}") from e
+                error = e
+
+            if attempt < self.retries:
+                delay = self.backoff * 2**attempt
+                logger.info(f"Retrying {url} in {delay:.1f}s after: {error!r}")
+                await asyncio.sleep(delay)
+
+        logger.warning(f"Failed to fetch {url}: {error!r}")
+        raise RuntimeError(f"Unable to download CSV from {url}") from error
+
+    async def _download(
+        self, client: httpx.AsyncClient, path: str, url: str, headers: dict
+    ) -> FetchedFile:
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                logger.info(f"Not modified since last download: {url}")
+                return FetchedFile(
+                    path=path, file=self.cache.file(path), url=url, not_modified=True
+                )
+            if response.status_code in RETRY_STATUS_CODES:
+                raise httpx.HTTPStatusError(
+                    f"Retryable status {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+            response.raise_for_status()
+
+            fd, file = tempfile.mkstemp(prefix="embrapa-", suffix=".csv")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(CHUNK_BYTES):
+                        f.write(chunk)
+            except BaseException:
+                os.remove(file)
+                raise
+
+        logger.info(f"Downloaded {url} ({os.path.getsize(file)} bytes)")
+        return FetchedFile(
+            path=path,
+            file=file,
+            url=url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            temporary=True,
+        )
+
+
+def fetch_files(paths: list[str], fetcher: AsyncFetcher) -> Iterator[FetchedFile]:
+    """
+    Run the async fetch stage on the event loop thread of the shared client
+    and yield files in arrival order, so callers can parse and load each
+    file while the remaining downloads are still in flight. Downloads still
+    in flight are cancelled if the caller stops early.
+    """
+    results = queue.Queue()
+
+    async def run():
+        try:
+            async for fetched in fetcher.fetch_all(paths):
+                results.put(fetched)
+        except BaseException as e:
+            results.put(e)
+        finally:
+            results.put(_DONE)
+
+    future = fetcher.client.submit(run())
+    try:
+        while (item := results.get()) is not _DONE:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        future.cancel()
@@ -0,0 +1,84 @@
+import logging
+import os
+import shutil
+import tempfile
+from typing import Iterator
+
+import pandas as pd
+import pyarrow as pa
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class FrameWriter:
+    """
+    Write the transformed frames of one source file to a temporary folder,
+    one Arrow IPC file per chunk, and publish them on commit().
+    """
+
+    def __init__(self, target: str, root: str):
+        os.makedirs(root, exist_ok=True)
+        self.target = target
+        self.folder = tempfile.mkdtemp(prefix=".tmp-", dir=root)
+        self.chunks = 0
+
+    def write(self, frame: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        path = os.path.join(self.folder, f"{self.chunks:06d}.arrow")
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        self.chunks += 1
+
+    def commit(self) -> None:
+        """
+        Atomically publish the written frames. If another ingest published
+        the same entry first, its copy is kept.
+        """
+        try:
+            os.rename(self.folder, self.target)
+        except OSError:
+            self.abort()
+
+    def abort(self) -> None:
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+
+class FrameCache:
+    """
+    Local columnar cache of transformed frames, keyed by the content hash
+    of the source file they came from.
+
+    Frames are stored uncompressed in the Arrow IPC format and read back
+    through memory maps, so reloading an unchanged file skips CSV parsing
+    and reshaping altogether.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = root or settings.FRAME_CACHE_DIR
+
+    def folder(self, key: str) -> str:
+        """
+        Location of the frames of a cache key.
+        """
+        return os.path.join(self.root, key)
+
+    def has(self, key: str) -> bool:
+        return os.path.isdir(self.folder(key))
+
+    def read(self, key: str) -> Iterator[pd.DataFrame]:
+        """
+        Yield the cached frames of a key, one chunk at a time.
+        """
+        folder = self.folder(key)
+        for name in sorted(os.listdir(folder)):
+            with pa.memory_map(os.path.join(folder, name)) as source:
+                yield pa.ipc.open_file(source).read_all().to_pandas()
+
+    def writer(self, key: str) -> FrameWriter:
+        """
+        Start writing the frames of a key.
+        """
+        return FrameWriter(self.folder(key), self.root)
@@ -0,0 +1,95 @@
+import asyncio
+import atexit
+import concurrent.futures
+import importlib.util
+import logging
+import os
+import threading
+from typing import Coroutine
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def build_client(transport: httpx.AsyncBaseTransport = None) -> httpx.AsyncClient:
+    """
+    AsyncClient for Embrapa downloads: pooled keep-alive connections,
+    HTTP/2 when the h2 package is installed and the server negotiates it,
+    separate connect and read timeouts and gzip transfer encoding.
+    """
+    http2 = settings.FETCH_HTTP2 and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(
+            settings.FETCH_READ_TIMEOUT, connect=settings.FETCH_CONNECT_TIMEOUT
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.FETCH_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.FETCH_MAX_CONNECTIONS,
+            keepalive_expiry=settings.FETCH_KEEPALIVE_EXPIRY,
+        ),
+        headers={"Accept-Encoding": "gzip"},
+        trust_env=False,
+        transport=transport,
+    )
+
+
+class SharedClient:
+    """
+    One AsyncClient shared by every ingestor of a process, running on its
+    own event loop thread, so consecutive ingests reuse the same pooled
+    connections instead of opening new ones.
+
+    Started on first use and restarted in forked worker processes, which
+    do not inherit the loop thread.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport = None):
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._pid = None
+        self._loop = None
+        self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        self._start()
+        return self._client
+
+    def submit(self, coroutine: Coroutine) -> concurrent.futures.Future:
+        """
+        Run a coroutine on the client's event loop.
+        """
+        self._start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def close(self) -> None:
+        """
+        Close the pooled connections and stop the event loop.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            loop, client = self._loop, self._client
+            self._pid = self._loop = self._client = None
+
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._loop = asyncio.new_event_loop()
+            self._client = build_client(self.transport)
+            self._pid = os.getpid()
+            threading.Thread(
+                target=self._loop.run_forever, name="embrapa-http", daemon=True
+            ).start()
+
+
+shared_client = SharedClient()
+atexit.register(shared_client.close)
@@ -0,0 +1,11 @@
+import resource
+import sys
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of the current process, in megabytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
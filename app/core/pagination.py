@@ -1,22 +1,160 @@
-from typing import Generic, TypeVar
+import base64
+import binascii
+import json
+from enum import Enum
+from typing import Any, Generic, Optional, Sequence, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import and_, func, or_
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+from sqlmodel import Session, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 T = TypeVar("T")
 
 
+class InvalidCursor(ValueError):
+    """
+    A cursor that was not issued for this listing.
+    """
+
+
+def _sort_key(order_by: Sequence[ColumnElement]) -> list[tuple[Any, bool]]:
+    """
+    (column, descending) pairs of an ORDER BY clause list.
+    """
+    key = []
+    for clause in order_by:
+        if isinstance(clause, UnaryExpression) and clause.modifier in (
+            operators.desc_op,
+            operators.asc_op,
+        ):
+            key.append((clause.element, clause.modifier is operators.desc_op))
+        else:
+            key.append((clause, False))
+    return key
+
+
+def encode_cursor(row: Any, order_by: Sequence[ColumnElement]) -> str:
+    """
+    Opaque cursor pointing right after row, in the given order.
+    """
+    values = []
+    for column, _ in _sort_key(order_by):
+        value = getattr(row, column.key)
+        values.append(value.value if isinstance(value, Enum) else value)
+    payload = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: Sequence[ColumnElement]) -> list:
+    """
+    Sort key values of a cursor. Raises InvalidCursor if it is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(f"Malformed cursor: {cursor!r}") from None
+    if not isinstance(values, list) or len(values) != len(order_by):
+        raise InvalidCursor(f"Malformed cursor: {cursor!r}")
+    return values
+
+
+def seek(
+    statement: SelectOfScalar, order_by: Sequence[ColumnElement], cursor: str
+) -> SelectOfScalar:
+    """
+    Restrict an ordered statement to the rows after a cursor, so the next
+    page is read by seeking an index on order_by instead of scanning and
+    discarding the rows before it. order_by must end with a unique column.
+    """
+    key = _sort_key(order_by)
+    values = decode_cursor(cursor, order_by)
+
+    # Rows after the cursor: equal on a prefix of the key, then past it
+    after = []
+    for index, ((column, descending), value) in enumerate(zip(key, values)):
+        equal = [key[i][0] == values[i] for i in range(index)]
+        past = column < value if descending else column > value
+        after.append(and_(*equal, past))
+
+    # Redundant bound on the leading column, usable as an index range
+    (first, descending), start = key[0], values[0]
+    bound = first <= start if descending else first >= start
+    return statement.where(bound, or_(*after))
+
+
+def fetch_page(
+    session: Session,
+    statement: SelectOfScalar,
+    order_by: Sequence[ColumnElement],
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
+) -> list:
+    """
+    Rows of statement in order_by order, skipping offset rows or starting
+    after a cursor, up to limit rows.
+    """
+    statement = statement.order_by(*order_by)
+
+    if cursor:
+        statement = seek(statement, order_by, cursor)
+    if offset:
+        statement = statement.offset(offset)
+    if limit:
+        statement = statement.limit(limit)
+
+    return list(session.exec(statement).all())
+
+
+def fetch_page_with_total(
+    session: Session,
+    statement: SelectOfScalar,
+    order_by: Sequence[ColumnElement],
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
+) -> tuple[list, int]:
+    """
+    Like fetch_page, but also return the number of rows statement matches,
+    counted in the same query. statement must select a single model, with
+    at most a WHERE clause.
+
+    The total is an uncorrelated scalar subquery, which the database runs
+    once, so the page itself is still read off the listing index. With
+    COUNT(*) OVER () every matching row would be read and sorted before
+    the limit applies, and a cursor would only count the rows after it.
+    """
+    total = select(func.count()).select_from(statement.subquery()).scalar_subquery()
+    paged = select(statement.column_descriptions[0]["entity"], total.label("total"))
+    if statement.whereclause is not None:
+        paged = paged.where(statement.whereclause)
+
+    rows = fetch_page(session, paged, order_by, limit, offset, cursor)
+    if rows:
+        return [row for row, _ in rows], rows[0].total
+    if offset or cursor:
+        # Past the last page: no row to read the total from
+        return [], session.exec(select(total)).one()
+    return [], 0
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """
     Generic paginated response model.
     """
 
     data: list[T]
-    total: int
-    page: int
+    total: Optional[int]  # None when the count was not requested
+    page: Optional[int]  # None for pages read by cursor
     per_page: int
-    total_pages: int
+    total_pages: Optional[int]
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None  # pass as cursor to read the next page
 
     @classmethod
     def create(
@@ -36,3 +174,33 @@ class PaginatedResponse(BaseModel, Generic[T]):
             has_next=page < total_pages,
             has_prev=page > 1,
         )
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[T],
+        total: Optional[int],
+        page: int,
+        per_page: int,
+        order_by: Sequence[ColumnElement],
+        cursor: str = None,
+    ) -> "PaginatedResponse[T]":
+        """
+        Create a paginated response from up to per_page + 1 rows read in
+        order_by order, by page or after a cursor. The extra row only tells
+        whether there is a next page, and next_cursor points past the last
+        returned row. total may be None, to skip counting the rows.
+        """
+        data = list(rows[:per_page])
+        has_next = len(rows) > per_page
+
+        return cls(
+            data=data,
+            total=total,
+            page=None if cursor else page,
+            per_page=per_page,
+            total_pages=None if total is None else (total + per_page - 1) // per_page,
+            has_next=has_next,
+            has_prev=bool(cursor) or page > 1,
+            next_cursor=encode_cursor(data[-1], order_by) if has_next else None,
+        )
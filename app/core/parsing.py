@@ -0,0 +1,110 @@
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pandas.api.types import is_numeric_dtype
+
+# Options shared by every Embrapa CSV read: Brazilian decimal commas are
+# parsed at read time, so most quantity columns arrive already numeric.
+READ_CSV_OPTIONS = {"encoding": "utf-8", "decimal": ","}
+
+CSV_ENGINES = ("c", "pyarrow")
+
+
+def read_csv(file: str, separator: str, engine: str = "c", **options) -> pd.DataFrame:
+    """
+    Read an Embrapa CSV with the given pandas engine, through a memory map
+    of the file rather than a copy of its text.
+
+    The pyarrow engine parses with several threads, but keeps repeated
+    headers as they are; they are renamed the way the C engine does, so the
+    value columns of the trade files still come out as e.g. "2021.1".
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unsupported CSV engine: {engine!r}")
+
+    if engine == "c":
+        return pd.read_csv(
+            file, sep=separator, memory_map=True, **READ_CSV_OPTIONS, **options
+        )
+
+    with pa.memory_map(file) as source:
+        df = pd.read_csv(
+            source, sep=separator, engine="pyarrow", **READ_CSV_OPTIONS, **options
+        )
+    df.columns = dedupe_columns(df.columns)
+    return df
+
+
+def dedupe_columns(columns: Iterable[str]) -> list[str]:
+    """
+    Suffix repeated column names with ".1", ".2", ... like pandas' C engine.
+    """
+    names = list(columns)
+    taken = set(names)
+    counts: dict[str, int] = {}
+    for i, name in enumerate(names):
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        if count == 0:
+            continue
+        while f"{name}.{count}" in taken:
+            count += 1
+        names[i] = f"{name}.{count}"
+        taken.add(names[i])
+        counts[name] = count + 1
+    return names
+
+
+def to_number(
+    values: pd.Series, invalid_values: Iterable[str] = (), errors: str = "raise"
+) -> pd.Series:
+    """
+    Convert an Embrapa quantity column to floats.
+
+    Numeric cells are kept as they are. Only the remaining text cells are
+    lowercased, mapped to 0 when they are sentinels from invalid_values
+    (e.g. "nd", "+", "*") and parsed with ',' as the decimal separator.
+    Unparseable text raises, or becomes NaN with errors="coerce".
+    """
+    if is_numeric_dtype(values):
+        return values.astype(float)
+
+    text = values.str.lower()  # NaN for numeric and missing cells
+    is_text = text.notna()
+    numbers = values.where(~is_text).astype(float)
+    if not is_text.any():
+        return numbers
+
+    text = text[is_text]
+    text = text.mask(text.isin(set(invalid_values)), "0")
+    text = text.str.replace(",", ".", regex=False)
+    if errors == "coerce":
+        numbers[is_text] = pd.to_numeric(text, errors="coerce")
+    else:
+        numbers[is_text] = text.astype(float)
+    return numbers
+
+
+def classify_prefix(
+    values: pd.Series, prefixes: dict[str, Any], default: Any
+) -> np.ndarray:
+    """
+    Map each value to the label of the first prefix it starts with.
+
+    Source columns repeat a handful of control codes, so the prefixes are
+    only matched against the distinct values.
+    """
+    default = getattr(default, "value", default)
+    codes, uniques = pd.factorize(values)
+    if not prefixes:
+        return np.full(len(values), default, dtype=object)
+
+    text = pd.Series(uniques, dtype=object).astype(str)
+    conditions = [text.str.startswith(prefix).to_numpy() for prefix in prefixes]
+    labels = [getattr(label, "value", label) for label in prefixes.values()]
+    classified = np.select(conditions, labels, default=default).astype(object)
+
+    # Missing values are coded -1 and pick the trailing default
+    return np.append(classified, default)[codes]
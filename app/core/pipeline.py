@@ -0,0 +1,197 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from app.core.config import settings
+
+_DONE = object()
+
+
+class _Failed:
+    """
+    An exception raised by a stage, on its way down to the consumer.
+    """
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _Stopped(Exception):
+    """
+    The consumer went away; upstream stages wind down.
+    """
+
+
+@dataclass
+class StageStats:
+    """
+    Time a stage spent working, as opposed to waiting on its neighbours.
+    """
+
+    name: str
+    busy_seconds: float = 0.0
+    items: int = 0  # items the stage produced
+
+
+class Pipeline:
+    """
+    Run the stages of an ingest concurrently, each in its own thread,
+    connected by bounded queues, so fetching the next file overlaps with
+    transforming the current one and loading the previous one.
+
+    The source stage yields items, every further stage turns each item it
+    receives into zero or more items for the next one, and the caller
+    consumes the last stage by iterating the pipeline, as the final stage.
+    A full queue blocks the stage feeding it, so at most maxsize items are
+    held between two stages however fast the upstream stages are.
+
+    The first exception raised by any stage is re-raised to the consumer,
+    and a consumer that stops early stops every stage.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: Iterator,
+        maxsize: int = settings.INGEST_PIPELINE_QUEUE_SIZE,
+    ):
+        self.maxsize = maxsize
+        self.source = source
+        self.stages: list[tuple[StageStats, Callable[[Any], Iterable]]] = []
+        self.stats = [StageStats(name)]
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+
+    def stage(self, name: str, fn: Callable[[Any], Iterable]) -> "Pipeline":
+        """
+        Add a stage turning each item into the items yielded by fn(item).
+        """
+        stats = StageStats(name)
+        self.stages.append((stats, fn))
+        self.stats.append(stats)
+        return self
+
+    def run(self, consumer: str) -> Iterator:
+        """
+        Start every stage and yield the items of the last one. Time spent
+        by the caller between items is counted as busy time of the
+        consumer stage.
+        """
+        sink = StageStats(consumer)
+        self.stats.append(sink)
+        started = time.perf_counter()
+
+        inbox = queue.Queue(self.maxsize)
+        threads = [self._thread(self._produce, self.stats[0], self.source, inbox)]
+        for stats, fn in self.stages:
+            outbox = queue.Queue(self.maxsize)
+            threads.append(self._thread(self._map, stats, fn, inbox, outbox))
+            inbox = outbox
+        for thread in threads:
+            thread.start()
+
+        try:
+            while (item := inbox.get()) is not _DONE:
+                if isinstance(item, _Failed):
+                    raise item.error
+                resumed = time.perf_counter()
+                yield item
+                sink.busy_seconds += time.perf_counter() - resumed
+                sink.items += 1
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            self.elapsed = time.perf_counter() - started
+
+    def utilization(self) -> dict[str, float]:
+        """
+        Fraction of the pipeline's run time each stage spent working. The
+        stage closest to 1 is the bottleneck.
+        """
+        if not self.elapsed:
+            return {stats.name: 0.0 for stats in self.stats}
+        return {stats.name: stats.busy_seconds / self.elapsed for stats in self.stats}
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{name} {share:.0%}" for name, share in self.utilization().items()
+        )
+
+    def _thread(self, target: Callable, *args) -> threading.Thread:
+        return threading.Thread(
+            target=target, args=args, name=f"pipeline-{args[0].name}", daemon=True
+        )
+
+    def _produce(self, stats: StageStats, items: Iterator, outbox: queue.Queue):
+        try:
+            self._drain(stats, items, outbox)
+        except BaseException as e:
+            self._finish(outbox, e)
+        else:
+            self._finish(outbox, None)
+
+    def _map(
+        self,
+        stats: StageStats,
+        fn: Callable[[Any], Iterable],
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+    ):
+        try:
+            while (item := self._get(inbox)) is not _DONE:
+                if isinstance(item, _Failed):
+                    return self._finish(outbox, item.error)
+                self._drain(stats, iter(fn(item)), outbox)
+        except BaseException as e:
+            self._finish(outbox, e)
+        else:
+            self._finish(outbox, None)
+
+    def _finish(self, outbox: queue.Queue, error: BaseException | None) -> None:
+        """
+        Tell the next stage this one is done, or failed with error.
+        """
+        if isinstance(error, _Stopped):
+            return
+        try:
+            self._put(outbox, _DONE if error is None else _Failed(error))
+        except _Stopped:
+            pass
+
+    def _drain(self, stats: StageStats, items: Iterator, outbox: queue.Queue):
+        """
+        Move the items of an iterator to the outbox, timing only the work of
+        producing them.
+        """
+        try:
+            while True:
+                started = time.perf_counter()
+                item = next(items, _DONE)
+                stats.busy_seconds += time.perf_counter() - started
+                if item is _DONE:
+                    return
+                stats.items += 1
+                self._put(outbox, item)
+        finally:
+            close = getattr(items, "close", None)
+            if close:
+                close()
+
+    def _put(self, outbox: queue.Queue, item: Any) -> None:
+        while True:
+            try:
+                return outbox.put(item, timeout=0.1)
+            except queue.Full:
+                if self._stop.is_set():
+                    raise _Stopped() from None
+
+    def _get(self, inbox: queue.Queue) -> Any:
+        while True:
+            try:
+                return inbox.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    raise _Stopped() from None
@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from app.core.response_cache import response_cache
+
 router = APIRouter()
 
 
@@ -10,6 +12,7 @@ async def health_check():
         "status": "healthy",
         "message": "Embrapa Vitiviniculture API is running",
         "authentication": "JWT enabled",
+        "response_cache": response_cache.stats(),
     }
 
 
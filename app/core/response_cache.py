@@ -0,0 +1,197 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from sqlmodel import SQLModel
+
+from app.core.config import settings
+from app.core.datasets import DatasetVersions, dataset_versions
+
+Key = tuple  # (table, version, route path, path params, query params)
+
+
+def etag(key: Key) -> str:
+    """
+    Strong entity tag of the response of a key. The key holds the dataset
+    version, so the tag changes with every ingest that changes the table.
+    """
+    return '"%s"' % hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+
+
+def etag_matches(if_none_match: str | None, tag: str) -> bool:
+    """
+    Whether an If-None-Match header matches a tag, comparing weakly as
+    RFC 9110 requires for this header.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return tag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+class ResponseCache:
+    """
+    Serialized bodies of read endpoint responses, per dataset version.
+
+    A response is keyed by its table and the version of that table, the
+    route and its path and query parameters, so pages built before an
+    ingest are never served after the ingest is seen (see DatasetVersions);
+    they are dropped as soon as their table changes version. The cache is
+    an LRU bounded to RESPONSE_CACHE_MAX_MB of response bodies.
+    """
+
+    def __init__(self, max_bytes: int = None, versions: DatasetVersions = None):
+        if max_bytes is None:
+            max_bytes = settings.RESPONSE_CACHE_MAX_MB * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.versions = versions or dataset_versions
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0  # conditional requests answered with 304
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Key, bytes] = OrderedDict()
+        self._size = 0
+        self._seen: dict[str, int] = {}  # latest version of each table
+
+    def get(self, key: Key) -> bytes | None:
+        """
+        Cached body of a key, counting the lookup as a hit or a miss.
+        """
+        table, version = key[:2]
+        with self._lock:
+            if self._seen.get(table, version) != version:
+                self._drop(table)
+            self._seen[table] = version
+
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: Key, body: bytes) -> None:
+        """
+        Cache a body, evicting the least recently used ones over the limit.
+        """
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if self._seen.get(key[0]) != key[1]:
+                return  # built from a version that is no longer current
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def count_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def _drop(self, table: str) -> None:
+        for key in [key for key in self._entries if key[0] == table]:
+            self._size -= len(self._entries.pop(key))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._seen.clear()
+            self.hits = self.misses = self.not_modified = 0
+
+
+response_cache = ResponseCache()
+
+
+def cached_response(model: type[SQLModel], cache: ResponseCache = None) -> Callable:
+    """
+    Serve a read endpoint from the response cache, keyed on the version of
+    model's table. The endpoint must take the database session as session.
+    Dependencies such as authentication still run on every request; on a
+    miss the endpoint runs and its result is serialized like FastAPI does,
+    once. Responses carry an X-Cache header telling HIT or MISS.
+
+    Responses also carry the CACHE_CONTROL header and a strong ETag
+    derived from the key. A request whose If-None-Match matches the ETag
+    gets a 304 without reading or serializing any data.
+    """
+    cache = cache or response_cache
+    table = model.__tablename__
+
+    def decorator(endpoint: Callable) -> Callable:
+        signature = inspect.signature(endpoint)
+        is_coroutine = asyncio.iscoroutinefunction(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(cache_request: Request, **kwargs) -> Response:
+            session = kwargs["session"]
+            route = cache_request.scope["route"]
+            # Reading the versions queries the database once the TTL expires
+            version = await run_in_threadpool(cache.versions.version, session, table)
+            key = (
+                table,
+                version,
+                route.path,
+                tuple(sorted(cache_request.path_params.items())),
+                tuple(sorted(cache_request.query_params.multi_items())),
+            )
+
+            headers = {"ETag": etag(key), "Cache-Control": settings.CACHE_CONTROL}
+            if etag_matches(
+                cache_request.headers.get("if-none-match"), headers["ETag"]
+            ):
+                cache.count_not_modified()
+                return Response(status_code=304, headers=headers)
+
+            body = cache.get(key)
+            headers["X-Cache"] = "HIT"
+            if body is None:
+                if is_coroutine:
+                    result = await endpoint(**kwargs)
+                else:
+                    result = await run_in_threadpool(endpoint, **kwargs)
+                content = await serialize_response(
+                    field=route.response_field, response_content=result
+                )
+                body = JSONResponse(content).body
+                cache.put(key, body)
+                headers["X-Cache"] = "MISS"
+
+            return Response(body, media_type="application/json", headers=headers)
+
+        # FastAPI reads the parameters from the signature: the endpoint's,
+        # plus the request, to build the key
+        request = inspect.Parameter(
+            "cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+        )
+        wrapper.__signature__ = signature.replace(
+            parameters=[*signature.parameters.values(), request]
+        )
+        return wrapper
+
+    return decorator
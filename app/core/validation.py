@@ -0,0 +1,98 @@
+import enum
+import typing
+
+import numpy as np
+import pandas as pd
+from sqlmodel import SQLModel
+
+Range = tuple[float | None, float | None]  # inclusive bounds, None if open
+
+
+def _annotation(model: type[SQLModel], name: str) -> type:
+    annotation = model.model_fields[name].annotation
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    return args[0] if typing.get_origin(annotation) and len(args) == 1 else annotation
+
+
+class FrameValidator:
+    """
+    Validate a DataFrame against the fields of a model, one column at a
+    time, instead of building a model per row.
+
+    Integer, float, string and enum fields are checked and converted with
+    vectorized pandas operations, missing values are rejected for required
+    fields and numeric fields are checked against optional inclusive
+    ranges. Rows failing any check are split off with the reason of their
+    first failure.
+    """
+
+    def __init__(self, model: type[SQLModel], ranges: dict[str, Range] = None):
+        self.model = model
+        self.ranges = ranges or {}
+
+    def validate(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Split df into its valid rows, converted to the field types, and its
+        invalid rows as they were, with a "reason" column.
+        """
+        valid = pd.DataFrame(index=df.index)
+        reason = pd.Series(None, index=df.index, dtype=object)
+
+        for name in df.columns:
+            if name not in self.model.model_fields:
+                continue
+            values, problems = self._check(name, df[name])
+            valid[name] = values
+            for message, failed in problems:
+                reason = reason.mask(reason.isna() & failed, f"{name}: {message}")
+
+        failed = reason.notna()
+        invalid = df[failed].assign(reason=reason[failed])
+        ints = [name for name in valid if _annotation(self.model, name) is int]
+        valid = valid[~failed].astype(dict.fromkeys(ints, "int64"))
+        return valid, invalid
+
+    def _check(
+        self, name: str, column: pd.Series
+    ) -> tuple[pd.Series, list[tuple[str, pd.Series]]]:
+        """
+        Convert a column to its field type, returning the converted values
+        and a (message, failed rows) pair per check.
+        """
+        annotation = _annotation(self.model, name)
+        missing = column.isna()
+        problems = []
+        if self.model.model_fields[name].is_required():
+            problems.append(("missing value", missing))
+
+        if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+            members = {member.value: member for member in annotation}
+            values = column.map(members)
+            problems.append(
+                (f"not a valid {annotation.__name__}", values.isna() & ~missing)
+            )
+            return values, problems
+
+        if annotation is str:
+            if pd.api.types.is_string_dtype(column):  # every value is text
+                return column, problems
+            is_text = column.map(lambda value: isinstance(value, str))
+            problems.append(("not a string", ~is_text & ~missing))
+            return column, problems
+
+        if annotation in (int, float):
+            numbers = pd.to_numeric(column, errors="coerce")
+            problems.append(("not a number", numbers.isna() & ~missing))
+            if annotation is int:
+                fractional = numbers.notna() & (np.floor(numbers) != numbers)
+                problems.append(("not an integer", fractional))
+
+            low, high = self.ranges.get(name, (None, None))
+            if low is not None:
+                problems.append((f"less than {low}", numbers < low))
+            if high is not None:
+                problems.append((f"greater than {high}", numbers > high))
+
+            return numbers, problems
+
+        return column, problems
@@ -1,9 +1,13 @@
 from typing import Sequence
 
-from sqlmodel import Session, delete, func, select
+from sqlmodel import Session, func, select
 
-from app.exportation.models import Exportation, ExportationCreate
+from app.core.pagination import fetch_page, fetch_page_with_total
 from app.exportation.constants import Category
+from app.exportation.models import Exportation, ExportationCreate
+
+# Listing order, ending with the primary key so cursors are unique
+ORDER_BY = (Exportation.year.desc(), Exportation.country, Exportation.id)
 
 
 def create_exportation(session: Session, data: ExportationCreate) -> Exportation:
@@ -38,43 +42,55 @@ def count_exportation_by_category(session: Session, category: Category) -> int:
 
 
 def list_exportation(
-    session: Session, limit: int = None, offset: int = None
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
 ) -> Sequence[Exportation]:
     """
     Retrieve all exportation records from the database.
     """
-    statement = select(Exportation).order_by(
-        Exportation.year.desc(), Exportation.country
-    )
+    statement = select(Exportation)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    result = session.exec(statement)
-    return result.all()
+
+def list_exportation_with_total(
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
+) -> tuple[Sequence[Exportation], int]:
+    """
+    Retrieve a page of exportation records and their total, in one query.
+    """
+    statement = select(Exportation)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def list_exportation_by_category(
-    session: Session, category: Category, limit: int = None, offset: int = None
+    session: Session,
+    category: Category,
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
 ) -> Sequence[Exportation]:
     """
     Retrieve all exportation records from the database by category.
     """
-    statement = (
-        select(Exportation)
-        .where(Exportation.category == category)
-        .order_by(Exportation.year.desc(), Exportation.country)
-    )
+    statement = select(Exportation).where(Exportation.category == category)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    result = session.exec(statement)
-    return result.all()
+
+def list_exportation_by_category_with_total(
+    session: Session,
+    category: Category,
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
+) -> tuple[Sequence[Exportation], int]:
+    """
+    Retrieve a page of exportation records by category and their total, in one query.
+    """
+    statement = select(Exportation).where(Exportation.category == category)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def get_by_year_and_country_and_category(
@@ -89,11 +105,3 @@ def get_by_year_and_country_and_category(
         & (Exportation.category == category)
     )
     return session.exec(statement).first()
-
-
-def clear_exportation(session: Session) -> None:
-    """
-    Remove todos os registros da tabela Exportation.
-    """
-    session.exec(delete(Exportation))
-    session.commit()
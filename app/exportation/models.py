@@ -1,4 +1,6 @@
 from typing import Optional
+
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import SQLModel, Field
 
 from app.exportation.constants import Category
@@ -17,6 +19,21 @@ class ExportationBase(SQLModel):
 class Exportation(ExportationBase, table=True):
     """Database model representing the exportation table."""
 
+    __table_args__ = (
+        UniqueConstraint(
+            "year", "country", "category", name="uq_exportation_natural_key"
+        ),
+        # Match the listing order (crud.ORDER_BY) for cursor pagination
+        Index("ix_exportation_listing", text("year DESC"), "country", "id"),
+        Index(
+            "ix_exportation_category_listing",
+            "category",
+            text("year DESC"),
+            "country",
+            "id",
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
 
@@ -5,51 +5,76 @@ from app.auth.dependencies import get_current_active_user, get_current_superuser
 from app.auth.models import User
 from app.core.config import settings
 from app.core.database import get_session
+from app.core.counts import counts
 from app.core.pagination import PaginatedResponse
+from app.core.response_cache import cached_response
+from app.jobs.models import IngestionJobRead
+from app.jobs.worker import enqueue_reingest
 from app.exportation.constants import Category
 from app.exportation.crud import (
-    clear_exportation,
+    ORDER_BY,
     count_exportation,
     count_exportation_by_category,
     list_exportation,
+    list_exportation_with_total,
     list_exportation_by_category,
+    list_exportation_by_category_with_total,
 )
-from app.exportation.ingestor import ExportationIngestor
-from app.exportation.models import ExportationRead
+from app.exportation.models import Exportation, ExportationRead
 
 router = APIRouter()
 
 
 @router.get("/", response_model=PaginatedResponse[ExportationRead])
+@cached_response(Exportation)
 def read_all(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, read instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching rows, false to skip total"
+    ),
 ):
     """
     Endpoint to list all exportation records with pagination.
     """
-    offset = (page - 1) * per_page
+    offset = None if cursor else (page - 1) * per_page
 
-    # Get total count
-    total = count_exportation(session)
+    # Get total count, cached per dataset version
+    total = (
+        counts.get(session, Exportation, count_exportation) if include_total else None
+    )
 
-    # Get paginated data
-    data = list_exportation(session, per_page, offset)
+    # Get paginated data, counted in the same query if not cached
+    if include_total and total is None:
+        data, total = list_exportation_with_total(session, per_page + 1, offset, cursor)
+        counts.put(session, Exportation, count_exportation, total=total)
+    else:
+        data = list_exportation(session, per_page + 1, offset, cursor)
 
-    return PaginatedResponse.create(
-        data=data, total=total, page=page, per_page=per_page
+    return PaginatedResponse.from_rows(
+        data, total, page, per_page, order_by=ORDER_BY, cursor=cursor
     )
 
 
 @router.get("/{category}", response_model=PaginatedResponse[ExportationRead])
+@cached_response(Exportation)
 def read_by_category(
     category: Category,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, read instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching rows, false to skip total"
+    ),
 ):
     """
     Endpoint to list all exportation records by category with pagination.
@@ -59,26 +84,45 @@ def read_by_category(
     :param per_page: Items per page
     :return: Paginated list of exportation records
     """
-    offset = (page - 1) * per_page
+    offset = None if cursor else (page - 1) * per_page
 
-    # Get total count
-    total = count_exportation_by_category(session, category)
+    # Get total count, cached per dataset version
+    total = (
+        counts.get(session, Exportation, count_exportation_by_category, category)
+        if include_total
+        else None
+    )
 
-    # Get paginated data
-    data = list_exportation_by_category(session, category, per_page, offset)
+    # Get paginated data, counted in the same query if not cached
+    if include_total and total is None:
+        data, total = list_exportation_by_category_with_total(
+            session, category, per_page + 1, offset, cursor
+        )
+        counts.put(
+            session, Exportation, count_exportation_by_category, category, total=total
+        )
+    else:
+        data = list_exportation_by_category(
+            session, category, per_page + 1, offset, cursor
+        )
 
-    return PaginatedResponse.create(
-        data=data, total=total, page=page, per_page=per_page
+    return PaginatedResponse.from_rows(
+        data, total, page, per_page, order_by=ORDER_BY, cursor=cursor
     )
 
 
-@router.post("/reingest")
+@router.post(
+    "/reingest",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=IngestionJobRead,
+)
 def reingest(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_superuser),
 ):
     """
-    Endpoint to force re-ingestion of exportation data from source files.
+    Endpoint to queue a re-ingestion of exportation data from source files.
+    Returns the job at once, poll /api/v1/jobs/{id} for its progress.
     Requires superuser authentication and ALLOW_REINGEST=true in environment.
     """
     if not settings.ALLOW_REINGEST:
@@ -86,6 +130,5 @@ def reingest(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Reingestion is not allowed in this environment.",
         )
-    clear_exportation(session)
-    ExportationIngestor().ingest(session=session)
-    return {"detail": "Reingestion completed successfully"}
+    job = enqueue_reingest(session, "exportation")
+    return IngestionJobRead.from_job(job)
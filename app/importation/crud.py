@@ -1,10 +1,14 @@
 from typing import Sequence
 
-from sqlmodel import Session, delete, func, select
+from sqlmodel import Session, func, select
 
+from app.core.pagination import fetch_page, fetch_page_with_total
 from app.importation.constants import Category
 from app.importation.models import Importation, ImportationCreate
 
+# Listing order, ending with the primary key so cursors are unique
+ORDER_BY = (Importation.year.desc(), Importation.country, Importation.id)
+
 
 def create_importation(session: Session, data: ImportationCreate) -> Importation:
     """
@@ -38,43 +42,55 @@ def count_importation_by_category(session: Session, category: Category) -> int:
 
 
 def list_importation(
-    session: Session, limit: int = None, offset: int = None
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
 ) -> Sequence[Importation]:
     """
     Retrieve all importation records from the database.
     """
-    statement = select(Importation).order_by(
-        Importation.year.desc(), Importation.country
-    )
+    statement = select(Importation)
+
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
+
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
+def list_importation_with_total(
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
+) -> tuple[Sequence[Importation], int]:
+    """
+    Retrieve a page of importation records and their total, in one query.
+    """
+    statement = select(Importation)
 
-    result = session.execute(statement)
-    return result.scalars().all()
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def list_importation_by_category(
-    session: Session, category: Category, limit: int = None, offset: int = None
+    session: Session,
+    category: Category,
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
 ) -> Sequence[Importation]:
     """
     Retrieve all importation records from the database by category.
     """
-    statement = (
-        select(Importation)
-        .where(Importation.category == category)
-        .order_by(Importation.year.desc(), Importation.country)
-    )
+    statement = select(Importation).where(Importation.category == category)
+
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
 
-    result = session.execute(statement)
-    return result.scalars().all()
+def list_importation_by_category_with_total(
+    session: Session,
+    category: Category,
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
+) -> tuple[Sequence[Importation], int]:
+    """
+    Retrieve a page of importation records by category and their total, in one query.
+    """
+    statement = select(Importation).where(Importation.category == category)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def get_by_year_and_country_and_category(
@@ -89,11 +105,3 @@ def get_by_year_and_country_and_category(
         & (Importation.category == category)
     )
     return session.exec(statement).first()
-
-
-def clear_importation(session: Session) -> None:
-    """
-    Remove todos os registros da tabela Importation.
-    """
-    session.exec(delete(Importation))
-    session.commit()
@@ -3,17 +3,14 @@ import logging
 import pandas as pd
 from sqlmodel import Session
 
-from app.core.base_ingestor import EmbrapaBaseIngestor
+from app.core.base_ingestor import EmbrapaBaseIngestor, LoadResult
+from app.core.parsing import to_number
 from app.importation.constants import (
     CATEGORY_MAPPING,
     IMPORTATION_PATHS,
     INVALID_VALUES,
 )
-from app.importation.crud import (
-    create_importation,
-    get_by_year_and_country_and_category,
-)
-from app.importation.models import ImportationCreate
+from app.importation.models import Importation, ImportationCreate
 
 logger = logging.getLogger(__name__)
 
@@ -21,42 +18,31 @@ logger = logging.getLogger(__name__)
 class ImportationIngestor(EmbrapaBaseIngestor):
     PATHS = IMPORTATION_PATHS
 
-    def ingest(self, session: Session):
-        n_inserts = n_skipped = 0
-
-        for path in self.PATHS:
-            self.CSV_PATH = path
-            category = CATEGORY_MAPPING[path]
-            separator = ";" if "ImpSuco" in path else "\t"
-
-            df = self.fetch_csv(path, separator)
-            melted = self._prepare_dataframe(df, category)
-
-            for _, row in melted.iterrows():
-                if get_by_year_and_country_and_category(
-                    session,
-                    row["year"],
-                    row["country"],
-                    row["category"],
-                ):
-                    n_skipped += 1
-                    continue
-
-                try:
-                    data = ImportationCreate(
-                        year=row["year"],
-                        country=row["country"],
-                        quantity_kg=row["quantity_kg"],
-                        category=row["category"],
-                    )
-                    create_importation(session, data)
-                    n_inserts += 1
-                except Exception as e:
-                    logger.warning(f"Error inserting row — {row.to_dict()} — {e}")
-
-        logger.info(
-            f"Importation ingestion complete: {n_inserts} inserted, {n_skipped} skipped."
-        )
+    MODEL = Importation
+    CREATE_MODEL = ImportationCreate
+    NATURAL_KEY = ("year", "country", "category")
+    RANGES = {**EmbrapaBaseIngestor.RANGES, "quantity_kg": (0, None)}
+
+    def ingest(self, session: Session) -> LoadResult:
+        result = LoadResult()
+
+        try:
+            for path, df in self.fetch_frames(session, self.PATHS):
+                result += self.bulk_load(session, df, update=True, source=path)
+
+            self.commit(session)
+        except Exception:
+            self.rollback(session)
+            raise
+
+        logger.info(f"Importation ingestion complete: {self.summary(result)}.")
+        return result
+
+    def separator(self, path: str) -> str:
+        return ";" if "ImpSuco" in path else "\t"
+
+    def transform(self, df: pd.DataFrame, path: str) -> pd.DataFrame:
+        return self._prepare_dataframe(df, CATEGORY_MAPPING[path])
 
     def _prepare_dataframe(self, df: pd.DataFrame, category: str) -> pd.DataFrame:
         df = df.drop(columns=["Id"], errors="ignore")
@@ -72,16 +58,10 @@ class ImportationIngestor(EmbrapaBaseIngestor):
         df = df.dropna(subset=["year", "quantity_kg"])
         df["year"] = df["year"].astype(int)
 
-        df["quantity_kg"] = (
-            df["quantity_kg"]
-            .astype(str)
-            .str.lower()
-            .str.replace(",", ".", regex=False)
-            .apply(lambda x: x if x not in INVALID_VALUES else "0")
-            .astype(float)
-            .round()
-            .astype(int)
-        )
+        # Unparseable quantities become NaN and are quarantined by bulk_load
+        df["quantity_kg"] = to_number(
+            df["quantity_kg"], INVALID_VALUES, errors="coerce"
+        ).round()
 
         df = df.rename(columns={"País": "country"})
         df["category"] = category
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field, SQLModel
 
 from app.importation.constants import Category
@@ -17,6 +18,21 @@ class ImportationBase(SQLModel):
 class Importation(ImportationBase, table=True):
     """Database model representing the importation table."""
 
+    __table_args__ = (
+        UniqueConstraint(
+            "year", "country", "category", name="uq_importation_natural_key"
+        ),
+        # Match the listing order (crud.ORDER_BY) for cursor pagination
+        Index("ix_importation_listing", text("year DESC"), "country", "id"),
+        Index(
+            "ix_importation_category_listing",
+            "category",
+            text("year DESC"),
+            "country",
+            "id",
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
 
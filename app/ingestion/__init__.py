@@ -0,0 +1 @@
+# Ingestion bookkeeping module
@@ -0,0 +1,130 @@
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+import pandas as pd
+from sqlmodel import Session, func, insert, select
+
+from app.ingestion.models import (
+    DatasetVersion,
+    IngestionRun,
+    IngestionState,
+    QuarantinedRow,
+)
+
+
+def get_ingestion_state(session: Session, source: str) -> Optional[IngestionState]:
+    """
+    Get the state recorded for a source file, if it was ever loaded.
+    """
+    return session.get(IngestionState, source)
+
+
+def save_ingestion_state(
+    session: Session, source: str, sha256: str, row_count: int
+) -> IngestionState:
+    """
+    Record the hash and row count of a loaded source file.
+    The caller owns the transaction, so the state commits with the data.
+    """
+    state = session.get(IngestionState, source) or IngestionState(source=source)
+    state.sha256 = sha256
+    state.row_count = row_count
+    state.updated_at = datetime.now(timezone.utc)
+    session.add(state)
+    return state
+
+
+def get_dataset_versions(session: Session) -> dict[str, int]:
+    """
+    Current version of every data table that was ever ingested.
+    """
+    statement = select(DatasetVersion.table_name, DatasetVersion.version)
+    return dict(session.exec(statement).all())
+
+
+def bump_dataset_version(session: Session, table_name: str) -> DatasetVersion:
+    """
+    Record that the rows of a table changed.
+    The caller owns the transaction, so the version commits with the data.
+    """
+    dataset = session.get(DatasetVersion, table_name)
+    if dataset is None:
+        dataset = DatasetVersion(table_name=table_name, version=1)
+    else:
+        # Incremented in SQL, so concurrent ingests each get their own version
+        dataset.version = DatasetVersion.version + 1
+    dataset.updated_at = datetime.now(timezone.utc)
+    session.add(dataset)
+    return dataset
+
+
+def quarantine_rows(
+    session: Session, table_name: str, source: Optional[str], rows: pd.DataFrame
+) -> int:
+    """
+    Store rejected rows, with a "reason" column, in one bulk insert.
+    The caller owns the transaction, so they commit with the ingest.
+    """
+    if rows.empty:
+        return 0
+
+    data = rows.drop(columns="reason").to_json(
+        orient="records", lines=True, force_ascii=False
+    )
+    now = datetime.now(timezone.utc)
+    session.exec(
+        insert(QuarantinedRow),
+        params=[
+            {
+                "table_name": table_name,
+                "source": source,
+                "data": row,
+                "reason": reason,
+                "created_at": now,
+            }
+            for row, reason in zip(
+                data.rstrip("\n").split("\n"), rows["reason"], strict=True
+            )
+        ],
+    )
+    return len(rows)
+
+
+def save_run(session: Session, run: IngestionRun) -> IngestionRun:
+    """
+    Record a finished ingest run in the ledger.
+    """
+    session.add(run)
+    session.commit()
+    session.refresh(run)
+    return run
+
+
+def list_runs(
+    session: Session, source: str = None, limit: int = None, offset: int = None
+) -> Sequence[IngestionRun]:
+    """
+    Retrieve ingest runs, most recent first, optionally for one domain.
+    """
+    statement = select(IngestionRun).order_by(
+        IngestionRun.started_at.desc(), IngestionRun.id.desc()
+    )
+    if source:
+        statement = statement.where(IngestionRun.source == source)
+
+    if offset:
+        statement = statement.offset(offset)
+    if limit:
+        statement = statement.limit(limit)
+
+    return session.exec(statement).all()
+
+
+def count_runs(session: Session, source: str = None) -> int:
+    """
+    Count ingest runs, optionally for one domain.
+    """
+    statement = select(func.count()).select_from(IngestionRun)
+    if source:
+        statement = statement.where(IngestionRun.source == source)
+    return session.exec(statement).one()
@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class IngestionState(SQLModel, table=True):
+    """Last successfully loaded version of each source file."""
+
+    __tablename__ = "ingestion_state"
+
+    source: str = Field(primary_key=True)
+    sha256: str
+    row_count: int
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class DatasetVersion(SQLModel, table=True):
+    """Version of each data table, bumped by every ingest that changes it."""
+
+    __tablename__ = "dataset_version"
+
+    table_name: str = Field(primary_key=True)
+    version: int = 0
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class QuarantinedRow(SQLModel, table=True):
+    """Source row rejected by ingest validation, kept for inspection."""
+
+    __tablename__ = "ingestion_quarantine"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    table_name: str = Field(index=True)  # table the row was meant for
+    source: Optional[str] = Field(default=None, index=True)  # source file path
+    data: str  # the row as JSON, before conversion
+    reason: str  # first failed check, e.g. "year: not a number"
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class IngestionRunBase(SQLModel):
+    """Base model defining the timings and counters of an ingest run."""
+
+    source: str = Field(index=True)
+    started_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), index=True
+    )
+    duration_seconds: float = 0.0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    transform_seconds: float = 0.0
+    load_seconds: float = 0.0
+    commit_seconds: float = 0.0
+    bytes_downloaded: int = 0
+    files_loaded: int = 0
+    files_skipped: int = 0
+    rows_inserted: int = 0
+    rows_skipped: int = 0
+    row_errors: int = 0
+    rows_per_second: float = 0.0
+    peak_rss_mb: float = 0.0
+    error: Optional[str] = None  # set when the run failed
+    manifest: Optional[str] = None  # archived source files, to replay the run
+
+
+class IngestionRun(IngestionRunBase, table=True):
+    """Ledger of ingest runs, one row per domain ingest."""
+
+    __tablename__ = "ingestion_run"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+
+class IngestionRunRead(IngestionRunBase):
+    """Model used for reading ingest runs."""
+
+    id: int
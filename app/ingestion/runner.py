@@ -0,0 +1,212 @@
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from sqlmodel import Session
+
+from app.commercialization.ingestor import CommercializationIngestor
+from app.core.archive import Manifest, SourceArchive
+from app.core.base_ingestor import EmbrapaBaseIngestor, LoadResult
+from app.core.config import settings
+from app.core.database import create_db_engine, is_sqlite
+from app.core.memory import peak_rss_mb
+from app.exportation.ingestor import ExportationIngestor
+from app.importation.ingestor import ImportationIngestor
+from app.ingestion.crud import save_run
+from app.ingestion.models import IngestionRun
+from app.processing.ingestor import ProcessingIngestor
+from app.production.ingestor import ProductionIngestor
+
+logger = logging.getLogger(__name__)
+
+INGESTORS: dict[str, type[EmbrapaBaseIngestor]] = {
+    "production": ProductionIngestor,
+    "processing": ProcessingIngestor,
+    "commercialization": CommercializationIngestor,
+    "importation": ImportationIngestor,
+    "exportation": ExportationIngestor,
+}
+
+
+@dataclass
+class IngestionReport:
+    """
+    Outcome of one domain ingest.
+    """
+
+    source: str
+    seconds: float
+    inserted: int = 0
+    skipped: int = 0
+    errors: int = 0
+    peak_rss_mb: float = 0.0
+    manifest: str | None = None  # archived source files of the run
+    error: str | None = None  # set when the ingest failed
+
+    @property
+    def rows(self) -> int:
+        return self.inserted + self.skipped
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def parse_sources(value: str) -> list[str]:
+    """
+    Expand 'all' or a comma-separated list of domains, in INGESTORS order.
+    """
+    if value.strip() == "all":
+        return list(INGESTORS)
+
+    sources = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in sources if name not in INGESTORS]
+    if unknown or not sources:
+        invalid = ", ".join(unknown) or repr(value)
+        raise ValueError(
+            f"Unsupported source: {invalid}. "
+            f"Choose from: all, {', '.join(INGESTORS)}"
+        )
+    return list(dict.fromkeys(sources))
+
+
+def ingest_recorded(
+    session: Session, source: str, ingestor: EmbrapaBaseIngestor
+) -> LoadResult:
+    """
+    Run an ingest and record its stage timings and counters in the
+    ingestion_run ledger, whether it succeeds or fails. A failed run is
+    recorded after the ingest transaction was rolled back, and a failure to
+    write the ledger is logged without failing the ingest.
+    """
+    run = IngestionRun(source=source)
+    result = LoadResult()
+    started = time.perf_counter()
+    try:
+        result = ingestor.ingest(session)
+        return result
+    except Exception as e:
+        run.error = repr(e)
+        raise
+    finally:
+        run.duration_seconds = time.perf_counter() - started
+        _record_run(session, run, ingestor, result)
+
+
+def _record_run(
+    session: Session,
+    run: IngestionRun,
+    ingestor: EmbrapaBaseIngestor,
+    result: LoadResult,
+) -> None:
+    try:
+        metrics = ingestor.metrics
+        for stage, seconds in metrics.seconds.items():
+            setattr(run, f"{stage}_seconds", seconds)
+        run.bytes_downloaded = metrics.bytes_downloaded
+        run.files_loaded = metrics.files_loaded
+        run.files_skipped = metrics.files_skipped
+        run.rows_inserted = result.inserted
+        run.rows_skipped = result.skipped
+        run.row_errors = result.errors
+        run.peak_rss_mb = result.peak_rss_mb or peak_rss_mb()
+        run.manifest = ingestor.manifest_id
+        if run.duration_seconds:
+            run.rows_per_second = (
+                result.inserted + result.skipped
+            ) / run.duration_seconds
+        save_run(session, run)
+    except Exception:
+        session.rollback()
+        logger.exception(f"Unable to record the {run.source} ingest run")
+
+
+def load_manifest(manifest_id: str) -> tuple[str, Manifest]:
+    """
+    Read an archived run manifest and find the domain it belongs to.
+    """
+    manifest = SourceArchive().load_manifest(manifest_id)
+    for source, ingestor in INGESTORS.items():
+        if ingestor.__name__ == manifest.ingestor:
+            return source, manifest
+    raise ValueError(f"Unknown ingestor in manifest {manifest_id}: {manifest.ingestor}")
+
+
+def run_ingestor(
+    source: str,
+    force: bool = False,
+    database_url: str = None,
+    replace: bool = False,
+    manifest_id: str = None,
+) -> IngestionReport:
+    """
+    Ingest one domain with its own engine and session, so it can run in a
+    worker process. Failures are reported instead of raised. With replace,
+    the table is rebuilt and swapped in atomically. With a manifest id, the
+    archived files of that run are replayed instead of fetched.
+    """
+    engine = create_db_engine(database_url)
+    started = time.perf_counter()
+    try:
+        manifest = load_manifest(manifest_id)[1] if manifest_id else None
+        with Session(engine) as session:
+            ingestor = INGESTORS[source](
+                force=force, replace=replace, manifest=manifest
+            )
+            result = ingest_recorded(session, source, ingestor)
+    except Exception as e:
+        logger.exception(f"Ingestion of {source} failed")
+        return IngestionReport(
+            source=source, seconds=time.perf_counter() - started, error=repr(e)
+        )
+    finally:
+        engine.dispose()
+
+    return IngestionReport(
+        source=source,
+        seconds=time.perf_counter() - started,
+        inserted=result.inserted,
+        skipped=result.skipped,
+        errors=result.errors,
+        peak_rss_mb=result.peak_rss_mb,
+        manifest=ingestor.manifest_id,
+    )
+
+
+def run_ingestors(
+    sources: list[str],
+    force: bool = False,
+    database_url: str = None,
+    replace: bool = False,
+) -> list[IngestionReport]:
+    """
+    Ingest several domains in parallel, one worker process each, and return
+    their reports in the given order. A single domain runs in-process, and
+    so do several on SQLite, one after another: it allows a single writer,
+    so concurrent ingests would fail on its lock.
+    """
+    if len(sources) == 1 or is_sqlite(database_url or settings.DATABASE_URL):
+        return [
+            run_ingestor(source, force, database_url, replace) for source in sources
+        ]
+
+    reports = {}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=len(sources)) as pool:
+        futures = {
+            pool.submit(run_ingestor, source, force, database_url, replace): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                reports[source] = future.result()
+            except Exception as e:  # the worker process itself died
+                reports[source] = IngestionReport(
+                    source=source,
+                    seconds=time.perf_counter() - started,
+                    error=repr(e),
+                )
+
+    return [reports[source] for source in sources]
@@ -0,0 +1,177 @@
+import fcntl
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from sqlalchemy import Engine, text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.ingestion.runner import INGESTORS
+from app.jobs.crud import create_job
+from app.jobs.models import JobStatus
+from app.jobs.worker import run_job
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL advisory lock key held by the running scheduler
+LOCK_KEY = 0x656D6272
+
+
+class SchedulerLocked(RuntimeError):
+    """Another scheduler instance is already running."""
+
+
+@dataclass
+class Schedule:
+    """
+    Refresh state of one domain.
+    """
+
+    source: str
+    interval: float  # seconds between successful refreshes
+    next_run: float = 0.0  # clock time of the next refresh
+    failures: int = 0  # consecutive failed refreshes
+
+
+def parse_intervals(value: str) -> dict[str, float]:
+    """
+    Parse per-domain intervals in seconds, e.g. "production=3600,exportation=86400".
+    """
+    intervals = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        source, _, seconds = item.partition("=")
+        source = source.strip()
+        if source not in INGESTORS:
+            raise ValueError(f"Unsupported source in schedule: {source!r}")
+        try:
+            intervals[source] = float(seconds)
+        except ValueError:
+            raise ValueError(f"Invalid interval for {source}: {seconds!r}") from None
+    return intervals
+
+
+class Scheduler:
+    """
+    Refresh domains on their own interval, one at a time, so refreshes
+    never overlap or hit the database together.
+
+    Every delay is randomized by +/- jitter (a fraction of the delay). A
+    failed refresh is retried after an exponential backoff, capped at
+    backoff_max, until it succeeds and the regular interval resumes.
+    """
+
+    def __init__(
+        self,
+        schedules: list[Schedule],
+        refresh: Callable[[str], bool],
+        jitter: float = settings.SCHEDULE_JITTER,
+        backoff: float = settings.SCHEDULE_BACKOFF,
+        backoff_max: float = settings.SCHEDULE_BACKOFF_MAX,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random = None,
+    ):
+        self.schedules = schedules
+        self.refresh = refresh  # returns whether the refresh succeeded
+        self.jitter = jitter
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        # Every domain is due at start, in the given order
+        for schedule in schedules:
+            schedule.next_run = clock()
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Refresh domains as they fall due until stop is set. A refresh in
+        progress is always finished first.
+        """
+        while not stop.is_set():
+            self.run_pending()
+            wait = min(schedule.next_run for schedule in self.schedules)
+            stop.wait(max(0.0, wait - self.clock()))
+
+    def run_pending(self) -> list[Schedule]:
+        """
+        Refresh every domain that is due, earliest first, and return them.
+        """
+        due = [s for s in self.schedules if s.next_run <= self.clock()]
+        for schedule in sorted(due, key=lambda s: s.next_run):
+            try:
+                succeeded = self.refresh(schedule.source)
+            except Exception:
+                logger.exception(f"Refresh of {schedule.source} failed")
+                succeeded = False
+            self._reschedule(schedule, succeeded)
+        return due
+
+    def _reschedule(self, schedule: Schedule, succeeded: bool) -> None:
+        if succeeded:
+            schedule.failures = 0
+            delay = schedule.interval
+        else:
+            schedule.failures += 1
+            delay = min(self.backoff * 2 ** (schedule.failures - 1), self.backoff_max)
+
+        delay *= 1 + self.rng.uniform(-self.jitter, self.jitter)
+        schedule.next_run = self.clock() + delay
+        logger.info(
+            f"Next refresh of {schedule.source} in {delay:.0f}s"
+            + (f" (attempt {schedule.failures + 1})" if schedule.failures else "")
+        )
+
+
+def refresh_source(engine: Engine, source: str) -> bool:
+    """
+    Load the files of a domain that changed upstream, overwriting revised
+    values, as an ingestion job, so it never overlaps a reingest of the
+    same domain requested through the API. A domain with a job already
+    active is left to that job.
+    """
+    with Session(engine) as session:
+        job, created = create_job(session, source)
+    if not created:
+        logger.info(f"Skipping {source}: job {job.id} is already {job.status.value}")
+        return True
+
+    return run_job(job.id, engine, replace=False) == JobStatus.SUCCEEDED
+
+
+@contextmanager
+def instance_lock(engine: Engine) -> Iterator[None]:
+    """
+    Hold the scheduler lock for the life of the block, or raise
+    SchedulerLocked. On PostgreSQL this is a session advisory lock, shared
+    by every replica using the database; elsewhere a lock file on the host.
+    """
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            locked = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": LOCK_KEY}
+            ).scalar()
+            if not locked:
+                raise SchedulerLocked("Another ingest daemon holds the lock")
+            try:
+                yield
+            finally:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": LOCK_KEY}
+                )
+        return
+
+    with open(settings.SCHEDULER_LOCK_FILE, "a") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise SchedulerLocked(
+                f"Another ingest daemon holds {settings.SCHEDULER_LOCK_FILE}"
+            ) from None
+        yield
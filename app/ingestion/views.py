@@ -0,0 +1,33 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from app.auth.dependencies import get_current_superuser
+from app.auth.models import User
+from app.core.database import get_session
+from app.core.pagination import PaginatedResponse
+from app.ingestion.crud import count_runs, list_runs
+from app.ingestion.models import IngestionRunRead
+
+router = APIRouter()
+
+
+@router.get("/runs", response_model=PaginatedResponse[IngestionRunRead])
+def read_runs(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_superuser),
+    source: Optional[str] = Query(None, description="Only runs of this domain"),
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+):
+    """
+    Endpoint to list ingest runs with their stage timings, most recent first.
+    """
+    offset = (page - 1) * per_page
+    total = count_runs(session, source)
+    data = list_runs(session, source, per_page, offset)
+
+    return PaginatedResponse.create(
+        data=data, total=total, page=page, per_page=per_page
+    )
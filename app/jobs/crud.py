@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.jobs.models import IngestionJob, JobStatus, as_utc
+
+
+def get_job(session: Session, job_id: int) -> Optional[IngestionJob]:
+    """
+    Get a job by id.
+    """
+    return session.get(IngestionJob, job_id)
+
+
+def get_active_job(session: Session, source: str) -> Optional[IngestionJob]:
+    """
+    Get the queued or running job of a domain, if any.
+    """
+    statement = select(IngestionJob).where(IngestionJob.active_source == source)
+    return session.exec(statement).first()
+
+
+def update_job(session: Session, job: IngestionJob, **fields) -> IngestionJob:
+    """
+    Update job fields and commit, refreshing its heartbeat.
+    """
+    for name, value in fields.items():
+        setattr(job, name, value)
+    job.updated_at = datetime.now(timezone.utc)
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def finish_job(session: Session, job: IngestionJob, error: str = None) -> IngestionJob:
+    """
+    Mark a job as succeeded, or failed with the given error, and release
+    its domain for new jobs.
+    """
+    return update_job(
+        session,
+        job,
+        status=JobStatus.FAILED if error else JobStatus.SUCCEEDED,
+        stage="failed" if error else "done",
+        error=error,
+        active_source=None,
+        finished_at=datetime.now(timezone.utc),
+    )
+
+
+def create_job(session: Session, source: str) -> tuple[IngestionJob, bool]:
+    """
+    Create a queued job for a domain, or return the job already active for
+    it. Returns (job, created). An active job whose worker has not reported
+    for JOB_STALE_AFTER seconds is failed and replaced.
+    """
+    active = get_active_job(session, source)
+    if active:
+        silence = datetime.now(timezone.utc) - as_utc(active.updated_at)
+        if silence < timedelta(seconds=settings.JOB_STALE_AFTER):
+            return active, False
+        finish_job(session, active, error="Worker stopped reporting progress")
+
+    job = IngestionJob(source=source, active_source=source)
+    session.add(job)
+    try:
+        session.commit()
+    except IntegrityError:  # another request created it concurrently
+        session.rollback()
+        return get_active_job(session, source), False
+
+    session.refresh(job)
+    return job, True
@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+def as_utc(value: datetime) -> datetime:
+    """SQLite returns naive datetimes, which are stored in UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class IngestionJob(SQLModel, table=True):
+    """Reingest of one domain, run by a background worker process."""
+
+    __tablename__ = "ingestion_job"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    source: str = Field(index=True)
+    status: JobStatus = JobStatus.QUEUED
+    stage: str = "queued"
+    rows_processed: int = 0
+    error: Optional[str] = None
+    # Set to the source while the job is queued or running, so the unique
+    # constraint allows at most one active job per domain
+    active_source: Optional[str] = Field(default=None, unique=True)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def elapsed_seconds(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        finished = self.finished_at or datetime.now(timezone.utc)
+        return (as_utc(finished) - as_utc(self.started_at)).total_seconds()
+
+
+class IngestionJobRead(SQLModel):
+    """Model used for reading job status."""
+
+    id: int
+    source: str
+    status: JobStatus
+    stage: str
+    rows_processed: int
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    elapsed_seconds: Optional[float]
+
+    @classmethod
+    def from_job(cls, job: IngestionJob) -> "IngestionJobRead":
+        return cls.model_validate(job, update={"elapsed_seconds": job.elapsed_seconds})
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import Session
+
+from app.auth.dependencies import get_current_superuser
+from app.auth.models import User
+from app.core.database import get_session
+from app.jobs.crud import get_job
+from app.jobs.models import IngestionJobRead
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=IngestionJobRead)
+def read_job(
+    job_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_superuser),
+):
+    """
+    Endpoint to check the status and progress of a background job.
+    """
+    job = get_job(session, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+    return IngestionJobRead.from_job(job)
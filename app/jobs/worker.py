@@ -0,0 +1,111 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import create_db_engine
+from app.ingestion.runner import INGESTORS, ingest_recorded
+from app.jobs.crud import create_job, finish_job, update_job
+from app.jobs.models import IngestionJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()  # sync routes run in a threadpool
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    Worker pool shared by the API process. Workers are spawned rather than
+    forked, so they never inherit the server's threads or open connections.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.JOB_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def enqueue_reingest(session: Session, source: str) -> IngestionJob:
+    """
+    Queue a reingest of a domain and return its job. If the domain already
+    has a queued or running job, that job is returned instead.
+    """
+    job, created = create_job(session, source)
+    if created:
+        try:
+            get_executor().submit(run_job, job.id)
+        except Exception as e:
+            logger.exception(f"Unable to start job {job.id}")
+            finish_job(session, job, error=repr(e))
+    return job
+
+
+def run_job(job_id: int, engine: Engine = None, replace: bool = True) -> JobStatus:
+    """
+    Reload the domain of a job into a shadow table and swap it in, recording
+    its progress, and return its final status. Runs in a worker process,
+    with its own engine unless one is given. Readers keep seeing the
+    previous data until the swap commits. Without replace, only files that
+    changed upstream are loaded, in place.
+
+    Progress is recorded on a best-effort basis: on SQLite the ingest
+    transaction holds the only write lock, so progress writes fail until it
+    commits. After a failed write, progress is no longer recorded for the
+    run, and the ingest goes on.
+    """
+    owned = engine is None
+    engine = engine or create_db_engine()
+
+    # The job row is updated from its own session, so progress is visible
+    # while the ingest transaction is still open
+    with Session(engine) as job_session, Session(engine) as session:
+        job = job_session.get(IngestionJob, job_id)
+        update_job(
+            job_session,
+            job,
+            status=JobStatus.RUNNING,
+            stage="starting",
+            started_at=datetime.now(timezone.utc),
+        )
+
+        reporting = True
+
+        def progress(stage: str, rows: int) -> None:
+            nonlocal reporting
+            if not reporting:
+                return
+            try:
+                update_job(job_session, job, stage=stage, rows_processed=rows)
+            except Exception:
+                job_session.rollback()
+                reporting = False
+                logger.warning(
+                    f"Unable to record the progress of job {job_id}, "
+                    f"continuing without it",
+                    exc_info=True,
+                )
+
+        try:
+            ingestor = INGESTORS[job.source](replace=replace, progress=progress)
+            ingest_recorded(session, job.source, ingestor)
+        except Exception as e:
+            logger.exception(f"Job {job_id} ({job.source}) failed")
+            job_session.rollback()
+            job_session.refresh(job)
+            finish_job(job_session, job, error=repr(e))
+        else:
+            finish_job(job_session, job)
+        status = job.status
+
+    if owned:
+        engine.dispose()
+    return status
@@ -1,15 +1,27 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 
 from app.auth import views as auth_views
 from app.commercialization import views as commercialization_views
 from app.core import public as public_views
+from app.core.pagination import InvalidCursor
 from app.exportation import views as exportation_views
 from app.importation import views as importation_views
+from app.ingestion import views as ingestion_views
+from app.jobs import views as jobs_views
 from app.processing import views as processing_views
 from app.production import views as production_views
 
 app = FastAPI(title="Embrapa Vitiviniculture API")
 
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)}
+    )
+
+
 # Public routes (no authentication required)
 app.include_router(public_views.router, prefix="", tags=["Public"])
 
@@ -36,3 +48,9 @@ app.include_router(
 app.include_router(
     exportation_views.router, prefix="/api/v1/exportation", tags=["Exportation"]
 )
+
+app.include_router(jobs_views.router, prefix="/api/v1/jobs", tags=["Jobs"])
+
+app.include_router(
+    ingestion_views.router, prefix="/api/v1/ingestion", tags=["Ingestion"]
+)
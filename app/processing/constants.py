@@ -13,3 +13,6 @@ class Subcategory(str, Enum):
     BRANCAS = "brancas"
     BRANCAS_E_ROSADAS = "brancas-e-rosadas"
     NONE = "none"
+
+
+INVALID_VALUES = {"nd", "+", "*"}
@@ -1,21 +1,19 @@
 from typing import Sequence
 
-from sqlmodel import Session, delete, func, select
+from sqlmodel import Session, func, select
 
+from app.core.pagination import fetch_page, fetch_page_with_total
 from app.processing.constants import Category, Subcategory
 from app.processing.models import Processing, ProcessingCreate
 
-
-def _default_order_by():
-    """
-    Default order by clause for processing records.
-    """
-    return (
-        Processing.year.desc(),
-        Processing.category,
-        Processing.subcategory,
-        Processing.cultivate,
-    )
+# Listing order, ending with the primary key so cursors are unique
+ORDER_BY = (
+    Processing.year.desc(),
+    Processing.category,
+    Processing.subcategory,
+    Processing.cultivate,
+    Processing.id,
+)
 
 
 def create_processing(session: Session, data: ProcessingCreate) -> Processing:
@@ -30,20 +28,25 @@ def create_processing(session: Session, data: ProcessingCreate) -> Processing:
 
 
 def list_processing(
-    session: Session, limit: int = None, offset: int = None
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
 ) -> Sequence[Processing]:
     """
     Retrieve all processing records from the database.
     """
-    statement = select(Processing).order_by(*_default_order_by())
+    statement = select(Processing)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    result = session.exec(statement)
-    return result.all()
+
+def list_processing_with_total(
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
+) -> tuple[Sequence[Processing], int]:
+    """
+    Retrieve a page of processing records and their total, in one query.
+    """
+    statement = select(Processing)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def list_processing_by_category(
@@ -52,6 +55,7 @@ def list_processing_by_category(
     subcategory: Subcategory = None,
     limit: int = None,
     offset: int = None,
+    cursor: str = None,
 ) -> Sequence[Processing]:
     """
     Retrieve all processing records from the database by path.
@@ -60,15 +64,25 @@ def list_processing_by_category(
     if subcategory:
         statement = statement.where(Processing.subcategory == subcategory)
 
-    statement = statement.order_by(*_default_order_by())
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
 
-    result = session.exec(statement)
-    return result.all()
+def list_processing_by_category_with_total(
+    session: Session,
+    category: Category,
+    subcategory: Subcategory = None,
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
+) -> tuple[Sequence[Processing], int]:
+    """
+    Retrieve a page of processing records by path and their total, in one query.
+    """
+    statement = select(Processing).where(Processing.category == category)
+    if subcategory:
+        statement = statement.where(Processing.subcategory == subcategory)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def get_by_year_and_cultivate_and_category(
@@ -87,14 +101,6 @@ def get_by_year_and_cultivate_and_category(
     return session.exec(statement).first()
 
 
-def clear_processing(session: Session) -> None:
-    """
-    Remove todos os registros da tabela processing.
-    """
-    session.exec(delete(Processing))
-    session.commit()
-
-
 def count_processing(session: Session) -> int:
     """
     Count total processing records in the database.
@@ -3,18 +3,21 @@ import logging
 import pandas as pd
 from sqlmodel import Session
 
-from app.core.base_ingestor import EmbrapaBaseIngestor
-from app.processing.constants import Category, Subcategory
-from app.processing.crud import (
-    create_processing,
-    get_by_year_and_cultivate_and_category,
-)
-from app.processing.models import ProcessingCreate
+from app.core.base_ingestor import EmbrapaBaseIngestor, LoadResult
+from app.core.parsing import classify_prefix, to_number
+from app.processing.constants import INVALID_VALUES, Category, Subcategory
+from app.processing.models import Processing, ProcessingCreate
 
 logger = logging.getLogger(__name__)
 
 
 class ProcessingIngestor(EmbrapaBaseIngestor):
+    MODEL = Processing
+    CREATE_MODEL = ProcessingCreate
+    NATURAL_KEY = ("year", "cultivate", "category", "subcategory")
+    COLUMNS = {"ano": "year", "cultivar": "cultivate", "quantidade_kg": "quantity_kg"}
+    RANGES = {**EmbrapaBaseIngestor.RANGES, "quantity_kg": (0, None)}
+
     PATHS = [
         "download/ProcessaViniferas.csv",
         "download/ProcessaAmericanas.csv",
@@ -44,44 +47,26 @@ class ProcessingIngestor(EmbrapaBaseIngestor):
         },
     }
 
-    def ingest(self, session: Session):
-        n_inserts = n_skipped = 0
-
-        for path in self.PATHS:
-            self.CSV_PATH = path
-            category = self.CATEGORIES[path]
-            separator = ";" if "Viniferas" in path else "\t"
-
-            df = self.fetch_csv(path, separator)
-            melted = self._prepare_dataframe(df, category)
-
-            for _, row in melted.iterrows():
-                if get_by_year_and_cultivate_and_category(
-                    session,
-                    row["ano"],
-                    row["cultivar"],
-                    row["category"],
-                    row["subcategory"],
-                ):
-                    n_skipped += 1
-                    continue
-
-                try:
-                    data = ProcessingCreate(
-                        year=row["ano"],
-                        cultivate=row["cultivar"],
-                        quantity_kg=row["quantidade_kg"],
-                        category=row["category"],
-                        subcategory=row["subcategory"],
-                    )
-                    create_processing(session, data)
-                    n_inserts += 1
-                except Exception as e:
-                    logger.warning(f"Error inserting row — {row.to_dict()} — {e}")
-
-        logger.info(
-            f"Processing ingestion complete: {n_inserts} inserted, {n_skipped} skipped."
-        )
+    def ingest(self, session: Session) -> LoadResult:
+        result = LoadResult()
+
+        try:
+            for path, df in self.fetch_frames(session, self.PATHS):
+                result += self.bulk_load(session, df, update=True, source=path)
+
+            self.commit(session)
+        except Exception:
+            self.rollback(session)
+            raise
+
+        logger.info(f"Processing ingestion complete: {self.summary(result)}.")
+        return result
+
+    def separator(self, path: str) -> str:
+        return ";" if "Viniferas" in path else "\t"
+
+    def transform(self, df: pd.DataFrame, path: str) -> pd.DataFrame:
+        return self._prepare_dataframe(df, self.CATEGORIES[path])
 
     def _prepare_dataframe(self, df: pd.DataFrame, category: str) -> pd.DataFrame:
         df = df.drop(columns=["id"], errors="ignore")
@@ -97,19 +82,16 @@ class ProcessingIngestor(EmbrapaBaseIngestor):
         df = df.dropna(subset=["ano", "quantidade_kg"])
         df["ano"] = df["ano"].astype(int)
 
-        df["quantidade_kg"] = (
-            df["quantidade_kg"]
-            .astype(str)
-            .str.lower()
-            .str.replace(",", ".", regex=False)
-            .apply(lambda x: x if x not in {"nd", "+", "*"} else "0")
-            .astype(float)
-            .astype(int)
+        # Unparseable quantities become NaN and are quarantined by bulk_load
+        df["quantidade_kg"] = to_number(
+            df["quantidade_kg"], INVALID_VALUES, errors="coerce"
         )
 
         df["category"] = category
-        df["subcategory"] = df["control"].apply(
-            lambda c: self._extract_subcategory(category, c)
+        df["subcategory"] = classify_prefix(
+            df["control"],
+            self.SUBCATEGORY_PREFIXES.get(category, {}),
+            default=Subcategory.NONE,
         )
         df = df[
             ~(
@@ -120,10 +102,3 @@ class ProcessingIngestor(EmbrapaBaseIngestor):
 
         logger.info(f"Transformed {category} data: {df.shape}")
         return df
-
-    def _extract_subcategory(self, category: str, control_value: str) -> str:
-        prefixes = self.SUBCATEGORY_PREFIXES.get(category, {})
-        for prefix, subcat in prefixes.items():
-            if control_value.startswith(prefix):
-                return subcat
-        return Subcategory.NONE
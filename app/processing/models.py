@@ -1,5 +1,6 @@
 from typing import Optional
 
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field, SQLModel
 
 from app.processing.constants import Category, Subcategory
@@ -18,6 +19,33 @@ class ProcessingBase(SQLModel):
 class Processing(ProcessingBase, table=True):
     """Database model representing the processing table."""
 
+    __table_args__ = (
+        UniqueConstraint(
+            "year",
+            "cultivate",
+            "category",
+            "subcategory",
+            name="uq_processing_natural_key",
+        ),
+        # Match the listing order (crud.ORDER_BY) for cursor pagination
+        Index(
+            "ix_processing_listing",
+            text("year DESC"),
+            "category",
+            "subcategory",
+            "cultivate",
+            "id",
+        ),
+        Index(
+            "ix_processing_category_listing",
+            "category",
+            text("year DESC"),
+            "subcategory",
+            "cultivate",
+            "id",
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
 
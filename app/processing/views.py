@@ -5,17 +5,22 @@ from app.auth.dependencies import get_current_active_user, get_current_superuser
 from app.auth.models import User
 from app.core.config import settings
 from app.core.database import get_session
+from app.core.counts import counts
 from app.core.pagination import PaginatedResponse
+from app.core.response_cache import cached_response
+from app.jobs.models import IngestionJobRead
+from app.jobs.worker import enqueue_reingest
 from app.processing.constants import Category, Subcategory
 from app.processing.crud import (
-    clear_processing,
+    ORDER_BY,
     count_processing,
     count_processing_by_category,
     list_processing,
+    list_processing_with_total,
     list_processing_by_category,
+    list_processing_by_category_with_total,
 )
-from app.processing.ingestor import ProcessingIngestor
-from app.processing.models import ProcessingRead
+from app.processing.models import Processing, ProcessingRead
 
 router = APIRouter()
 
@@ -27,25 +32,36 @@ def get_offset(page):
 
 
 @router.get("/", response_model=PaginatedResponse[ProcessingRead])
+@cached_response(Processing)
 def read_all(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, read instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching rows, false to skip total"
+    ),
 ):
     """
     Endpoint to list all processing records with pagination.
     """
-    offset = (page - 1) * per_page
+    offset = None if cursor else (page - 1) * per_page
 
-    # Get total count
-    total = count_processing(session)
+    # Get total count, cached per dataset version
+    total = counts.get(session, Processing, count_processing) if include_total else None
 
-    # Get paginated data
-    data = list_processing(session, per_page, offset)
+    # Get paginated data, counted in the same query if not cached
+    if include_total and total is None:
+        data, total = list_processing_with_total(session, per_page + 1, offset, cursor)
+        counts.put(session, Processing, count_processing, total=total)
+    else:
+        data = list_processing(session, per_page + 1, offset, cursor)
 
-    return PaginatedResponse.create(
-        data=data, total=total, page=page, per_page=per_page
+    return PaginatedResponse.from_rows(
+        data, total, page, per_page, order_by=ORDER_BY, cursor=cursor
     )
 
 
@@ -53,6 +69,7 @@ def read_all(
 @router.get(
     "/{category}/{subcategory}", response_model=PaginatedResponse[ProcessingRead]
 )
+@cached_response(Processing)
 def read_by_path(
     category: Category,
     subcategory: Subcategory | None = None,
@@ -60,6 +77,12 @@ def read_by_path(
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, read instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching rows, false to skip total"
+    ),
 ):
     """
     Endpoint to list all processing records by the category and subcategory with pagination.
@@ -70,26 +93,52 @@ def read_by_path(
     :param per_page: Items per page.
     :return: Paginated list of processing records.
     """
-    offset = (page - 1) * per_page
+    offset = None if cursor else (page - 1) * per_page
 
-    # Get total count
-    total = count_processing_by_category(session, category, subcategory)
+    # Get total count, cached per dataset version
+    total = (
+        counts.get(
+            session, Processing, count_processing_by_category, category, subcategory
+        )
+        if include_total
+        else None
+    )
 
-    # Get paginated data
-    data = list_processing_by_category(session, category, subcategory, per_page, offset)
+    # Get paginated data, counted in the same query if not cached
+    if include_total and total is None:
+        data, total = list_processing_by_category_with_total(
+            session, category, subcategory, per_page + 1, offset, cursor
+        )
+        counts.put(
+            session,
+            Processing,
+            count_processing_by_category,
+            category,
+            subcategory,
+            total=total,
+        )
+    else:
+        data = list_processing_by_category(
+            session, category, subcategory, per_page + 1, offset, cursor
+        )
 
-    return PaginatedResponse.create(
-        data=data, total=total, page=page, per_page=per_page
+    return PaginatedResponse.from_rows(
+        data, total, page, per_page, order_by=ORDER_BY, cursor=cursor
     )
 
 
-@router.post("/reingest")
+@router.post(
+    "/reingest",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=IngestionJobRead,
+)
 def reingest(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_superuser),
 ):
     """
-    Endpoint to force re-ingestion of processing data from source files.
+    Endpoint to queue a re-ingestion of processing data from source files.
+    Returns the job at once, poll /api/v1/jobs/{id} for its progress.
     Requires superuser authentication and ALLOW_REINGEST=true in environment.
     """
     if not settings.ALLOW_REINGEST:
@@ -97,6 +146,5 @@ def reingest(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Reingestion is not allowed in this environment.",
         )
-    clear_processing(session)
-    ProcessingIngestor().ingest(session=session)
-    return {"detail": "Reingestion completed successfully"}
+    job = enqueue_reingest(session, "processing")
+    return IngestionJobRead.from_job(job)
@@ -1,10 +1,14 @@
 from typing import Sequence
 
-from sqlmodel import Session, delete, func, select
+from sqlmodel import Session, func, select
 
+from app.core.pagination import fetch_page, fetch_page_with_total
 from app.production.constants import Category
 from app.production.models import Production, ProductionCreate
 
+# Listing order, ending with the primary key so cursors are unique
+ORDER_BY = (Production.year.desc(), Production.product, Production.id)
+
 
 def create_production(session: Session, data: ProductionCreate) -> Production:
     """
@@ -18,41 +22,55 @@ def create_production(session: Session, data: ProductionCreate) -> Production:
 
 
 def list_productions(
-    session: Session, limit: int = None, offset: int = None
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
 ) -> Sequence[Production]:
     """
     Retrieve all production records from the database.
     """
-    statement = select(Production).order_by(Production.year.desc(), Production.product)
+    statement = select(Production)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    result = session.exec(statement)
-    return result.all()
+
+def list_productions_with_total(
+    session: Session, limit: int = None, offset: int = None, cursor: str = None
+) -> tuple[Sequence[Production], int]:
+    """
+    Retrieve a page of production records and their total, in one query.
+    """
+    statement = select(Production)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def list_productions_by_category(
-    session: Session, category: Category, limit: int = None, offset: int = None
+    session: Session,
+    category: Category,
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
 ) -> Sequence[Production]:
     """
     Retrieve all production records from the database.
     """
-    statement = (
-        select(Production)
-        .where(Production.category == category)
-        .order_by(Production.year.desc(), Production.product)
-    )
+    statement = select(Production).where(Production.category == category)
 
-    if offset:
-        statement = statement.offset(offset)
-    if limit:
-        statement = statement.limit(limit)
+    return fetch_page(session, statement, ORDER_BY, limit, offset, cursor)
 
-    result = session.exec(statement)
-    return result.all()
+
+def list_productions_by_category_with_total(
+    session: Session,
+    category: Category,
+    limit: int = None,
+    offset: int = None,
+    cursor: str = None,
+) -> tuple[Sequence[Production], int]:
+    """
+    Retrieve a page of production records by category and their total, in one query.
+    """
+    statement = select(Production).where(Production.category == category)
+
+    return fetch_page_with_total(session, statement, ORDER_BY, limit, offset, cursor)
 
 
 def get_by(session: Session, year: int, product: str, category: str) -> Production:
@@ -67,15 +85,6 @@ def get_by(session: Session, year: int, product: str, category: str) -> Producti
     return session.exec(statement).first()
 
 
-def clear_production(session: Session) -> None:
-    """
-    Clear all production records from the database.
-    """
-    statement = delete(Production)
-    session.exec(statement)
-    session.commit()
-
-
 def count_productions(session: Session) -> int:
     """
     Count total production records in the database.
@@ -1,13 +1,12 @@
 import logging
 
-import numpy as np
 import pandas as pd
 from sqlmodel import Session
 
-from app.core.base_ingestor import EmbrapaBaseIngestor
+from app.core.base_ingestor import EmbrapaBaseIngestor, LoadResult
+from app.core.parsing import classify_prefix, to_number
 from app.production.constants import Category
-from app.production.crud import create_production, get_by
-from app.production.models import ProductionCreate
+from app.production.models import Production, ProductionCreate
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,16 @@ logger = logging.getLogger(__name__)
 class ProductionIngestor(EmbrapaBaseIngestor):
     CSV_PATH = "download/Producao.csv"
 
+    MODEL = Production
+    CREATE_MODEL = ProductionCreate
+    NATURAL_KEY = ("year", "product", "category")
+    COLUMNS = {
+        "ano": "year",
+        "produto": "product",
+        "quantidade_litros": "quantity_liters",
+    }
+    RANGES = {**EmbrapaBaseIngestor.RANGES, "quantity_liters": (0, None)}
+
     CATEGORY_PREFIXES = {
         "vm_": Category.VINHO_DE_MESA,
         "vv_": Category.VINHO_FINO_DE_MESA_VINIFERA,
@@ -24,32 +33,23 @@ class ProductionIngestor(EmbrapaBaseIngestor):
 
     REQUIRED_COLUMNS = {"produto", "control"}
 
-    def ingest(self, session: Session):
-        df = self.fetch_csv()
-        transformed = self._prepare_dataframe(df)
-
-        n_inserts = n_skipped = 0
-
-        for _, row in transformed.iterrows():
-            if get_by(session, row["ano"], row["produto"], row["category"]):
-                n_skipped += 1
-                continue
-
-            try:
-                data = ProductionCreate(
-                    year=row["ano"],
-                    product=row["produto"],
-                    quantity_liters=row["quantidade_litros"],
-                    category=row["category"],
-                )
-                create_production(session, data)
-                n_inserts += 1
-            except Exception as e:
-                logger.warning(
-                    f"Error inserting row — year: {row['ano']}, product: {row['produto']} — {e}"
-                )
-
-        logger.info(f"Ingestion completed: {n_inserts} inserted, {n_skipped} skipped.")
+    def ingest(self, session: Session) -> LoadResult:
+        result = LoadResult()
+
+        try:
+            for path, df in self.fetch_frames(session, [self.CSV_PATH]):
+                result += self.bulk_load(session, df, update=True, source=path)
+
+            self.commit(session)
+        except Exception:
+            self.rollback(session)
+            raise
+
+        logger.info(f"Production ingestion complete: {self.summary(result)}.")
+        return result
+
+    def transform(self, df: pd.DataFrame, path: str) -> pd.DataFrame:
+        return self._prepare_dataframe(df)
 
     def _prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.drop(columns=["id"], errors="ignore")
@@ -58,12 +58,10 @@ class ProductionIngestor(EmbrapaBaseIngestor):
         if missing:
             raise ValueError(f"Missing required columns in CSV: {missing}")
 
-        # Map category based on control prefix using numpy
-        conditions = [
-            df["control"].str.startswith(prefix) for prefix in self.CATEGORY_PREFIXES
-        ]
-        categories = [cat.value for cat in self.CATEGORY_PREFIXES.values()]
-        df["category"] = np.select(conditions, categories, default="")
+        # Map category based on control prefix
+        df["category"] = classify_prefix(
+            df["control"], self.CATEGORY_PREFIXES, default=""
+        )
 
         # Remove rows without valid category
         df = df[df["category"] != ""]
@@ -78,7 +76,8 @@ class ProductionIngestor(EmbrapaBaseIngestor):
 
         df = df.dropna(subset=["ano", "quantidade_litros"])
         df["ano"] = df["ano"].astype(int)
-        df["quantidade_litros"] = df["quantidade_litros"].astype(int)
+        # Unparseable quantities become NaN and are quarantined by bulk_load
+        df["quantidade_litros"] = to_number(df["quantidade_litros"], errors="coerce")
 
         logger.info(f"Transformed shape: {df.shape}")
         return df
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field, SQLModel
 
 from app.production.constants import Category
@@ -17,6 +18,21 @@ class ProductionBase(SQLModel):
 class Production(ProductionBase, table=True):
     """Database model representing the production table."""
 
+    __table_args__ = (
+        UniqueConstraint(
+            "year", "product", "category", name="uq_production_natural_key"
+        ),
+        # Match the listing order (crud.ORDER_BY) for cursor pagination
+        Index("ix_production_listing", text("year DESC"), "product", "id"),
+        Index(
+            "ix_production_category_listing",
+            "category",
+            text("year DESC"),
+            "product",
+            "id",
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
 
@@ -5,17 +5,22 @@ from app.auth.dependencies import get_current_active_user, get_current_superuser
 from app.auth.models import User
 from app.core.config import settings
 from app.core.database import get_session
+from app.core.counts import counts
 from app.core.pagination import PaginatedResponse
+from app.core.response_cache import cached_response
+from app.jobs.models import IngestionJobRead
+from app.jobs.worker import enqueue_reingest
 from app.production.constants import Category
 from app.production.crud import (
-    clear_production,
+    ORDER_BY,
     count_productions,
     count_productions_by_category,
     list_productions,
+    list_productions_with_total,
     list_productions_by_category,
+    list_productions_by_category_with_total,
 )
-from app.production.ingestor import ProductionIngestor
-from app.production.models import ProductionRead
+from app.production.models import Production, ProductionRead
 
 router = APIRouter()
 
@@ -27,59 +32,98 @@ def get_offset(page):
 
 
 @router.get("/", response_model=PaginatedResponse[ProductionRead])
+@cached_response(Production)
 async def read_all(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, read instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching rows, false to skip total"
+    ),
 ):
     """
     Endpoint to list all production records with pagination.
     """
-    offset = (page - 1) * per_page
+    offset = None if cursor else (page - 1) * per_page
 
-    # Get total count
-    total = count_productions(session)
+    # Get total count, cached per dataset version
+    total = (
+        counts.get(session, Production, count_productions) if include_total else None
+    )
 
-    # Get paginated data
-    data = list_productions(session, per_page, offset)
+    # Get paginated data, counted in the same query if not cached
+    if include_total and total is None:
+        data, total = list_productions_with_total(session, per_page + 1, offset, cursor)
+        counts.put(session, Production, count_productions, total=total)
+    else:
+        data = list_productions(session, per_page + 1, offset, cursor)
 
-    return PaginatedResponse.create(
-        data=data, total=total, page=page, per_page=per_page
+    return PaginatedResponse.from_rows(
+        data, total, page, per_page, order_by=ORDER_BY, cursor=cursor
     )
 
 
 @router.get("/{category}", response_model=PaginatedResponse[ProductionRead])
+@cached_response(Production)
 async def read_by_category(
     category: Category,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, read instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching rows, false to skip total"
+    ),
 ):
     """
     Endpoint to list all production records by category with pagination.
     """
-    offset = (page - 1) * per_page
+    offset = None if cursor else (page - 1) * per_page
 
-    # Get total count
-    total = count_productions_by_category(session, category)
+    # Get total count, cached per dataset version
+    total = (
+        counts.get(session, Production, count_productions_by_category, category)
+        if include_total
+        else None
+    )
 
-    # Get paginated data
-    data = list_productions_by_category(session, category, per_page, offset)
+    # Get paginated data, counted in the same query if not cached
+    if include_total and total is None:
+        data, total = list_productions_by_category_with_total(
+            session, category, per_page + 1, offset, cursor
+        )
+        counts.put(
+            session, Production, count_productions_by_category, category, total=total
+        )
+    else:
+        data = list_productions_by_category(
+            session, category, per_page + 1, offset, cursor
+        )
 
-    return PaginatedResponse.create(
-        data=data, total=total, page=page, per_page=per_page
+    return PaginatedResponse.from_rows(
+        data, total, page, per_page, order_by=ORDER_BY, cursor=cursor
     )
 
 
-@router.post("/reingest")
-async def reingest(
+@router.post(
+    "/reingest",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=IngestionJobRead,
+)
+def reingest(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_superuser),
 ):
     """
-    Endpoint to force re-ingestion of production data from source files.
+    Endpoint to queue a re-ingestion of production data from source files.
+    Returns the job at once, poll /api/v1/jobs/{id} for its progress.
     Requires superuser authentication and ALLOW_REINGEST=true in environment.
     """
     if not settings.ALLOW_REINGEST:
@@ -88,6 +132,5 @@ async def reingest(
             detail="Reingestion is not allowed in this environment.",
         )
 
-    clear_production(session)
-    ProductionIngestor().ingest(session=session)
-    return {"detail": "Reingestion completed successfully"}
+    job = enqueue_reingest(session, "production")
+    return IngestionJobRead.from_job(job)
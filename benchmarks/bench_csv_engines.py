@@ -0,0 +1,101 @@
+"""
+Compare the pandas C and pyarrow CSV engines on every source file.
+
+Usage:
+    python -m benchmarks.bench_csv_engines --scales 1 10 100
+
+Generates the synthetic source files of every domain at each scale and,
+in a fresh process per engine, parses them in chunks of INGEST_CHUNK_SIZE
+cells and runs each ingestor's transform, reporting parse and transform
+seconds and peak RSS.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+
+from app.core.config import settings
+from app.core.fetcher import FetchedFile
+from app.core.memory import peak_rss_mb
+from app.core.parsing import CSV_ENGINES
+from benchmarks.synthetic import DOMAINS, SCALES, generate
+
+
+def parse_all(directory: str, scale: int, engine: str, chunk_size: int) -> dict:
+    parse = transform = 0.0
+    rows = 0
+    for domain, spec in DOMAINS.items():
+        ingestor = spec.ingestor()
+        ingestor.CSV_ENGINE = engine
+        ingestor.CHUNK_SIZE = chunk_size
+
+        for path, file in generate(domain, scale, directory).items():
+            fetched = FetchedFile(path=path, file=file)
+            chunks = ingestor._parse_chunks(fetched, ingestor.separator(path))
+            while True:
+                started = time.perf_counter()
+                chunk = next(chunks, None)
+                parsed = time.perf_counter()
+                if chunk is None:
+                    break
+                rows += len(ingestor.transform(chunk, path))
+                parse += parsed - started
+                transform += time.perf_counter() - parsed
+
+    return {
+        "rows": rows,
+        "parse_s": round(parse, 3),
+        "transform_s": round(transform, 3),
+        "peak_rss_mb": round(peak_rss_mb()),
+    }
+
+
+def run_child(directory: str, scale: int, engine: str, chunk_size: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_csv_engines", "--child", directory]
+        + ["--scales", str(scale), "--engines", engine]
+        + ["--chunk-size", str(chunk_size)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1, 10], choices=sorted(SCALES)
+    )
+    parser.add_argument(
+        "--engines", nargs="+", default=list(CSV_ENGINES), choices=CSV_ENGINES
+    )
+    parser.add_argument("--chunk-size", type=int, default=settings.INGEST_CHUNK_SIZE)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run = parse_all(args.child, args.scales[0], args.engines[0], args.chunk_size)
+        print(json.dumps(run))
+        return
+
+    print(
+        f"{'scale':>6}  {'engine':<9}{'rows':>11}{'parse s':>10}"
+        f"{'transform s':>13}{'peak RSS MB':>13}"
+    )
+    for scale in args.scales:
+        for engine in args.engines:
+            # Every run generates its own files, so no page cache is shared
+            with tempfile.TemporaryDirectory() as directory:
+                run = run_child(directory, scale, engine, args.chunk_size)
+            print(
+                f"{scale:>5}x  {engine:<9}{run['rows']:>11,}{run['parse_s']:>10.3f}"
+                f"{run['transform_s']:>13.3f}{run['peak_rss_mb']:>13.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark for ExportationIngestor._prepare_dataframe.
+
+Usage:
+    python -m benchmarks.bench_exportation_reshape --countries 150 --years 200
+
+Widens an ExpVinho-shaped file to the given number of countries and years
+and compares the vectorized reshape with the previous iterrows() version.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.exportation.constants import INVALID_VALUES, Category
+from app.exportation.ingestor import ExportationIngestor
+
+
+def make_expvinho(countries: int, years: int) -> pd.DataFrame:
+    """
+    Build a wide ExpVinho frame: Id, País, then YYYY / YYYY.1 column pairs.
+    """
+    rng = np.random.default_rng(42)
+    data = {"Id": np.arange(1, countries + 1)}
+    data["País"] = [f"País {i}" for i in range(countries)]
+    for year in range(1970, 1970 + years):
+        data[str(year)] = rng.integers(0, 100_000, countries)
+        data[f"{year}.1"] = rng.integers(0, 500_000, countries)
+    return pd.DataFrame(data)
+
+
+def legacy_prepare_dataframe(df: pd.DataFrame, category: str) -> pd.DataFrame:
+    """
+    Previous implementation, kept as the benchmark baseline.
+    """
+    df = df.drop(columns=["Id"], errors="ignore")
+    year_cols = [col for col in df.columns if col.isdigit()]
+
+    processed_rows = []
+    for year_col in year_cols:
+        value_col = f"{year_col}.1"
+        for _, row in df.iterrows():
+            processed_rows.append(
+                {
+                    "country": row["País"],
+                    "year": int(year_col),
+                    "quantity_kg": row[year_col],
+                    "value": row[value_col] if value_col in df.columns else 0,
+                    "category": category,
+                }
+            )
+
+    df_processed = pd.DataFrame(processed_rows)
+    df_processed = df_processed.dropna(subset=["year", "quantity_kg"])
+    for column in ("quantity_kg", "value"):
+        df_processed[column] = (
+            df_processed[column]
+            .astype(str)
+            .str.lower()
+            .str.replace(",", ".", regex=False)
+            .apply(lambda x: x if x not in INVALID_VALUES else "0")
+            .astype(float)
+            .round()
+            .astype(int)
+        )
+    return df_processed
+
+
+def timed(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--countries", type=int, default=150)
+    parser.add_argument("--years", type=int, default=200)
+    args = parser.parse_args()
+
+    df = make_expvinho(args.countries, args.years)
+    ingestor = ExportationIngestor()
+
+    pd.testing.assert_frame_equal(
+        ingestor._prepare_dataframe(df, Category.VINHO),
+        legacy_prepare_dataframe(df, Category.VINHO),
+    )
+
+    legacy = timed(legacy_prepare_dataframe, df, Category.VINHO, repeat=1)
+    vectorized = timed(ingestor._prepare_dataframe, df, Category.VINHO)
+
+    rows = args.countries * args.years
+    print(f"{args.countries} countries x {args.years} years = {rows} rows")
+    print(f"iterrows:   {legacy:8.3f}s")
+    print(f"vectorized: {vectorized:8.3f}s ({legacy / vectorized:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Ingestion benchmark suite over synthetic Embrapa files.
+
+Usage:
+    python -m benchmarks.bench_ingest --scales 1 10 100 --output results.json
+    python -m benchmarks.bench_ingest --postgres-url postgresql://... \\
+        --compare baseline.json
+
+For every database, scale and domain, the files from benchmarks.synthetic
+are parsed, transformed (the ingestor's transform()) and bulk-loaded,
+timing each phase separately. SQLite always runs on a temporary file;
+PostgreSQL runs when --postgres-url (or TEST_POSTGRES_URL) is given and
+its domain tables are emptied, so point it at a scratch database.
+
+Results are written as JSON. With --compare, phases slower than the
+baseline by more than --tolerance are reported and the exit status is 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+from sqlmodel import Session, SQLModel, create_engine, delete
+
+from app.core.fetcher import FetchedFile
+from benchmarks.synthetic import DOMAINS, SCALES, generate
+
+PHASES = ("parse", "transform", "load")
+NOISE_FLOOR = 0.05  # seconds; faster phases are too noisy to compare
+
+
+def bench_domain(engine, domain: str, files: dict[str, str]) -> dict:
+    """
+    Time the parse, transform and load phases of one domain's files.
+    """
+    spec = DOMAINS[domain]
+    ingestor = spec.ingestor()
+    timings = dict.fromkeys(PHASES, 0.0)
+    rows = 0
+
+    with Session(engine) as session:
+        session.exec(delete(ingestor.MODEL))
+        session.commit()
+
+        for path, file in files.items():
+            started = time.perf_counter()
+            df = ingestor._parse_csv(
+                FetchedFile(path=path, file=file), ingestor.separator(path)
+            )
+            parsed = time.perf_counter()
+            transformed = ingestor.transform(df, path)
+            prepared = time.perf_counter()
+            ingestor.bulk_load(session, transformed)
+            session.commit()
+            loaded = time.perf_counter()
+
+            timings["parse"] += parsed - started
+            timings["transform"] += prepared - parsed
+            timings["load"] += loaded - prepared
+            rows += len(transformed)
+
+    total = sum(timings.values())
+    return {
+        "rows": rows,
+        **{f"{phase}_s": round(timings[phase], 4) for phase in PHASES},
+        "total_s": round(total, 4),
+        "rows_per_s": round(rows / total) if total else 0,
+    }
+
+
+def run_suite(databases: dict[str, str], scales: list[int], domains: list[str]):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            files = {}
+            for domain in domains:
+                directory = os.path.join(tmp, f"{scale}x-{domain}")
+                files[domain] = generate(domain, scale, directory)
+
+            for database, url in databases.items():
+                engine = create_engine(url)
+                SQLModel.metadata.create_all(engine)
+                for domain in domains:
+                    result = {"database": database, "scale": scale, "domain": domain}
+                    result.update(bench_domain(engine, domain, files[domain]))
+                    results.append(result)
+                    print(
+                        f"{database:<10}{scale:>4}x  {domain:<18}{result['rows']:>10}"
+                        + "".join(f"{result[f'{p}_s']:>13.3f}" for p in PHASES)
+                        + f"{result['rows_per_s']:>12,}",
+                        flush=True,
+                    )
+                engine.dispose()
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """
+    Describe every phase that got slower than the baseline by more than
+    tolerance, ignoring phases under NOISE_FLOOR seconds.
+    """
+    previous = {(r["database"], r["scale"], r["domain"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["database"], result["scale"], result["domain"]))
+        if before is None:
+            continue
+        for phase in (*PHASES, "total"):
+            old, new = before[f"{phase}_s"], result[f"{phase}_s"]
+            if new > NOISE_FLOOR and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{result['database']} {result['scale']}x {result['domain']} "
+                    f"{phase}: {old:.3f}s -> {new:.3f}s (+{(new / old - 1) * 100:.0f}%)"
+                    if old
+                    else f"{result['database']} {result['scale']}x "
+                    f"{result['domain']} {phase}: {new:.3f}s (new)"
+                )
+    return regressions
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10])
+    parser.add_argument(
+        "--domains", nargs="+", choices=list(DOMAINS), default=list(DOMAINS)
+    )
+    parser.add_argument("--postgres-url", default=os.getenv("TEST_POSTGRES_URL"))
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    unknown = set(args.scales) - set(SCALES)
+    if unknown:
+        parser.error(
+            f"unsupported scales {sorted(unknown)}, choose from {list(SCALES)}"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        databases = {"sqlite": f"sqlite:///{tmp}/bench.db"}
+        if args.postgres_url:
+            databases["postgres"] = args.postgres_url
+
+        print(
+            f"{'database':<10}{'scale':>5}  {'domain':<18}{'rows':>10}"
+            + "".join(f"{phase + ' s':>13}" for phase in PHASES)
+            + f"{'rows/sec':>12}"
+        )
+        results = run_suite(databases, args.scales, args.domains)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"meta": metadata(), "results": results}, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions over {args.tolerance:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare database load strategies for the production table.
+
+Usage:
+    python -m benchmarks.bench_load --rows 20000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_load
+
+Reports rows/sec for the per-row create_* path, batched INSERT ... ON
+CONFLICT and (on PostgreSQL) COPY into a staging table.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sqlmodel import Session, SQLModel, create_engine, delete
+
+from app.core.config import settings
+from app.production.constants import Category
+from app.production.crud import create_production, get_by
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production, ProductionCreate
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """
+    Build a transformed production frame with unique natural keys.
+    """
+    rng = np.random.default_rng(42)
+    categories = [category.value for category in Category]
+    index = np.arange(rows)
+    return pd.DataFrame(
+        {
+            "produto": [f"Produto {i // 50}" for i in index],
+            "category": [categories[i % len(categories)] for i in index],
+            "ano": 1970 + (index % 50),
+            "quantidade_litros": rng.integers(0, 10_000_000, rows),
+        }
+    )
+
+
+def per_row(session: Session, df: pd.DataFrame) -> None:
+    for _, row in df.iterrows():
+        if get_by(session, row["ano"], row["produto"], row["category"]):
+            continue
+        create_production(
+            session,
+            ProductionCreate(
+                year=row["ano"],
+                product=row["produto"],
+                quantity_liters=row["quantidade_litros"],
+                category=row["category"],
+            ),
+        )
+
+
+def bulk(use_copy: bool):
+    def load(session: Session, df: pd.DataFrame) -> None:
+        ingestor = ProductionIngestor()
+        ingestor.USE_COPY = use_copy
+        ingestor.bulk_load(session, df)
+        session.commit()
+
+    return load
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--per-row-rows", type=int, default=2_000)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    SQLModel.metadata.create_all(engine, tables=[Production.__table__])
+
+    strategies = [("per-row create_*", per_row, args.per_row_rows)]
+    strategies.append(("batched INSERT", bulk(use_copy=False), args.rows))
+    if engine.dialect.name == "postgresql":
+        strategies.append(("COPY + merge", bulk(use_copy=True), args.rows))
+
+    print(f"{'strategy':<20}{'rows':>10}{'seconds':>10}{'rows/sec':>12}")
+    for name, load, rows in strategies:
+        df = make_frame(rows)
+        with Session(engine) as session:
+            session.exec(delete(Production))
+            session.commit()
+
+            started = time.perf_counter()
+            load(session, df)
+            elapsed = time.perf_counter() - started
+
+        print(f"{name:<20}{rows:>10}{elapsed:>10.2f}{rows / elapsed:>12,.0f}")
+
+    with Session(engine) as session:
+        session.exec(delete(Production))
+        session.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compare offset and keyset (cursor) pagination at increasing page depths.
+
+Usage:
+    python -m benchmarks.bench_pagination --rows 200000
+    python -m benchmarks.bench_pagination --database-url postgresql://...
+
+Fills the production table with --rows synthetic rows and reads pages of
+--per-page rows at each depth, the way the list endpoints do: with
+OFFSET (page - 1) * per_page, and by seeking past the cursor of the
+previous page. Reports the median milliseconds per page of each mode.
+The production table is emptied, so point it at a scratch database.
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlmodel import Session, SQLModel, create_engine, delete
+
+from app.core.config import settings
+from app.core.pagination import encode_cursor
+from app.production.crud import ORDER_BY, list_productions
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+from benchmarks.bench_load import make_frame
+
+
+def timed(read, repeat: int) -> tuple[float, list]:
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = read()
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs) * 1000, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument(
+        "--pages", type=int, nargs="+", default=[1, 10, 100, 500, 1000, 2000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    SQLModel.metadata.create_all(engine, tables=[Production.__table__])
+    per_page = args.per_page
+
+    with Session(engine) as session:
+        session.exec(delete(Production))
+        ProductionIngestor().bulk_load(session, make_frame(args.rows))
+        session.commit()
+        if engine.dialect.name == "postgresql":
+            session.connection().exec_driver_sql("ANALYZE production")
+            session.commit()
+
+        print(f"{'page':>6}{'offset ms':>12}{'keyset ms':>12}")
+        for page in args.pages:
+            offset = (page - 1) * per_page
+            if offset >= args.rows:
+                break
+
+            by_offset, rows = timed(
+                lambda: list_productions(session, per_page, offset), args.repeat
+            )
+
+            cursor = None
+            if page > 1:
+                (previous,) = list_productions(session, 1, offset - 1)
+                cursor = encode_cursor(previous, ORDER_BY)
+            by_cursor, seeked = timed(
+                lambda: list_productions(session, per_page, cursor=cursor),
+                args.repeat,
+            )
+            assert [row.id for row in seeked] == [row.id for row in rows]
+
+            print(f"{page:>6}{by_offset:>12.2f}{by_cursor:>12.2f}")
+
+        session.exec(delete(Production))
+        session.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Micro-benchmark for the shared numeric cleaning in app.core.parsing.
+
+Usage:
+    python -m benchmarks.bench_parsing --rows 1000000
+
+Compares the previous per-cell lambda chain on columns read as text with
+to_number() on columns read with READ_CSV_OPTIONS (decimal=","), with and
+without sentinel values, and the per-row subcategory .apply() with
+classify_prefix().
+"""
+
+import argparse
+import time
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from app.core.parsing import READ_CSV_OPTIONS, classify_prefix, to_number
+from app.processing.constants import INVALID_VALUES, Subcategory
+from app.processing.ingestor import ProcessingIngestor
+
+PREFIXES = ProcessingIngestor.SUBCATEGORY_PREFIXES[
+    next(iter(ProcessingIngestor.SUBCATEGORY_PREFIXES))
+]
+
+
+def make_quantities(rows: int, sentinel_ratio: float = 0.01) -> pd.Series:
+    """
+    Build a text quantity column with decimal commas and a few sentinels.
+    """
+    rng = np.random.default_rng(42)
+    numbers = rng.integers(0, 1_000_000, rows).astype(str)
+    cells = np.char.add(numbers, ",5").astype(object)
+    sentinels = rng.random(rows) < sentinel_ratio
+    cells[sentinels] = rng.choice(sorted(INVALID_VALUES), sentinels.sum())
+    return pd.Series(cells)
+
+
+def make_controls(rows: int) -> pd.Series:
+    rng = np.random.default_rng(42)
+    return pd.Series(rng.choice(["ti_Bordo", "br_Niagara", "TINTAS"], rows))
+
+
+def legacy_to_number(values: pd.Series) -> pd.Series:
+    """
+    Previous implementation, kept as the benchmark baseline.
+    """
+    return (
+        values.astype(str)
+        .str.lower()
+        .str.replace(",", ".", regex=False)
+        .apply(lambda x: x if x not in INVALID_VALUES else "0")
+        .astype(float)
+    )
+
+
+def legacy_classify(values: pd.Series) -> pd.Series:
+    def extract(control_value):
+        for prefix, subcat in PREFIXES.items():
+            if control_value.startswith(prefix):
+                return subcat
+        return Subcategory.NONE
+
+    return values.apply(extract)
+
+
+def timed(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def read_column(values: pd.Series, **options) -> pd.Series:
+    """
+    Round-trip a column through a ';' separated CSV, as the ingestors read it.
+    """
+    buffer = StringIO()
+    values.to_frame("2020").to_csv(buffer, sep=";", index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer, sep=";", **options)["2020"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    controls = make_controls(args.rows)
+    assert (
+        classify_prefix(controls, PREFIXES, Subcategory.NONE).tolist()
+        == legacy_classify(controls).tolist()
+    )
+
+    print(f"{args.rows} rows")
+    for label, ratio in (("without sentinels", 0), ("with 1% sentinels", 0.01)):
+        quantities = make_quantities(args.rows, ratio)
+        raw = read_column(quantities, encoding="utf-8")
+        parsed = read_column(quantities, **READ_CSV_OPTIONS)
+        pd.testing.assert_series_equal(
+            to_number(parsed, INVALID_VALUES), legacy_to_number(raw)
+        )
+
+        legacy = timed(legacy_to_number, raw)
+        vectorized = timed(to_number, parsed, INVALID_VALUES)
+        print(f"quantities {label} ({parsed.dtype} after read):")
+        print(f"  lambda chain:         {legacy:8.3f}s")
+        print(
+            f"  to_number():          {vectorized:8.3f}s ({legacy / vectorized:.1f}x)"
+        )
+
+    legacy = timed(legacy_classify, controls)
+    vectorized = timed(classify_prefix, controls, PREFIXES, Subcategory.NONE)
+    print("subcategories:")
+    print(f"  .apply():             {legacy:8.3f}s")
+    print(f"  classify_prefix():    {vectorized:8.3f}s ({legacy / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
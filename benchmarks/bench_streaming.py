@@ -0,0 +1,111 @@
+"""
+Measure peak memory of a production ingest as the history grows.
+
+Usage:
+    python -m benchmarks.bench_streaming --products 500 --years 50 200 800
+
+Writes a wide Producao-shaped CSV for every year count and ingests it in a
+fresh process, once parsed as a whole file and once streamed in chunks of
+INGEST_CHUNK_SIZE cells, reporting duration and peak RSS of each run.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.config import settings
+from app.core.validation import FrameValidator
+from app.production.ingestor import ProductionIngestor
+
+WHOLE_FILE = 2**62
+FIRST_YEAR = 1900
+
+
+def make_producao(products: int, years: int) -> pd.DataFrame:
+    """
+    Build a wide Producao frame: id, control, produto, then one column per year.
+    """
+    rng = np.random.default_rng(42)
+    prefixes = list(ProductionIngestor.CATEGORY_PREFIXES)
+    data = {"id": np.arange(1, products + 1)}
+    data["control"] = [f"{prefixes[i % len(prefixes)]}{i}" for i in range(products)]
+    data["produto"] = [f"Produto {i}" for i in range(products)]
+    for year in range(FIRST_YEAR, FIRST_YEAR + years):
+        data[str(year)] = rng.integers(0, 10_000_000, products)
+    return pd.DataFrame(data)
+
+
+def ingest(path: str, chunk_size: int, database_url: str) -> dict:
+    engine = create_engine(database_url)
+    SQLModel.metadata.create_all(engine)
+
+    ingestor = ProductionIngestor(force=True)
+    ingestor.CSV_PATH = path
+    ingestor.CHUNK_SIZE = chunk_size
+    # Long synthetic histories run past the last valid year, 2100
+    ranges = {**ingestor.RANGES, "year": (FIRST_YEAR, None)}
+    ingestor.validator = FrameValidator(ingestor.CREATE_MODEL, ranges)
+
+    started = time.perf_counter()
+    with Session(engine) as session:
+        result = ingestor.ingest(session)
+    return {
+        "seconds": time.perf_counter() - started,
+        "inserted": result.inserted,
+        "peak_rss_mb": result.peak_rss_mb,
+    }
+
+
+def run_child(path: str, chunk_size: int, database_url: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_streaming", "--child", path]
+        + ["--chunk-size", str(chunk_size), "--database-url", database_url],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--years", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--chunk-size", type=int, default=settings.INGEST_CHUNK_SIZE)
+    parser.add_argument("--database-url", help="defaults to a temporary SQLite file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(ingest(args.child, args.chunk_size, args.database_url)))
+        return
+
+    modes = [("whole file", WHOLE_FILE), ("chunked", args.chunk_size)]
+    print(f"{'years':>6}{'rows':>10}  {'mode':<12}{'seconds':>9}{'peak RSS MB':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for years in args.years:
+            path = os.path.join(tmp, f"Producao{years}.csv")
+            make_producao(args.products, years).to_csv(path, sep=";", index=False)
+
+            for mode, chunk_size in modes:
+                # A fresh database file keeps stored rows out of the measured process
+                database_url = args.database_url or (
+                    f"sqlite:///{tmp}/{years}-{chunk_size}.db"
+                )
+                run = run_child(path, chunk_size, database_url)
+                print(
+                    f"{years:>6}{run['inserted']:>10}  {mode:<12}"
+                    f"{run['seconds']:>9.2f}{run['peak_rss_mb']:>13.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
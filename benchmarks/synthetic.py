@@ -0,0 +1,169 @@
+"""
+Deterministic generator of Embrapa-shaped source files.
+
+Every domain is generated with the layout its ingestor reads: Producao,
+Processa*, Comercio, Imp* and Exp*. Scale 1 roughly matches the published
+files; larger scales add both rows and years of history. The same seed,
+domain and scale always produce byte-identical files.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from app.commercialization.ingestor import CommercializationIngestor
+from app.core.base_ingestor import EmbrapaBaseIngestor
+from app.exportation.ingestor import ExportationIngestor
+from app.importation.ingestor import ImportationIngestor
+from app.processing.ingestor import ProcessingIngestor
+from app.production.ingestor import ProductionIngestor
+
+FIRST_YEAR = 1970
+YEARS = 54  # 1970-2023, as published today
+
+# scale -> (row multiplier, year multiplier)
+SCALES = {1: (1, 1), 10: (2, 5), 100: (10, 10)}
+
+
+@dataclass
+class Domain:
+    """
+    How to generate the source files of one ingestor.
+    """
+
+    ingestor: type[EmbrapaBaseIngestor]
+    paths: list[str]
+    rows: int  # rows per file at scale 1
+    build: Callable[[np.random.Generator, int, list[str]], pd.DataFrame]
+
+
+def _years(count: int) -> list[str]:
+    return [str(year) for year in range(FIRST_YEAR, FIRST_YEAR + count)]
+
+
+def _quantities(rng, rows: int, sentinels: list[str]) -> np.ndarray:
+    """
+    Integer quantities as text, with about 1% of the cells replaced by the
+    sentinel values found in the published files.
+    """
+    cells = rng.integers(0, 10_000_000, rows).astype(str).astype(object)
+    if sentinels:
+        mask = rng.random(rows) < 0.01
+        cells[mask] = rng.choice(sentinels, mask.sum())
+    return cells
+
+
+def _with_controls(rng, rows: int, prefixes: list[str], name: str) -> dict:
+    """
+    id, control and name columns; one row in ten is a category header
+    without prefix, like the totals in the published files.
+    """
+    controls = [
+        f"{prefixes[i % len(prefixes)]}{name}{i}" if i % 10 else f"TOTAL {i}"
+        for i in range(rows)
+    ]
+    return {
+        "id": np.arange(1, rows + 1),
+        "control": controls,
+        name: [f"{name.title()} {i}" for i in range(rows)],
+    }
+
+
+def build_producao(rng, rows: int, years: list[str]) -> pd.DataFrame:
+    data = _with_controls(
+        rng, rows, list(ProductionIngestor.CATEGORY_PREFIXES), "produto"
+    )
+    for year in years:
+        data[year] = rng.integers(0, 10_000_000, rows)
+    return pd.DataFrame(data)
+
+
+def build_processa(rng, rows: int, years: list[str]) -> pd.DataFrame:
+    data = _with_controls(rng, rows, ["ti_", "br_"], "cultivar")
+    for year in years:
+        data[year] = _quantities(rng, rows, ["nd", "*", "+"])
+    return pd.DataFrame(data)
+
+
+def build_comercio(rng, rows: int, years: list[str]) -> pd.DataFrame:
+    data = _with_controls(rng, rows, ["vm_", "es_", "su_"], "Produto")
+    for year in years:
+        data[year] = rng.integers(0, 10_000_000, rows)
+    return pd.DataFrame(data)
+
+
+def build_trade(sentinels: list[str]):
+    """
+    Imp*/Exp* layout: Id, País, then a quantity and a value column per year,
+    both headed by the year.
+    """
+
+    def build(rng, rows: int, years: list[str]) -> pd.DataFrame:
+        columns = [np.arange(1, rows + 1), [f"País {i}" for i in range(rows)]]
+        names = ["Id", "País"]
+        for year in years:
+            columns.append(_quantities(rng, rows, sentinels))
+            columns.append(rng.integers(0, 50_000_000, rows) / 100)
+            names += [year, year]
+        df = pd.DataFrame(dict(enumerate(columns)))
+        df.columns = names
+        return df
+
+    return build
+
+
+DOMAINS = {
+    "production": Domain(
+        ProductionIngestor,
+        [ProductionIngestor.CSV_PATH],
+        rows=70,
+        build=build_producao,
+    ),
+    "processing": Domain(
+        ProcessingIngestor,
+        ProcessingIngestor.PATHS,
+        rows=150,
+        build=build_processa,
+    ),
+    "commercialization": Domain(
+        CommercializationIngestor,
+        [CommercializationIngestor.CSV_PATH],
+        rows=60,
+        build=build_comercio,
+    ),
+    "importation": Domain(
+        ImportationIngestor,
+        ImportationIngestor.PATHS,
+        rows=120,
+        build=build_trade(["nd", "*", "+"]),
+    ),
+    "exportation": Domain(
+        ExportationIngestor,
+        ExportationIngestor.PATHS,
+        rows=140,
+        build=build_trade(["-"]),
+    ),
+}
+
+
+def generate(domain: str, scale: int, directory: str, seed: int = 42) -> dict:
+    """
+    Write the source files of a domain at the given scale into directory.
+    Returns {source path: local file}.
+    """
+    spec = DOMAINS[domain]
+    row_factor, year_factor = SCALES[scale]
+    years = _years(YEARS * year_factor)
+    ingestor = spec.ingestor()
+    os.makedirs(directory, exist_ok=True)
+
+    files = {}
+    for index, path in enumerate(spec.paths):
+        rng = np.random.default_rng([seed, scale, index])
+        df = spec.build(rng, spec.rows * row_factor, years)
+        files[path] = os.path.join(directory, os.path.basename(path))
+        df.to_csv(files[path], sep=ingestor.separator(path), index=False, decimal=",")
+    return files
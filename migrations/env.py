@@ -12,6 +12,8 @@ from app.commercialization.models import Commercialization
 from app.processing.models import Processing
 from app.importation.models import Importation
 from app.exportation.models import Exportation
+from app.ingestion.models import IngestionRun, IngestionState
+from app.jobs.models import IngestionJob
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
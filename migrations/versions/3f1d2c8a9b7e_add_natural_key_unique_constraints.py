@@ -0,0 +1,45 @@
+"""add natural key unique constraints
+
+Revision ID: 3f1d2c8a9b7e
+Revises: fb10734a49eb
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1d2c8a9b7e"
+down_revision: Union[str, None] = "fb10734a49eb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NATURAL_KEYS = {
+    "production": ["year", "product", "category"],
+    "processing": ["year", "cultivate", "category", "subcategory"],
+    "importation": ["year", "country", "category"],
+    "exportation": ["year", "country", "category"],
+    "commercialization": ["year", "product"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in NATURAL_KEYS.items():
+        # Keep the first inserted record of every duplicated natural key
+        group_by = ", ".join(columns)
+        op.execute(
+            f"DELETE FROM {table} WHERE id NOT IN "
+            f"(SELECT MIN(id) FROM {table} GROUP BY {group_by})"
+        )
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_unique_constraint(f"uq_{table}_natural_key", columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in NATURAL_KEYS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(f"uq_{table}_natural_key", type_="unique")
@@ -0,0 +1,32 @@
+"""add manifest to ingestion_run
+
+Revision ID: 7a5b1da1d803
+Revises: be1e73adf964
+Create Date: 2026-10-18 11:48:49.171088
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = "7a5b1da1d803"
+down_revision: Union[str, None] = "be1e73adf964"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ingestion_run",
+        sa.Column("manifest", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ingestion_run", "manifest")
@@ -0,0 +1,89 @@
+"""add listing indexes
+
+Revision ID: a0febaba218d
+Revises: d97c96ba4b98
+Create Date: 2026-10-18 12:07:00.110094
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a0febaba218d"
+down_revision: Union[str, None] = "d97c96ba4b98"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_commercialization_listing",
+        "commercialization",
+        [sa.literal_column("year DESC"), "product", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_exportation_category_listing",
+        "exportation",
+        ["category", sa.literal_column("year DESC"), "country", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_exportation_listing",
+        "exportation",
+        [sa.literal_column("year DESC"), "country", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_importation_category_listing",
+        "importation",
+        ["category", sa.literal_column("year DESC"), "country", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_importation_listing",
+        "importation",
+        [sa.literal_column("year DESC"), "country", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_processing_category_listing",
+        "processing",
+        ["category", sa.literal_column("year DESC"), "subcategory", "cultivate", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_processing_listing",
+        "processing",
+        [sa.literal_column("year DESC"), "category", "subcategory", "cultivate", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_production_category_listing",
+        "production",
+        ["category", sa.literal_column("year DESC"), "product", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_production_listing",
+        "production",
+        [sa.literal_column("year DESC"), "product", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_production_listing", table_name="production")
+    op.drop_index("ix_production_category_listing", table_name="production")
+    op.drop_index("ix_processing_listing", table_name="processing")
+    op.drop_index("ix_processing_category_listing", table_name="processing")
+    op.drop_index("ix_importation_listing", table_name="importation")
+    op.drop_index("ix_importation_category_listing", table_name="importation")
+    op.drop_index("ix_exportation_listing", table_name="exportation")
+    op.drop_index("ix_exportation_category_listing", table_name="exportation")
+    op.drop_index("ix_commercialization_listing", table_name="commercialization")
@@ -0,0 +1,61 @@
+"""add ingestion_run table
+
+Revision ID: be1e73adf964
+Revises: c81f3a62d4b9
+Create Date: 2026-10-18 11:34:28.150901
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = "be1e73adf964"
+down_revision: Union[str, None] = "c81f3a62d4b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ingestion_run",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("source", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("fetch_seconds", sa.Float(), nullable=False),
+        sa.Column("parse_seconds", sa.Float(), nullable=False),
+        sa.Column("transform_seconds", sa.Float(), nullable=False),
+        sa.Column("load_seconds", sa.Float(), nullable=False),
+        sa.Column("commit_seconds", sa.Float(), nullable=False),
+        sa.Column("bytes_downloaded", sa.Integer(), nullable=False),
+        sa.Column("files_loaded", sa.Integer(), nullable=False),
+        sa.Column("files_skipped", sa.Integer(), nullable=False),
+        sa.Column("rows_inserted", sa.Integer(), nullable=False),
+        sa.Column("rows_skipped", sa.Integer(), nullable=False),
+        sa.Column("row_errors", sa.Integer(), nullable=False),
+        sa.Column("rows_per_second", sa.Float(), nullable=False),
+        sa.Column("peak_rss_mb", sa.Float(), nullable=False),
+        sa.Column("error", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_ingestion_run_source"), "ingestion_run", ["source"], unique=False
+    )
+    op.create_index(
+        op.f("ix_ingestion_run_started_at"),
+        "ingestion_run",
+        ["started_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_ingestion_run_started_at"), table_name="ingestion_run")
+    op.drop_index(op.f("ix_ingestion_run_source"), table_name="ingestion_run")
+    op.drop_table("ingestion_run")
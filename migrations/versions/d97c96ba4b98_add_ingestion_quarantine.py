@@ -0,0 +1,56 @@
+"""add ingestion_quarantine
+
+Revision ID: d97c96ba4b98
+Revises: 7a5b1da1d803
+Create Date: 2026-10-18 12:03:34.018958
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = "d97c96ba4b98"
+down_revision: Union[str, None] = "7a5b1da1d803"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ingestion_quarantine",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("table_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("source", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("data", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("reason", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_ingestion_quarantine_source"),
+        "ingestion_quarantine",
+        ["source"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_ingestion_quarantine_table_name"),
+        "ingestion_quarantine",
+        ["table_name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_ingestion_quarantine_table_name"), table_name="ingestion_quarantine"
+    )
+    op.drop_index(
+        op.f("ix_ingestion_quarantine_source"), table_name="ingestion_quarantine"
+    )
+    op.drop_table("ingestion_quarantine")
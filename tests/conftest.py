@@ -1,12 +1,19 @@
 # tests/conftest.py
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, create_engine, Session
+from app.core.config import settings
+from app.core.counts import counts
+from app.core.datasets import dataset_versions
 from app.core.database import get_session
+from app.core.response_cache import response_cache
 from app.main import app
 
 DATABASE_URL = "sqlite:///:memory:"
-test_engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+test_engine = create_engine(
+    DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -16,6 +23,22 @@ def create_test_db():
     SQLModel.metadata.drop_all(test_engine)
 
 
+@pytest.fixture(autouse=True)
+def local_storage(tmp_path, monkeypatch):
+    # Keep download, frame and archive files of each test apart
+    monkeypatch.setattr(settings, "DOWNLOAD_CACHE_DIR", str(tmp_path / "downloads"))
+    monkeypatch.setattr(settings, "FRAME_CACHE_DIR", str(tmp_path / "frames"))
+    monkeypatch.setattr(settings, "ARCHIVE_DIR", str(tmp_path / "archive"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    # Tests write rows without ingesting, so nothing cached outlives a test
+    dataset_versions.clear()
+    counts.clear()
+    response_cache.clear()
+
+
 @pytest.fixture(scope="function")
 def db_session():
     with Session(test_engine) as session:
@@ -0,0 +1,32 @@
+from sqlmodel import delete
+
+from app.auth.dependencies import get_current_superuser
+from app.auth.models import User
+from app.ingestion.crud import save_run
+from app.ingestion.models import IngestionRun
+from app.main import app
+
+
+def test_runs_are_listed_most_recent_first(client, db_session):
+    db_session.exec(delete(IngestionRun))
+    db_session.commit()
+    for source in ("production", "exportation", "production"):
+        save_run(db_session, IngestionRun(source=source, rows_inserted=10))
+
+    app.dependency_overrides[get_current_superuser] = lambda: User(
+        email="admin@embrapa.br", hashed_password="x", is_superuser=True
+    )
+    response = client.get("/api/v1/ingestion/runs", params={"per_page": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["total"], body["has_next"]) == (3, True)
+    assert body["data"][0]["id"] > body["data"][1]["id"]
+    assert "fetch_seconds" in body["data"][0]
+
+    response = client.get("/api/v1/ingestion/runs", params={"source": "production"})
+    assert [run["source"] for run in response.json()["data"]] == ["production"] * 2
+
+
+def test_runs_require_a_superuser(client):
+    assert client.get("/api/v1/ingestion/runs").status_code in (401, 403)
@@ -0,0 +1,58 @@
+import pytest
+from sqlmodel import delete
+
+from app.auth.dependencies import get_current_superuser
+from app.auth.models import User
+from app.core.config import settings
+from app.jobs import worker
+from app.jobs.models import IngestionJob
+from app.main import app
+
+
+class RecordingExecutor:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+
+
+@pytest.fixture
+def executor(client, db_session, monkeypatch):
+    db_session.exec(delete(IngestionJob))
+    db_session.commit()
+
+    executor = RecordingExecutor()
+    monkeypatch.setattr(worker, "get_executor", lambda: executor)
+    monkeypatch.setattr(settings, "ALLOW_REINGEST", True)
+    app.dependency_overrides[get_current_superuser] = lambda: User(
+        email="admin@embrapa.br", hashed_password="x", is_superuser=True
+    )
+    return executor
+
+
+def test_reingest_returns_job_at_once(client, executor):
+    response = client.post("/api/v1/production/reingest")
+
+    assert response.status_code == 202
+    job = response.json()
+    assert (job["source"], job["status"]) == ("production", "queued")
+    assert executor.submitted == [(job["id"],)]
+
+    status = client.get(f"/api/v1/jobs/{job['id']}")
+    assert status.status_code == 200
+    assert status.json()["stage"] == "queued"
+
+
+def test_reingest_of_running_domain_is_merged(client, executor):
+    first = client.post("/api/v1/exportation/reingest").json()
+    second = client.post("/api/v1/exportation/reingest").json()
+    other = client.post("/api/v1/importation/reingest").json()
+
+    assert second["id"] == first["id"]
+    assert other["id"] != first["id"]
+    assert len(executor.submitted) == 2
+
+
+def test_unknown_job_returns_404(client, executor):
+    assert client.get("/api/v1/jobs/999999").status_code == 404
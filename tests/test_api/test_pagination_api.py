@@ -0,0 +1,85 @@
+import pytest
+from sqlmodel import delete
+
+from app.auth.dependencies import get_current_active_user
+from app.auth.models import User
+from app.main import app
+from app.production.constants import Category
+from app.production.models import Production
+
+
+@pytest.fixture
+def productions(client, db_session):
+    db_session.exec(delete(Production))
+    for year in (2021, 2022):
+        for product in ("Branco", "Tinto"):
+            for category in (Category.VINHO_DE_MESA, Category.SUCO):
+                db_session.add(
+                    Production(
+                        year=year,
+                        product=product,
+                        category=category,
+                        quantity_liters=1,
+                    )
+                )
+    db_session.commit()
+
+    app.dependency_overrides[get_current_active_user] = lambda: User(
+        email="user@embrapa.br", hashed_password="x"
+    )
+    return client
+
+
+def _walk(client, url, **params):
+    rows, cursor = [], None
+    while True:
+        body = client.get(
+            url, params={**params, "cursor": cursor} if cursor else params
+        )
+        body = body.json()
+        rows += [(row["year"], row["product"], row["id"]) for row in body["data"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return rows, body
+
+
+def test_cursor_pages_match_offset_pages(productions):
+    offset = []
+    for page in (1, 2, 3):
+        body = productions.get(
+            "/api/v1/production/", params={"page": page, "per_page": 3}
+        ).json()
+        offset += [(row["year"], row["product"], row["id"]) for row in body["data"]]
+
+    keyset, last = _walk(productions, "/api/v1/production/", per_page=3)
+
+    assert keyset == offset
+    assert len(keyset) == 8
+    assert [year for year, _, _ in keyset] == [2022] * 4 + [2021] * 4
+    assert (last["page"], last["has_next"], last["has_prev"]) == (None, False, True)
+
+
+def test_cursor_pages_within_a_category(productions):
+    rows, _ = _walk(productions, "/api/v1/production/suco", per_page=1)
+    assert [(year, product) for year, product, _ in rows] == [
+        (2022, "Branco"),
+        (2022, "Tinto"),
+        (2021, "Branco"),
+        (2021, "Tinto"),
+    ]
+
+
+def test_malformed_cursor_is_rejected(productions):
+    response = productions.get("/api/v1/production/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_total_can_be_skipped(productions):
+    body = productions.get(
+        "/api/v1/production/", params={"per_page": 3, "include_total": "false"}
+    ).json()
+    assert (body["total"], body["total_pages"]) == (None, None)
+    assert (len(body["data"]), body["has_next"]) == (3, True)
+
+    body = productions.get("/api/v1/production/", params={"per_page": 3}).json()
+    assert (body["total"], body["total_pages"]) == (8, 3)
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from sqlmodel import delete
+
+from app.auth.dependencies import get_current_active_user
+from app.auth.models import User
+from app.core.datasets import dataset_versions
+from app.ingestion.crud import bump_dataset_version
+from app.main import app
+from app.production.constants import Category
+from app.production.models import Production
+
+
+def _add(session, year):
+    session.add(
+        Production(
+            year=year,
+            product="Tinto",
+            category=Category.VINHO_DE_MESA,
+            quantity_liters=1,
+        )
+    )
+
+
+@pytest.fixture
+def user_client(client, db_session):
+    db_session.exec(delete(Production))
+    _add(db_session, 2021)
+    db_session.commit()
+    app.dependency_overrides[get_current_active_user] = lambda: User(
+        email="user@embrapa.br", hashed_password="x"
+    )
+    return client
+
+
+def test_responses_are_cached_until_the_dataset_changes(user_client, db_session):
+    first = user_client.get("/api/v1/production/vinho-de-mesa")
+    second = user_client.get("/api/v1/production/vinho-de-mesa")
+    other = user_client.get("/api/v1/production/vinho-de-mesa?per_page=5")
+
+    assert [r.headers["X-Cache"] for r in (first, second, other)] == [
+        "MISS",
+        "HIT",
+        "MISS",
+    ]
+    assert second.content == first.content
+    assert first.json()["total"] == 1
+
+    _add(db_session, 2022)
+    bump_dataset_version(db_session, "production")
+    db_session.commit()
+    dataset_versions.invalidate()  # as an ingest in this process does
+
+    third = user_client.get("/api/v1/production/vinho-de-mesa")
+    assert third.headers["X-Cache"] == "MISS"
+    assert third.json()["total"] == 2
+
+    cache = user_client.get("/health").json()["response_cache"]
+    assert (cache["hits"], cache["misses"], cache["entries"]) == (1, 3, 1)
+
+
+def test_matching_etag_returns_not_modified(user_client, db_session):
+    first = user_client.get("/api/v1/production/")
+    tag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    again = user_client.get("/api/v1/production/", headers={"If-None-Match": tag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == tag
+
+    other = user_client.get(
+        "/api/v1/production/?page=2", headers={"If-None-Match": tag}
+    )
+    assert other.status_code == 200
+
+    _add(db_session, 2022)
+    bump_dataset_version(db_session, "production")
+    db_session.commit()
+    dataset_versions.invalidate()
+
+    changed = user_client.get("/api/v1/production/", headers={"If-None-Match": tag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != tag
+    assert changed.json()["total"] == 2
+
+    cache = user_client.get("/health").json()["response_cache"]
+    assert cache["not_modified"] == 1
+
+
+def test_cached_routes_still_require_authentication(client):
+    assert client.get("/api/v1/production/").status_code == 403
+
+
+def test_versions_are_read_off_the_event_loop(user_client, db_session, monkeypatch):
+    on_loop = []
+    version = dataset_versions.version
+
+    def record(session, table):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return version(session, table)
+
+    monkeypatch.setattr(dataset_versions, "version", record)
+    dataset_versions.invalidate()
+
+    assert user_client.get("/api/v1/processing/").status_code == 200
+    assert on_loop and not any(on_loop)
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from sqlmodel import delete, select
+
+from app.core.archive import SourceArchive
+from app.core.frame_cache import FrameCache
+from app.ingestion.models import IngestionState
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+
+
+def _ingestor(tmp_path, **options):
+    ingestor = ProductionIngestor(**options)
+    ingestor.CSV_PATH = str(tmp_path / "Producao.csv")
+    ingestor.archive = SourceArchive(str(tmp_path / "archive"))
+    ingestor.frame_cache = FrameCache(str(tmp_path / "frames"))
+    return ingestor
+
+
+def _write_source(tmp_path, quantity):
+    pd.DataFrame(
+        {
+            "control": ["vm_Tinto", "su_Suco"],
+            "produto": ["Tinto", "Suco"],
+            "2021": [quantity, 300],
+        }
+    ).to_csv(tmp_path / "Producao.csv", sep=";", index=False)
+
+
+def _rows(session):
+    return sorted(
+        (row.product, row.quantity_liters)
+        for row in session.exec(select(Production)).all()
+    )
+
+
+@pytest.fixture
+def empty_tables(db_session):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+
+
+def test_commit_archives_sources_with_a_manifest(db_session, tmp_path, empty_tables):
+    _write_source(tmp_path, 100)
+    ingestor = _ingestor(tmp_path)
+    ingestor.ingest(db_session)
+
+    manifest = ingestor.archive.load_manifest(ingestor.manifest_id)
+    assert manifest.ingestor == "ProductionIngestor"
+    [entry] = manifest.files
+    assert entry.path == ingestor.CSV_PATH
+    with open(ingestor.archive.file(entry.sha256), "rb") as archived:
+        assert archived.read() == (tmp_path / "Producao.csv").read_bytes()
+
+
+def test_replay_rebuilds_a_past_run_from_the_archive(
+    db_session, tmp_path, empty_tables
+):
+    _write_source(tmp_path, 100)
+    first = _ingestor(tmp_path)
+    first.ingest(db_session)
+    expected = _rows(db_session)
+
+    _write_source(tmp_path, 999)
+    _ingestor(tmp_path, replace=True).ingest(db_session)
+    assert _rows(db_session) != expected
+    (tmp_path / "Producao.csv").unlink()  # the replay must not need the source
+
+    manifest = first.archive.load_manifest(first.manifest_id)
+    replay = _ingestor(tmp_path, manifest=manifest)
+    replay.ingest(db_session)
+
+    assert replay.replace
+    assert _rows(db_session) == expected
+
+
+def test_replay_rejects_a_corrupt_archive(db_session, tmp_path, empty_tables):
+    _write_source(tmp_path, 100)
+    first = _ingestor(tmp_path)
+    first.ingest(db_session)
+
+    manifest = first.archive.load_manifest(first.manifest_id)
+    with open(first.archive.file(manifest.files[0].sha256), "a") as archived:
+        archived.write("tampered")
+
+    with pytest.raises(RuntimeError, match="corrupt"):
+        _ingestor(tmp_path, manifest=manifest).ingest(db_session)
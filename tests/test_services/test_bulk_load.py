@@ -0,0 +1,134 @@
+import pandas as pd
+import pytest
+from sqlmodel import delete, select
+
+from app.ingestion.models import IngestionState
+from app.production.constants import Category
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+
+
+def _production_csv():
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "control": ["vm_Tinto", "vm_Branco", "su_Suco"],
+            "produto": ["Tinto", "Branco", "Suco"],
+            "2021": [100, 200, 300],
+            "2022": [110, 210, 310],
+        }
+    )
+
+
+def _stale_frame():
+    return pd.DataFrame(
+        {
+            "produto": ["Rosado"],
+            "category": [Category.VINHO_DE_MESA.value],
+            "ano": [1999],
+            "quantidade_litros": [1],
+        }
+    )
+
+
+def _frames(ingestor):
+    return lambda session, paths: [
+        (paths[0], ingestor.transform(_production_csv(), paths[0]))
+    ]
+
+
+def test_bulk_load_inserts_and_skips(db_session, monkeypatch):
+    db_session.exec(delete(Production))
+    db_session.commit()
+
+    ingestor = ProductionIngestor()
+    monkeypatch.setattr(ingestor, "fetch_frames", _frames(ingestor))
+
+    first = ingestor.ingest(db_session)
+    assert (first.inserted, first.skipped) == (6, 0)
+
+    second = ingestor.ingest(db_session)
+    assert (second.inserted, second.skipped) == (0, 6)
+
+    rows = db_session.exec(select(Production)).all()
+    assert len(rows) == 6
+    assert {row.category for row in rows} == {Category.VINHO_DE_MESA, Category.SUCO}
+
+
+def test_bulk_load_update_overwrites_existing(db_session):
+    db_session.exec(delete(Production))
+    db_session.commit()
+
+    ingestor = ProductionIngestor()
+    ingestor.BATCH_SIZE = 1
+    frame = ingestor._prepare_dataframe(_production_csv())
+    ingestor.bulk_load(db_session, frame)
+
+    frame["quantidade_litros"] = frame["quantidade_litros"] * 2
+    result = ingestor.bulk_load(db_session, frame, update=True)
+    db_session.commit()
+
+    assert result.inserted == len(frame)
+    total = sum(row.quantity_liters for row in db_session.exec(select(Production)))
+    assert total == 2 * (100 + 200 + 300 + 110 + 210 + 310)
+
+
+def test_ingest_streams_file_in_chunks(db_session, tmp_path):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+
+    path = tmp_path / "Producao.csv"
+    _production_csv().to_csv(path, sep=";", index=False)
+    ingestor = ProductionIngestor()
+    ingestor.CSV_PATH = str(path)
+    ingestor.CHUNK_SIZE = 1
+
+    chunks = list(ingestor.fetch_csvs(db_session, [ingestor.CSV_PATH]))
+    ingestor.rollback(db_session)
+    assert [len(chunk) for _, chunk in chunks] == [1, 1, 1]
+
+    result = ingestor.ingest(db_session)
+
+    assert result.inserted == 6
+    assert result.peak_rss_mb > 0
+    assert db_session.get(IngestionState, str(path)).row_count == 6
+
+
+def test_replace_swaps_in_reloaded_rows(db_session, monkeypatch):
+    db_session.exec(delete(Production))
+    db_session.commit()
+    ProductionIngestor().bulk_load(db_session, _stale_frame())
+    db_session.commit()
+
+    ingestor = ProductionIngestor(replace=True)
+    monkeypatch.setattr(ingestor, "fetch_frames", _frames(ingestor))
+    result = ingestor.ingest(db_session)
+
+    rows = db_session.exec(select(Production)).all()
+    assert result.inserted == 6
+    assert sorted((row.product, row.year) for row in rows) == sorted(
+        (product, year)
+        for product in ("Tinto", "Branco", "Suco")
+        for year in (2021, 2022)
+    )
+
+
+def test_failed_replace_keeps_previous_rows(db_session, monkeypatch):
+    db_session.exec(delete(Production))
+    db_session.commit()
+    ProductionIngestor().bulk_load(db_session, _stale_frame())
+    db_session.commit()
+
+    ingestor = ProductionIngestor(replace=True)
+
+    def frames(session, paths):
+        yield paths[0], ingestor.transform(_production_csv(), paths[0])
+        raise RuntimeError("Unable to download CSV")
+
+    monkeypatch.setattr(ingestor, "fetch_frames", frames)
+    with pytest.raises(RuntimeError):
+        ingestor.ingest(db_session)
+
+    rows = db_session.exec(select(Production)).all()
+    assert [(row.product, row.year) for row in rows] == [("Rosado", 1999)]
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, delete, select
+
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+from benchmarks.bench_load import make_frame
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+
+def test_copy_merge_matches_batched_insert():
+    engine = create_engine(POSTGRES_URL)
+    SQLModel.metadata.create_all(engine, tables=[Production.__table__])
+    df = make_frame(500)
+
+    results = {}
+    for use_copy in (False, True):
+        ingestor = ProductionIngestor()
+        ingestor.USE_COPY = use_copy
+        with Session(engine) as session:
+            session.exec(delete(Production))
+            first = ingestor.bulk_load(session, df)
+            second = ingestor.bulk_load(session, df)
+            rows = session.exec(
+                select(Production.year, Production.product, Production.category)
+            ).all()
+            session.rollback()
+
+        assert (first.inserted, second.skipped) == (500, 500)
+        results[use_copy] = sorted(rows)
+
+    assert results[True] == results[False]
+
+
+def test_replace_is_invisible_to_readers_until_commit(monkeypatch):
+    engine = create_engine(POSTGRES_URL)
+    SQLModel.metadata.create_all(engine, tables=[Production.__table__])
+    with Session(engine) as session:
+        session.exec(delete(Production))
+        ProductionIngestor().bulk_load(session, make_frame(100))
+        session.commit()
+
+    ingestor = ProductionIngestor(replace=True)
+    with Session(engine) as session, Session(engine) as reader:
+        ingestor.bulk_load(session, make_frame(300))
+        ingestor._swap_shadow(session)
+        assert len(reader.exec(select(Production.id)).all()) == 100
+
+        session.commit()
+        reader.rollback()
+        assert len(reader.exec(select(Production.id)).all()) == 300
@@ -0,0 +1,71 @@
+from sqlmodel import delete, func, select
+
+from app.core.counts import CountsCache
+from app.core.datasets import DatasetVersions
+from app.ingestion.crud import bump_dataset_version
+from app.production.constants import Category
+from app.production.models import Production
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counter(calls):
+    def count_by_category(session, category):
+        calls.append(category)
+        statement = select(func.count(Production.id)).where(
+            Production.category == category
+        )
+        return session.exec(statement).one()
+
+    return count_by_category
+
+
+def _add(session, year):
+    session.add(
+        Production(
+            year=year,
+            product="Tinto",
+            category=Category.VINHO_DE_MESA,
+            quantity_liters=1,
+        )
+    )
+
+
+def test_counts_are_cached_until_the_dataset_version_changes(db_session):
+    db_session.exec(delete(Production))
+    _add(db_session, 2021)
+    db_session.commit()
+
+    calls, clock = [], Clock()
+    versions = DatasetVersions(ttl=5, clock=clock)
+    cache = CountsCache(versions)
+    count = _counter(calls)
+
+    assert cache.count(db_session, Production, count, Category.VINHO_DE_MESA) == 1
+    assert cache.count(db_session, Production, count, Category.VINHO_DE_MESA) == 1
+    assert cache.count(db_session, Production, count, Category.SUCO) == 0
+    assert calls == [Category.VINHO_DE_MESA, Category.SUCO]
+
+    # An ingest in another process: seen once the versions are read again
+    _add(db_session, 2022)
+    bump_dataset_version(db_session, "production")
+    db_session.commit()
+    assert cache.count(db_session, Production, count, Category.VINHO_DE_MESA) == 1
+
+    clock.now = 6
+    assert cache.count(db_session, Production, count, Category.VINHO_DE_MESA) == 2
+    assert len(calls) == 3
+
+    # An ingest in this process: seen at once
+    _add(db_session, 2023)
+    bump_dataset_version(db_session, "production")
+    db_session.commit()
+    versions.invalidate()
+    assert cache.count(db_session, Production, count, Category.VINHO_DE_MESA) == 3
+    assert len(calls) == 4
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+from app.core.fetcher import FetchedFile
+from app.core.parsing import dedupe_columns
+from benchmarks.synthetic import DOMAINS, generate
+
+SOURCES = [(domain, path) for domain, spec in DOMAINS.items() for path in spec.paths]
+
+
+@pytest.fixture(scope="module")
+def files(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("sources")
+    files = {}
+    for domain in DOMAINS:
+        files.update(generate(domain, 1, str(directory)))
+    return files
+
+
+def _transformed(domain: str, path: str, file: str, engine: str) -> pd.DataFrame:
+    ingestor = DOMAINS[domain].ingestor()
+    ingestor.CSV_ENGINE = engine
+    ingestor.CHUNK_SIZE = 2000  # several chunks per file
+    fetched = FetchedFile(path=path, file=file)
+    chunks = ingestor._parse_chunks(fetched, ingestor.separator(path))
+    frame = pd.concat([ingestor.transform(chunk, path) for chunk in chunks])
+    return frame.reset_index(drop=True)
+
+
+def test_every_source_file_is_covered():
+    assert len(SOURCES) >= 13
+
+
+@pytest.mark.parametrize("domain,path", SOURCES)
+def test_pyarrow_engine_matches_c_engine(files, domain, path):
+    expected = _transformed(domain, path, files[path], "c")
+    actual = _transformed(domain, path, files[path], "pyarrow")
+
+    assert len(expected) > 0
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_dedupe_columns_matches_pandas():
+    columns = ["Id", "2021", "2021", "2021.1", "2021", "2022", "2022"]
+    assert dedupe_columns(columns) == [
+        "Id",
+        "2021",
+        "2021.2",
+        "2021.1",
+        "2021.3",
+        "2022",
+        "2022.1",
+    ]
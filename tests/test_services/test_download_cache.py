@@ -0,0 +1,95 @@
+import functools
+
+import httpx
+import pytest
+from sqlmodel import delete
+
+from app.core import base_ingestor
+from app.core.download_cache import DownloadCache
+from app.core.fetcher import AsyncFetcher
+from app.ingestion.models import IngestionState
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+
+CSV = (
+    b"id;control;produto;2021;2022\n1;vm_Tinto;Tinto;100;110\n2;su_Suco;Suco;300;310\n"
+)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=CSV,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        base_ingestor,
+        "AsyncFetcher",
+        functools.partial(AsyncFetcher, transport=transport, backoff=0),
+    )
+    return requests
+
+
+def _ingestor(tmp_path, **options):
+    ingestor = ProductionIngestor(**options)
+    ingestor.CSV_PATH = "download/MissingProducao.csv"
+    ingestor.download_cache = DownloadCache(str(tmp_path))
+    return ingestor
+
+
+def test_not_modified_sources_are_skipped(db_session, server, tmp_path):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+
+    first = _ingestor(tmp_path).ingest(db_session)
+    second = _ingestor(tmp_path).ingest(db_session)
+
+    assert first.inserted == 4
+    assert (second.inserted, second.skipped) == (0, 0)
+    assert "If-None-Match" not in server[0].headers
+    assert server[1].headers["If-None-Match"] == '"v1"'
+    assert server[1].headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    forced = _ingestor(tmp_path, force=True).ingest(db_session)
+    assert forced.skipped == 4
+    assert "If-None-Match" not in server[2].headers
+
+
+def test_cache_is_only_stored_after_commit(db_session, server, tmp_path, monkeypatch):
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+    ingestor = _ingestor(tmp_path)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("database is down")
+
+    monkeypatch.setattr(ingestor, "bulk_load", fail)
+    with pytest.raises(RuntimeError):
+        ingestor.ingest(db_session)
+
+    assert DownloadCache(str(tmp_path)).get(ingestor.CSV_PATH) is None
+
+
+def test_wiped_database_is_reloaded_despite_the_cache(db_session, server, tmp_path):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+    assert _ingestor(tmp_path).ingest(db_session).inserted == 4
+
+    db_session.exec(delete(Production))
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+    reloaded = _ingestor(tmp_path).ingest(db_session)
+
+    assert reloaded.inserted == 4
+    assert "If-None-Match" not in server[1].headers
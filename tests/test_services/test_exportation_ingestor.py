@@ -0,0 +1,29 @@
+import pandas as pd
+
+from app.exportation.constants import Category
+from app.exportation.ingestor import ExportationIngestor
+
+FIXTURE = "tests/fixtures/ExpVinho.csv"
+GOLDEN = "tests/fixtures/ExpVinho_golden.csv"
+
+
+def test_prepare_dataframe_matches_golden_output():
+    df = pd.read_csv(FIXTURE, sep="\t")
+
+    transformed = ExportationIngestor()._prepare_dataframe(df, Category.VINHO)
+
+    # quantities stay float until bulk_load validates and converts them
+    expected = pd.read_csv(
+        GOLDEN, index_col=0, dtype={"quantity_kg": float, "value": float}
+    )
+    expected["category"] = expected["category"].map(Category)
+    pd.testing.assert_frame_equal(transformed, expected, check_index_type=False)
+
+
+def test_prepare_dataframe_fills_missing_value_columns():
+    df = pd.DataFrame({"Id": [1], "País": ["Chile"], "2020": [5], "2021": [7]})
+
+    transformed = ExportationIngestor()._prepare_dataframe(df, Category.SUCO)
+
+    assert transformed["value"].tolist() == [0, 0]
+    assert transformed["quantity_kg"].tolist() == [5, 7]
@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pandas as pd
+import pytest
+
+from app.core.fetcher import AsyncFetcher, fetch_files
+from app.core.http_client import SharedClient
+from app.importation.ingestor import ImportationIngestor
+
+PATHS = [f"download/Missing{i}.csv" for i in range(6)]
+
+
+def _fetcher(handler, **options):
+    options = {"retries": 2, "backoff": 0, **options}
+    return AsyncFetcher(
+        "http://embrapa.test", transport=httpx.MockTransport(handler), **options
+    )
+
+
+def test_fetch_files_respects_concurrency_limit():
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=request.url.path.encode())
+
+    fetched = list(fetch_files(PATHS, _fetcher(handler, concurrency=2)))
+
+    assert sorted(f.path for f in fetched) == sorted(PATHS)
+    assert peak == 2
+    for f in fetched:
+        f.discard()
+
+
+def test_fetch_files_retries_transient_errors():
+    attempts = {}
+
+    def handler(request):
+        attempts[request.url.path] = attempts.get(request.url.path, 0) + 1
+        if attempts[request.url.path] < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, content=b"ok")
+
+    fetched = list(fetch_files(PATHS[:2], _fetcher(handler)))
+
+    assert [f.content for f in fetched] == [b"ok", b"ok"]
+    assert set(attempts.values()) == {3}
+    for f in fetched:
+        f.discard()
+
+
+def test_fetch_files_spools_downloads_to_temporary_files():
+    body = b"x" * (3 << 20)
+
+    def handler(request):
+        return httpx.Response(200, content=body)
+
+    (fetched,) = fetch_files(PATHS[:1], _fetcher(handler))
+
+    assert fetched.temporary and os.path.getsize(fetched.file) == len(body)
+    assert fetched.sha256 == hashlib.sha256(body).hexdigest()
+    fetched.discard()
+    assert not os.path.exists(fetched.file)
+
+
+def test_fetch_files_gives_up_on_client_errors():
+    def handler(request):
+        return httpx.Response(404)
+
+    with pytest.raises(RuntimeError, match="Unable to download CSV"):
+        list(fetch_files(PATHS[:1], _fetcher(handler)))
+
+
+def test_consecutive_fetches_reuse_pooled_connections():
+    peers = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep connections alive
+
+        def do_GET(self):
+            peers.append(self.client_address)
+            body = gzip.compress(b"ano;valor\n2020;1\n")
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = SharedClient()
+    fetcher = AsyncFetcher(
+        f"http://127.0.0.1:{server.server_port}", concurrency=1, client=client
+    )
+    try:
+        for path in PATHS[:3]:  # one ingest after another
+            (fetched,) = fetch_files([path], fetcher)
+            assert fetched.content == b"ano;valor\n2020;1\n"
+            fetched.discard()
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    assert len(peers) == 3
+    assert len(set(peers)) == 1
+
+
+def test_fetch_csvs_uses_file_separator(db_session, monkeypatch):
+    def handler(request):
+        separator = ";" if "ImpSuco" in request.url.path else "\t"
+        return httpx.Response(
+            200, content=f"País{separator}2020\nChile{separator}1\n".encode()
+        )
+
+    ingestor = ImportationIngestor()
+    monkeypatch.setattr(ingestor, "fetcher", lambda: _fetcher(handler))
+    paths = ["download/MissingImpVinhos.csv", "download/MissingImpSuco.csv"]
+
+    frames = dict(ingestor.fetch_csvs(db_session, paths))
+    ingestor.rollback(db_session)
+
+    for df in frames.values():
+        pd.testing.assert_frame_equal(
+            df, pd.DataFrame({"País": ["Chile"], "2020": [1]})
+        )
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+from sqlmodel import delete, select
+
+from app.core.frame_cache import FrameCache
+from app.ingestion.models import IngestionState
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+
+
+def _ingestor(tmp_path):
+    path = tmp_path / "Producao.csv"
+    pd.DataFrame(
+        {
+            "id": [1, 2],
+            "control": ["vm_Tinto", "su_Suco"],
+            "produto": ["Tinto", "Suco"],
+            "2021": [100, 300],
+            "2022": [110, 310],
+        }
+    ).to_csv(path, sep=";", index=False)
+
+    ingestor = ProductionIngestor(force=True)
+    ingestor.CSV_PATH = str(path)
+    ingestor.CHUNK_SIZE = 5  # one source row per chunk
+    ingestor.frame_cache = FrameCache(str(tmp_path / "frames"))
+    return ingestor
+
+
+def test_frames_round_trip(tmp_path):
+    cache = FrameCache(str(tmp_path))
+    frames = [
+        pd.DataFrame({"product": ["Tinto"], "year": [2021], "quantity": [1.5]}),
+        pd.DataFrame({"product": ["Suco"], "year": [2022], "quantity": [None]}),
+    ]
+
+    writer = cache.writer("key")
+    for frame in frames:
+        writer.write(frame)
+    assert not cache.has("key")  # nothing is published before commit
+    writer.commit()
+
+    for cached, frame in zip(cache.read("key"), frames, strict=True):
+        pd.testing.assert_frame_equal(cached, frame)
+
+
+def test_reingest_reads_transformed_frames_from_cache(
+    db_session, tmp_path, monkeypatch
+):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+
+    first = _ingestor(tmp_path)
+    expected = list(first.fetch_frames(db_session, [first.CSV_PATH]))
+    first.rollback(db_session)
+    assert len(expected) == 2
+
+    second = _ingestor(tmp_path)
+    monkeypatch.setattr(second, "_parse_chunks", pytest.fail)
+    monkeypatch.setattr(second, "transform", pytest.fail)
+    cached = list(second.fetch_frames(db_session, [second.CSV_PATH]))
+    second.rollback(db_session)
+
+    assert [path for path, _ in cached] == [second.CSV_PATH] * 2
+    for (_, frame), (_, original) in zip(cached, expected, strict=True):
+        pd.testing.assert_frame_equal(frame, original.reset_index(drop=True))
+
+    result = _ingestor(tmp_path).ingest(db_session)
+    assert result.inserted == 4
+    assert len(db_session.exec(select(Production)).all()) == 4
+
+
+def test_transform_version_invalidates_cached_frames(db_session, tmp_path):
+    ingestor = _ingestor(tmp_path)
+    list(ingestor.fetch_frames(db_session, [ingestor.CSV_PATH]))
+    ingestor.rollback(db_session)
+
+    calls = []
+    changed = _ingestor(tmp_path)
+    changed.TRANSFORM_VERSION += 1
+    transform = changed.transform
+    changed.transform = lambda df, path: calls.append(path) or transform(df, path)
+    list(changed.fetch_frames(db_session, [changed.CSV_PATH]))
+    changed.rollback(db_session)
+
+    assert len(calls) == 2
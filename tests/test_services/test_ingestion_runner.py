@@ -0,0 +1,128 @@
+import pandas as pd
+import pytest
+from sqlmodel import delete, select
+from typer.testing import CliRunner
+
+from app.cli import ingest
+from app.core.base_ingestor import IngestionMetrics, LoadResult
+from app.ingestion import runner
+from app.ingestion.models import IngestionRun
+from app.production.ingestor import ProductionIngestor
+
+
+class FakeIngestor:
+    def __init__(self, force=False, replace=False, manifest=None):
+        self.force = force
+        self.metrics = IngestionMetrics()
+        self.manifest_id = None
+
+    def ingest(self, session):
+        return LoadResult(inserted=5, skipped=1)
+
+
+class BrokenIngestor(FakeIngestor):
+    def ingest(self, session):
+        raise RuntimeError("Unable to download CSV")
+
+
+@pytest.fixture
+def ingestors(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        runner,
+        "INGESTORS",
+        {"production": FakeIngestor, "processing": FakeIngestor},
+    )
+    monkeypatch.setattr(runner.settings, "DATABASE_URL", f"sqlite:///{tmp_path}/db")
+    return runner.INGESTORS
+
+
+def test_parse_sources():
+    assert runner.parse_sources("all") == list(runner.INGESTORS)
+    assert runner.parse_sources("exportation, production,exportation") == [
+        "exportation",
+        "production",
+    ]
+    with pytest.raises(ValueError, match="Unsupported source: wine"):
+        runner.parse_sources("production,wine")
+
+
+def test_run_ingestors_reports_every_domain(ingestors):
+    ingestors["processing"] = BrokenIngestor
+
+    reports = runner.run_ingestors(["production", "processing"])
+
+    assert [report.source for report in reports] == ["production", "processing"]
+    assert (reports[0].rows, reports[0].error) == (6, None)
+    assert "Unable to download CSV" in reports[1].error
+
+
+def test_run_ingestors_runs_sqlite_domains_in_turn(ingestors, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("SQLite ingests must not run concurrently")
+
+    monkeypatch.setattr(runner, "ProcessPoolExecutor", no_pool)
+
+    reports = runner.run_ingestors(["production", "processing"])
+
+    assert [(report.source, report.error) for report in reports] == [
+        ("production", None),
+        ("processing", None),
+    ]
+
+
+def test_cli_exits_non_zero_when_a_domain_fails(ingestors):
+    result = CliRunner().invoke(ingest.app, ["run", "all"])
+    assert result.exit_code == 0
+    assert "production" in result.output and "rows/sec" in result.output
+
+    ingestors["production"] = BrokenIngestor
+    result = CliRunner().invoke(ingest.app, ["run", "production"])
+    assert result.exit_code == 1
+
+
+def _production_csv():
+    return pd.DataFrame(
+        {
+            "control": ["vm_Tinto", "su_Suco"],
+            "produto": ["Tinto", "Suco"],
+            "2021": [100, 300],
+        }
+    )
+
+
+def test_ingest_recorded_saves_stage_timings(db_session, tmp_path):
+    db_session.exec(delete(IngestionRun))
+    db_session.commit()
+
+    path = tmp_path / "Producao.csv"
+    _production_csv().to_csv(path, sep=";", index=False)
+    ingestor = ProductionIngestor(force=True)
+    ingestor.CSV_PATH = str(path)
+
+    result = runner.ingest_recorded(db_session, "production", ingestor)
+
+    run = db_session.exec(select(IngestionRun)).one()
+    assert (run.source, run.error, run.files_loaded) == ("production", None, 1)
+    assert (run.rows_inserted + run.rows_skipped) == result.inserted + result.skipped
+    assert run.rows_per_second > 0 and run.peak_rss_mb > 0
+    for stage in ("fetch", "parse", "transform", "load", "commit"):
+        assert getattr(run, f"{stage}_seconds") > 0
+
+
+def test_ingest_recorded_saves_failed_runs(db_session, monkeypatch):
+    db_session.exec(delete(IngestionRun))
+    db_session.commit()
+
+    ingestor = ProductionIngestor()
+
+    def frames(session, paths):
+        yield paths[0], ingestor.transform(_production_csv(), paths[0])
+        raise RuntimeError("Unable to download CSV")
+
+    monkeypatch.setattr(ingestor, "fetch_frames", frames)
+    with pytest.raises(RuntimeError):
+        runner.ingest_recorded(db_session, "production", ingestor)
+
+    run = db_session.exec(select(IngestionRun)).one()
+    assert "Unable to download CSV" in run.error
+    assert run.rows_inserted == 0 and run.load_seconds > 0
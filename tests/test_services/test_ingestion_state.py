@@ -0,0 +1,98 @@
+import functools
+
+import httpx
+import pytest
+from sqlmodel import delete, select
+
+from app.core import base_ingestor
+from app.core.download_cache import DownloadCache
+from app.core.fetcher import AsyncFetcher
+from app.ingestion.crud import get_dataset_versions, get_ingestion_state
+from app.ingestion.models import IngestionState
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+
+CSV_PATH = "download/MissingProducao.csv"
+
+
+@pytest.fixture
+def source(monkeypatch):
+    """Serve a mutable CSV body without any HTTP validators."""
+    body = {"csv": b"id;control;produto;2021\n1;vm_Tinto;Tinto;100\n"}
+
+    def handler(request):
+        return httpx.Response(200, content=body["csv"])
+
+    monkeypatch.setattr(
+        base_ingestor,
+        "AsyncFetcher",
+        functools.partial(AsyncFetcher, transport=httpx.MockTransport(handler)),
+    )
+    return body
+
+
+@pytest.fixture
+def clean_db(db_session):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(IngestionState))
+    db_session.commit()
+
+
+def _ingest(db_session, tmp_path, **options):
+    ingestor = ProductionIngestor(**options)
+    ingestor.CSV_PATH = CSV_PATH
+    ingestor.download_cache = DownloadCache(str(tmp_path))
+    return ingestor.ingest(db_session)
+
+
+def test_unchanged_source_is_skipped(db_session, clean_db, source, tmp_path):
+    first = _ingest(db_session, tmp_path)
+    second = _ingest(db_session, tmp_path)
+
+    assert first.inserted == 1
+    assert (second.inserted, second.skipped) == (0, 0)
+
+    state = get_ingestion_state(db_session, CSV_PATH)
+    assert state.row_count == 1
+    assert len(state.sha256) == 64
+
+
+def test_changed_or_forced_source_is_loaded(db_session, clean_db, source, tmp_path):
+    _ingest(db_session, tmp_path)
+
+    forced = _ingest(db_session, tmp_path, force=True)
+    assert forced.skipped == 1
+
+    source["csv"] += b"2;su_Suco;Suco;300\n"
+    changed = _ingest(db_session, tmp_path)
+    assert (changed.inserted, changed.skipped) == (1, 1)
+    assert get_ingestion_state(db_session, CSV_PATH).row_count == 2
+
+
+def test_dataset_version_changes_only_with_the_rows(
+    db_session, clean_db, source, tmp_path
+):
+    versions = [get_dataset_versions(db_session).get("production", 0)]
+    _ingest(db_session, tmp_path)
+    versions.append(get_dataset_versions(db_session)["production"])
+    _ingest(db_session, tmp_path, force=True)  # every row already loaded
+    versions.append(get_dataset_versions(db_session)["production"])
+    source["csv"] += b"2;su_Suco;Suco;300\n"
+    _ingest(db_session, tmp_path)
+    versions.append(get_dataset_versions(db_session)["production"])
+
+    start = versions[0]
+    assert versions == [start, start + 1, start + 1, start + 2]
+
+
+def test_revised_values_reach_the_table(db_session, clean_db, source, tmp_path):
+    _ingest(db_session, tmp_path)
+    versions = [get_dataset_versions(db_session)["production"]]
+
+    source["csv"] = b"id;control;produto;2021\n1;vm_Tinto;Tinto;150\n"
+    revised = _ingest(db_session, tmp_path)
+    versions.append(get_dataset_versions(db_session)["production"])
+
+    assert (revised.inserted, revised.skipped) == (1, 0)
+    assert db_session.exec(select(Production.quantity_liters)).all() == [150]
+    assert versions[1] == versions[0] + 1
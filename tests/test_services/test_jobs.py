@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel, delete
+
+from app.core.base_ingestor import LoadResult
+from app.jobs import worker
+from app.jobs.crud import create_job, get_job, update_job
+from app.ingestion.models import IngestionRun
+from app.jobs.models import IngestionJob, JobStatus
+
+
+class FakeIngestor:
+    created = []
+
+    def __init__(self, force=False, progress=None, replace=False):
+        self.progress = progress
+        self.created.append({"force": force, "replace": replace})
+
+    def ingest(self, session):
+        self.progress("loading", 500)
+        self.progress("committing", 1000)
+        return LoadResult(inserted=1000)
+
+
+class BrokenIngestor(FakeIngestor):
+    def ingest(self, session):
+        self.progress("loading", 10)
+        raise RuntimeError("Unable to download CSV")
+
+
+class LockingIngestor(FakeIngestor):
+    """Hold the SQLite write lock in the ingest transaction, like a load."""
+
+    fail = False
+
+    def ingest(self, session):
+        session.add(IngestionRun(source="production"))
+        session.flush()
+        self.progress("loading", 500)
+        self.progress("committing", 1000)
+        if self.fail:
+            session.rollback()
+            raise RuntimeError("Unable to download CSV")
+        session.commit()
+        return LoadResult(inserted=1000)
+
+
+@pytest.fixture
+def jobs(db_session, monkeypatch):
+    db_session.exec(delete(IngestionJob))
+    db_session.commit()
+    FakeIngestor.created.clear()
+    monkeypatch.setattr(worker, "INGESTORS", {"production": FakeIngestor})
+    return FakeIngestor.created
+
+
+def test_create_job_merges_into_active_job(db_session, jobs):
+    job, created = create_job(db_session, "production")
+    again, created_again = create_job(db_session, "production")
+
+    assert created and not created_again
+    assert again.id == job.id
+
+
+def test_create_job_replaces_stale_job(db_session, jobs):
+    job, _ = create_job(db_session, "production")
+    job.updated_at = datetime.now(timezone.utc) - timedelta(days=1)
+    db_session.add(job)
+    db_session.commit()
+
+    replacement, created = create_job(db_session, "production")
+
+    assert created and replacement.id != job.id
+    assert get_job(db_session, job.id).status == JobStatus.FAILED
+
+
+def test_run_job_records_progress(db_session, jobs):
+    job, _ = create_job(db_session, "production")
+
+    worker.run_job(job.id, engine=db_session.get_bind())
+
+    db_session.refresh(job)
+    assert jobs == [{"force": False, "replace": True}]
+    assert (job.status, job.stage, job.rows_processed) == (
+        JobStatus.SUCCEEDED,
+        "done",
+        1000,
+    )
+    assert job.active_source is None and job.elapsed_seconds >= 0
+    assert create_job(db_session, "production")[1]
+
+
+def test_run_job_records_failure(db_session, jobs, monkeypatch):
+    monkeypatch.setattr(worker, "INGESTORS", {"production": BrokenIngestor})
+    job, _ = create_job(db_session, "production")
+
+    worker.run_job(job.id, engine=db_session.get_bind())
+
+    db_session.refresh(job)
+    assert job.status == JobStatus.FAILED
+    assert job.rows_processed == 10
+    assert "Unable to download CSV" in job.error
+    assert job.active_source is None
+
+
+def test_update_job_refreshes_heartbeat(db_session, jobs):
+    job, _ = create_job(db_session, "production")
+    before = job.updated_at
+
+    update_job(db_session, job, stage="fetching")
+
+    assert job.updated_at > before
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_run_job_survives_locked_progress_writes_on_sqlite(tmp_path, monkeypatch, fail):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/jobs.db", connect_args={"timeout": 0.1}
+    )
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(LockingIngestor, "fail", fail)
+    monkeypatch.setattr(worker, "INGESTORS", {"production": LockingIngestor})
+    with Session(engine) as session:
+        job, _ = create_job(session, "production")
+
+    status = worker.run_job(job.id, engine=engine)
+
+    with Session(engine) as session:
+        job = get_job(session, job.id)
+        assert status == job.status
+        assert job.status == (JobStatus.FAILED if fail else JobStatus.SUCCEEDED)
+        assert job.active_source is None
+        assert create_job(session, "production")[1]
+    engine.dispose()
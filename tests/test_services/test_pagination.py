@@ -0,0 +1,75 @@
+import pytest
+from sqlmodel import delete
+
+from app.core.pagination import encode_cursor
+from app.processing import crud as processing
+from app.processing.constants import Category, Subcategory
+from app.processing.models import Processing
+from app.production import crud as production
+from app.production.constants import Category as ProductionCategory
+from app.production.models import Production
+
+
+@pytest.fixture
+def rows(db_session):
+    db_session.exec(delete(Processing))
+    db_session.exec(delete(Production))
+    for year in (2020, 2021, 2022):
+        for cultivate in ("Bordo", "Isabel", "Niagara"):
+            for subcategory in (Subcategory.TINTAS, Subcategory.BRANCAS):
+                db_session.add(
+                    Processing(
+                        year=year,
+                        cultivate=cultivate,
+                        quantity_kg=1,
+                        category=Category.AMERICANAS,
+                        subcategory=subcategory,
+                    )
+                )
+    db_session.commit()
+
+
+@pytest.mark.parametrize("offset", [None, 4, 17, 18, 40])
+def test_page_with_total_matches_page_and_count(db_session, rows, offset):
+    page, total = processing.list_processing_with_total(db_session, 5, offset)
+
+    assert page == processing.list_processing(db_session, 5, offset)
+    assert total == processing.count_processing(db_session) == 18
+
+
+def test_total_ignores_the_cursor(db_session, rows):
+    first = processing.list_processing_by_category(
+        db_session, Category.AMERICANAS, Subcategory.TINTAS, 4
+    )
+    cursor = encode_cursor(first[-1], processing.ORDER_BY)
+
+    page, total = processing.list_processing_by_category_with_total(
+        db_session, Category.AMERICANAS, Subcategory.TINTAS, 4, cursor=cursor
+    )
+
+    assert page == processing.list_processing_by_category(
+        db_session, Category.AMERICANAS, Subcategory.TINTAS, 4, cursor=cursor
+    )
+    assert len(page) == 4
+    assert total == 9
+    assert total == processing.count_processing_by_category(
+        db_session, Category.AMERICANAS, Subcategory.TINTAS
+    )
+
+    last = encode_cursor(page[-1], processing.ORDER_BY)
+    rest, total = processing.list_processing_by_category_with_total(
+        db_session, Category.AMERICANAS, Subcategory.TINTAS, 4, cursor=last
+    )
+    assert (len(rest), total) == (1, 9)
+
+
+def test_total_of_an_empty_listing(db_session, rows):
+    page, total = production.list_productions_by_category_with_total(
+        db_session, ProductionCategory.SUCO, 10
+    )
+
+    assert (page, total) == ([], 0)
+    assert (
+        production.count_productions_by_category(db_session, ProductionCategory.SUCO)
+        == 0
+    )
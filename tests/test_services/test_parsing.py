@@ -0,0 +1,55 @@
+from io import StringIO
+
+import pandas as pd
+import pytest
+
+from app.core.parsing import READ_CSV_OPTIONS, classify_prefix, to_number
+from app.processing.constants import Subcategory
+
+
+def test_to_number_maps_sentinels_and_decimal_commas():
+    values = pd.Series(["1,5", "ND", "+", "*", "10", 7], dtype=object)
+
+    numbers = to_number(values, {"nd", "+", "*"})
+
+    assert numbers.tolist() == [1.5, 0.0, 0.0, 0.0, 10.0, 7.0]
+
+
+def test_to_number_keeps_numeric_columns_and_missing_values():
+    values = pd.Series([1.5, None, 3])
+
+    numbers = to_number(values, {"nd"})
+
+    assert numbers.iloc[[0, 2]].tolist() == [1.5, 3.0]
+    assert numbers.isna().tolist() == [False, True, False]
+
+
+def test_to_number_invalid_text_raises_or_coerces():
+    values = pd.Series(["1", "abc"])
+
+    with pytest.raises(ValueError):
+        to_number(values)
+    assert to_number(values, errors="coerce").isna().tolist() == [False, True]
+
+
+def test_read_csv_options_parse_decimal_commas():
+    df = pd.read_csv(
+        StringIO("ano;valor\n2020;1,5\n2021;nd\n"), sep=";", **READ_CSV_OPTIONS
+    )
+
+    assert to_number(df["valor"], {"nd"}).tolist() == [1.5, 0.0]
+
+
+def test_classify_prefix_uses_first_matching_prefix():
+    values = pd.Series(["ti_Bordo", "br_Niagara", "TINTAS", "ti_br_X"])
+    prefixes = {"ti_": Subcategory.TINTAS, "br_": Subcategory.BRANCAS}
+
+    labels = classify_prefix(values, prefixes, default=Subcategory.NONE)
+
+    assert labels.tolist() == ["tintas", "brancas", "none", "tintas"]
+
+
+def test_classify_prefix_without_prefixes_returns_default():
+    labels = classify_prefix(pd.Series(["a", "b"]), {}, default=Subcategory.NONE)
+
+    assert labels.tolist() == ["none", "none"]
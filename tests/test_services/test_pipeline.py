@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from app.core.pipeline import Pipeline
+
+
+def _slow(items, seconds, log=None):
+    for item in items:
+        time.sleep(seconds)
+        if log is not None:
+            log.append(item)
+        yield item
+
+
+def test_stages_overlap():
+    pipeline = Pipeline("fetch", _slow(range(5), 0.05)).stage(
+        "transform", lambda item: _slow([item * 10], 0.05)
+    )
+
+    started = time.perf_counter()
+    results = []
+    for item in pipeline.run("load"):
+        time.sleep(0.05)
+        results.append(item)
+    elapsed = time.perf_counter() - started
+
+    assert results == [0, 10, 20, 30, 40]
+    assert elapsed < 0.6  # 0.75s if the three stages ran one after another
+
+
+def test_utilization_points_at_the_bottleneck():
+    pipeline = Pipeline("fetch", _slow(range(4), 0.01)).stage(
+        "transform", lambda item: _slow([item], 0.08)
+    )
+    assert len(list(pipeline.run("load"))) == 4
+
+    utilization = pipeline.utilization()
+    assert list(utilization) == ["fetch", "transform", "load"]
+    assert max(utilization, key=utilization.get) == "transform"
+    assert utilization["transform"] > 0.8
+    assert "transform" in pipeline.summary()
+
+
+def test_queues_bound_how_far_stages_run_ahead():
+    produced = []
+    pipeline = Pipeline("fetch", _slow(range(100), 0, produced), maxsize=2)
+
+    items = pipeline.run("load")
+    next(items)
+    time.sleep(0.1)
+
+    # the consumed item, two queued and one blocked on the full queue
+    assert len(produced) <= 4
+    items.close()
+
+
+def test_stage_errors_reach_the_consumer():
+    def transform(item):
+        if item == 2:
+            raise ValueError("Missing required columns in CSV")
+        yield item
+
+    pipeline = Pipeline("fetch", iter(range(5))).stage("transform", transform)
+
+    with pytest.raises(ValueError, match="Missing required columns"):
+        list(pipeline.run("load"))
+
+
+def test_stopping_early_stops_every_stage():
+    closed = threading.Event()
+
+    def source():
+        try:
+            yield from range(1000)
+        finally:
+            closed.set()
+
+    pipeline = Pipeline("fetch", source()).stage("transform", lambda item: [item])
+    for item in pipeline.run("load"):
+        if item == 3:
+            break
+
+    assert closed.is_set()
+    assert not [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
@@ -0,0 +1,51 @@
+from app.core.response_cache import ResponseCache, etag, etag_matches
+
+
+def _key(table, version, page):
+    return (table, version, "/api/v1/x/", (), (("page", str(page)),))
+
+
+def test_least_recently_used_bodies_are_evicted():
+    cache = ResponseCache(max_bytes=10)
+    cache.get(_key("production", 1, 1))
+    cache.put(_key("production", 1, 1), b"aaaa")
+    cache.put(_key("production", 1, 2), b"bbbb")
+    assert cache.get(_key("production", 1, 1)) == b"aaaa"  # now most recent
+
+    cache.put(_key("production", 1, 3), b"cccc")
+
+    assert cache.get(_key("production", 1, 2)) is None
+    assert cache.get(_key("production", 1, 1)) == b"aaaa"
+    assert cache.get(_key("production", 1, 3)) == b"cccc"
+    assert cache.stats() == {
+        "hits": 3,
+        "misses": 2,
+        "not_modified": 0,
+        "entries": 2,
+        "bytes": 8,
+    }
+
+
+def test_new_version_drops_the_table_entries():
+    cache = ResponseCache(max_bytes=100)
+    cache.get(_key("production", 1, 1))
+    cache.put(_key("production", 1, 1), b"old")
+    cache.get(_key("exportation", 1, 1))
+    cache.put(_key("exportation", 1, 1), b"other")
+
+    assert cache.get(_key("production", 2, 1)) is None
+    cache.put(_key("production", 1, 2), b"stale")  # built before the bump
+
+    assert cache.stats()["entries"] == 1
+    assert cache.get(_key("exportation", 1, 1)) == b"other"
+
+
+def test_etag_matching():
+    tag = etag(_key("production", 1, 1))
+
+    assert tag != etag(_key("production", 2, 1))
+    assert etag_matches(tag, tag)
+    assert etag_matches(f'"other", W/{tag}', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('"other"', tag)
+    assert not etag_matches(None, tag)
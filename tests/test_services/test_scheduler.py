@@ -0,0 +1,139 @@
+import random
+
+import pytest
+from sqlmodel import delete
+
+from app.core.config import settings
+from app.ingestion import scheduler as scheduler_module
+from app.ingestion.scheduler import (
+    Schedule,
+    Scheduler,
+    SchedulerLocked,
+    instance_lock,
+    parse_intervals,
+    refresh_source,
+)
+from app.jobs.crud import create_job, get_job
+from app.jobs.models import IngestionJob, JobStatus
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(refresh, *schedules, jitter=0.0):
+    clock = FakeClock()
+    scheduler = Scheduler(
+        list(schedules),
+        refresh,
+        jitter=jitter,
+        backoff=60,
+        backoff_max=300,
+        clock=clock,
+        rng=random.Random(0),
+    )
+    return scheduler, clock
+
+
+def test_parse_intervals():
+    assert parse_intervals("") == {}
+    assert parse_intervals("production=3600, exportation=60.5") == {
+        "production": 3600.0,
+        "exportation": 60.5,
+    }
+    with pytest.raises(ValueError, match="Unsupported source"):
+        parse_intervals("wine=3600")
+    with pytest.raises(ValueError, match="Invalid interval"):
+        parse_intervals("production=hourly")
+
+
+def test_domains_refresh_on_their_own_interval():
+    calls = []
+    scheduler, clock = _scheduler(
+        lambda source: calls.append(source) or True,
+        Schedule("production", 100),
+        Schedule("exportation", 250),
+    )
+
+    scheduler.run_pending()  # every domain is due at start
+    assert calls == ["production", "exportation"]
+
+    for now in (1099, 1100, 1200, 1250, 1300):
+        clock.now = now
+        scheduler.run_pending()
+    assert calls == ["production", "exportation"] + ["production"] * 2 + [
+        "exportation",
+        "production",
+    ]
+
+
+def test_failed_refresh_backs_off_exponentially_up_to_cap():
+    outcomes = iter([False, False, False, False, True])
+
+    def refresh(source):
+        if not next(outcomes):
+            raise RuntimeError("Unable to download CSV")
+        return True
+
+    schedule = Schedule("production", 3600)
+    scheduler, clock = _scheduler(refresh, schedule)
+
+    delays = []
+    for _ in range(5):
+        scheduler.run_pending()
+        delays.append(schedule.next_run - clock.now)
+        clock.now = schedule.next_run
+
+    assert delays == [60, 120, 240, 300, 3600]
+    assert schedule.failures == 0
+
+
+def test_jitter_spreads_delays_within_bounds():
+    schedule = Schedule("production", 1000)
+    scheduler, clock = _scheduler(lambda source: True, schedule, jitter=0.1)
+
+    delays = set()
+    for _ in range(50):
+        scheduler.run_pending()
+        delays.add(schedule.next_run - clock.now)
+        clock.now = schedule.next_run
+
+    assert all(900 <= delay <= 1100 for delay in delays)
+    assert len(delays) > 1
+
+
+def test_refresh_source_runs_an_incremental_job(db_session, monkeypatch):
+    db_session.exec(delete(IngestionJob))
+    db_session.commit()
+    calls = []
+
+    def run_job(job_id, engine, replace):
+        calls.append(replace)
+        return JobStatus.SUCCEEDED
+
+    monkeypatch.setattr(scheduler_module, "run_job", run_job)
+    assert refresh_source(db_session.get_bind(), "production")
+    assert calls == [False]
+
+    # A domain with an active job is left to it
+    job, _ = create_job(db_session, "exportation")
+    assert refresh_source(db_session.get_bind(), "exportation")
+    assert calls == [False]
+    assert get_job(db_session, job.id).status == JobStatus.QUEUED
+
+
+def test_second_instance_is_rejected(db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULER_LOCK_FILE", str(tmp_path / "lock"))
+    engine = db_session.get_bind()
+
+    with instance_lock(engine):
+        with pytest.raises(SchedulerLocked):
+            with instance_lock(engine):
+                pass
+
+    with instance_lock(engine):  # released on exit
+        pass
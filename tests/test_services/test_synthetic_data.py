@@ -0,0 +1,29 @@
+import filecmp
+
+import pytest
+
+from app.core.fetcher import FetchedFile
+from benchmarks.synthetic import DOMAINS, generate
+
+
+def test_generator_is_deterministic(tmp_path):
+    first = generate("exportation", 1, str(tmp_path / "a"))
+    second = generate("exportation", 1, str(tmp_path / "b"))
+
+    for path in first:
+        assert filecmp.cmp(first[path], second[path], shallow=False)
+
+
+@pytest.mark.parametrize("domain", list(DOMAINS))
+def test_generated_files_go_through_the_ingestor(domain, tmp_path):
+    spec = DOMAINS[domain]
+    ingestor = spec.ingestor()
+
+    for path, file in generate(domain, 1, str(tmp_path)).items():
+        df = ingestor._parse_csv(
+            FetchedFile(path=path, file=file), ingestor.separator(path)
+        )
+        transformed = ingestor.transform(df, path)
+
+        assert len(transformed) > spec.rows
+        assert transformed.notna().all().all()
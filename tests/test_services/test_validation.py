@@ -0,0 +1,130 @@
+import json
+
+import pandas as pd
+from sqlmodel import delete, select
+
+from app.core.validation import FrameValidator
+from app.exportation.models import ExportationCreate
+from app.ingestion.models import QuarantinedRow
+from app.processing.constants import Category, Subcategory
+from app.processing.ingestor import ProcessingIngestor
+from app.processing.models import Processing, ProcessingCreate
+from app.production.ingestor import ProductionIngestor
+from app.production.models import Production
+
+
+def test_validator_converts_valid_rows():
+    df = pd.DataFrame(
+        {
+            "year": ["2020", 2021.0],
+            "cultivate": ["Bordo", "Isabel"],
+            "quantity_kg": [10, "20"],
+            "category": ["vinifera", Category.MESA],
+            "subcategory": ["tintas", "brancas"],
+        }
+    )
+
+    valid, invalid = FrameValidator(ProcessingCreate).validate(df)
+
+    assert invalid.empty
+    assert valid["year"].tolist() == [2020, 2021]
+    assert valid["quantity_kg"].dtype == "int64"
+    assert valid["category"].tolist() == [Category.VINIFERA, Category.MESA]
+    assert valid["subcategory"].tolist() == [Subcategory.TINTAS, Subcategory.BRANCAS]
+
+
+def test_validator_reports_first_failed_check_per_row():
+    df = pd.DataFrame(
+        {
+            "year": [2020, "nd", 2020.5, 1850, 2020, 2020, 2020],
+            "country": ["Chile", "Chile", "Chile", "Chile", 7, None, "Chile"],
+            "quantity_kg": [1, 1, 1, 1, 1, 1, -5],
+            "value": [1, None, 1, 1, 1, 1, 1],
+            "category": ["vinho", "vinho", "vinho", "vinho", "vinho", "vinho", "cha"],
+        }
+    )
+    ranges = {"year": (1900, 2100), "quantity_kg": (0, None)}
+
+    valid, invalid = FrameValidator(ExportationCreate, ranges).validate(df)
+
+    assert valid.index.tolist() == [0]
+    assert invalid["reason"].tolist() == [
+        "year: not a number",
+        "year: not an integer",
+        "year: less than 1900",
+        "country: not a string",
+        "country: missing value",
+        "quantity_kg: less than 0",
+    ]
+    assert invalid["year"].tolist() == ["nd", 2020.5, 1850, 2020, 2020, 2020]
+
+
+def test_bulk_load_quarantines_invalid_rows(db_session):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(QuarantinedRow))
+    db_session.commit()
+    df = pd.DataFrame(
+        {
+            "produto": ["Tinto", "Branco", "Suco"],
+            "category": ["vinho-de-mesa", "vinho-de-mesa", "refrigerante"],
+            "ano": [2021, 2021, 2021],
+            "quantidade_litros": [100, -1, 300],
+        }
+    )
+
+    result = ProductionIngestor().bulk_load(db_session, df, source="Producao.csv")
+    db_session.commit()
+
+    assert (result.inserted, result.errors) == (1, 2)
+    assert [row.product for row in db_session.exec(select(Production))] == ["Tinto"]
+
+    quarantined = db_session.exec(select(QuarantinedRow)).all()
+    assert {row.reason for row in quarantined} == {
+        "quantity_liters: less than 0",
+        "category: not a valid Category",
+    }
+    assert {row.table_name for row in quarantined} == {"production"}
+    assert {row.source for row in quarantined} == {"Producao.csv"}
+    assert json.loads(quarantined[0].data)["product"] == "Branco"
+
+
+def test_unparseable_source_cells_are_quarantined(db_session):
+    db_session.exec(delete(Production))
+    db_session.exec(delete(Processing))
+    db_session.exec(delete(QuarantinedRow))
+    db_session.commit()
+    production = ProductionIngestor()
+    processing = ProcessingIngestor()
+    path = "download/ProcessaAmericanas.csv"
+
+    produced = production.transform(
+        pd.DataFrame(
+            {
+                "control": ["vm_Tinto", "vm_Branco"],
+                "produto": ["Tinto", "Branco"],
+                "2021": ["100", "-"],
+            }
+        ),
+        "download/Producao.csv",
+    )
+    processed = processing.transform(
+        pd.DataFrame(
+            {
+                "control": ["ti_Bordo", "ti_Isabel"],
+                "cultivar": ["Bordo", "Isabel"],
+                "2021": ["abc", "20"],
+            }
+        ),
+        path,
+    )
+    results = [
+        production.bulk_load(db_session, produced, source="download/Producao.csv"),
+        processing.bulk_load(db_session, processed, source=path),
+    ]
+    db_session.commit()
+
+    assert [(r.inserted, r.errors) for r in results] == [(1, 1), (1, 1)]
+    assert [row.product for row in db_session.exec(select(Production))] == ["Tinto"]
+    assert [row.cultivate for row in db_session.exec(select(Processing))] == ["Isabel"]
+    quarantined = db_session.exec(select(QuarantinedRow)).all()
+    assert {row.table_name for row in quarantined} == {"production", "processing"}